@@ -7,6 +7,8 @@ Version format: MAJOR.MINOR.PATCH
 - MINOR: New features, backward compatible
 - PATCH: Bug fixes, backward compatible
 """
+from functools import lru_cache
+
 __version__ = "1.0.5"
 __version_info__ = (1, 0, 5)
 
@@ -101,6 +103,18 @@ VERSION_HISTORY = {
     },
 }
 
+def _version_key(version: str) -> tuple[int, ...]:
+    """Numeric sort key for a MAJOR.MINOR.PATCH string (so 1.0.10 sorts after 1.0.9)."""
+    return tuple(int(part) for part in version.split("."))
+
+
+# (version, info) pairs, newest first; sorted once at import for pages that
+# render the history on every rerun
+VERSION_HISTORY_SORTED = sorted(
+    VERSION_HISTORY.items(), key=lambda item: _version_key(item[0]), reverse=True
+)
+
+
 def get_version():
     """Get current version string."""
     return __version__
@@ -113,3 +127,10 @@ def get_version_history():
     """Get version history."""
     return VERSION_HISTORY
 
+@lru_cache(maxsize=1)
+def get_released_version_history(current: str) -> tuple[tuple[str, dict], ...]:
+    """Get (version, info) pairs up to current, most recent release date first."""
+    current_key = _version_key(current)
+    released = [item for item in VERSION_HISTORY.items() if _version_key(item[0]) <= current_key]
+    return tuple(sorted(released, key=lambda item: item[1]["date"], reverse=True))
+
@@ -4,6 +4,7 @@ Application configuration settings for CSV Wrangler.
 Centralized configuration for paths, limits, and constants used throughout the application.
 """
 import os
+import sys
 from pathlib import Path
 from typing import Final
 
@@ -27,6 +28,22 @@ CHUNK_SIZE: Final[int] = 10000  # Rows per chunk for large file processing
 # Database configuration
 SQLITE_CHECK_SAME_THREAD: Final[bool] = False
 SQLITE_TIMEOUT: Final[float] = 30.0  # seconds - increased for Windows file locking issues
+# Memory-mapped I/O size in bytes - kept smaller on Windows where the userdata
+# directory is often on a OneDrive-synced path
+SQLITE_MMAP_SIZE: Final[int] = 64 * 1024 * 1024 if sys.platform == "win32" else 256 * 1024 * 1024
+SQLITE_JOURNAL_SIZE_LIMIT: Final[int] = 64 * 1024 * 1024  # Cap on WAL file size after checkpoints
+SQLITE_PAGE_SIZE: Final[int] = 8192  # bytes - only applied when the database file is created
+# Rows per multi-row INSERT statement for executemany-style inserts; keeps
+# rows * columns under SQLite's 32766 bound-parameter limit for wide tables
+SQLITE_INSERTMANYVALUES_PAGE_SIZE: Final[int] = 500
+
+# Connection pool configuration
+SQLITE_POOL_SIZE: Final[int] = max(4, os.cpu_count() or 1)
+SQLITE_MAX_OVERFLOW: Final[int] = 8
+SQLITE_POOL_RECYCLE: Final[int] = 3600  # seconds
+# OneDrive-synced paths on Windows have file locking issues with multiple
+# connections, so fall back to a single shared connection there
+IS_WINDOWS_ONEDRIVE: Final[bool] = sys.platform == "win32" and "onedrive" in str(APP_ROOT).lower()
 
 # UUID Value configuration
 UNIQUE_ID_COLUMN_NAME: Final[str] = "uuid_value"
@@ -44,12 +61,17 @@ BASE64_MIN_LENGTH: Final[int] = 100  # Minimum length to consider as Base64
 BASE64_PATTERN_PREFIX: Final[str] = "data:image"
 
 # Supported file types
-SUPPORTED_CSV_EXTENSIONS: Final[list[str]] = [".csv"]
-SUPPORTED_PICKLE_EXTENSIONS: Final[list[str]] = [".pkl", ".pickle"]
-SUPPORTED_FILE_EXTENSIONS: Final[list[str]] = SUPPORTED_CSV_EXTENSIONS + SUPPORTED_PICKLE_EXTENSIONS
+SUPPORTED_CSV_EXTENSIONS: Final[tuple[str, ...]] = (".csv",)
+SUPPORTED_PICKLE_EXTENSIONS: Final[tuple[str, ...]] = (".pkl", ".pickle")
+SUPPORTED_FILE_EXTENSIONS: Final[tuple[str, ...]] = SUPPORTED_CSV_EXTENSIONS + SUPPORTED_PICKLE_EXTENSIONS
 
-# CSV encoding detection
-CSV_ENCODINGS: Final[list[str]] = ["utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1"]
+# Set views for O(1) extension membership checks
+SUPPORTED_CSV_EXTENSIONS_SET: Final[frozenset[str]] = frozenset(SUPPORTED_CSV_EXTENSIONS)
+SUPPORTED_PICKLE_EXTENSIONS_SET: Final[frozenset[str]] = frozenset(SUPPORTED_PICKLE_EXTENSIONS)
+SUPPORTED_FILE_EXTENSIONS_SET: Final[frozenset[str]] = frozenset(SUPPORTED_FILE_EXTENSIONS)
+
+# CSV encoding detection (order matters: tried first to last)
+CSV_ENCODINGS: Final[tuple[str, ...]] = ("utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1")
 
 
 def ensure_userdata_directories() -> None:
@@ -3,27 +3,206 @@ Database connection and session management for CSV Wrangler.
 
 SQLAlchemy 2.0 setup with SQLite engine, connection pooling, and session management.
 """
+import json
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from functools import partial
+from typing import Any, Generator
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import MetaData, create_engine, event, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from src.config.settings import (
+    IS_WINDOWS_ONEDRIVE,
     SQLITE_CHECK_SAME_THREAD,
+    SQLITE_INSERTMANYVALUES_PAGE_SIZE,
+    SQLITE_JOURNAL_SIZE_LIMIT,
+    SQLITE_MAX_OVERFLOW,
+    SQLITE_MMAP_SIZE,
+    SQLITE_PAGE_SIZE,
+    SQLITE_POOL_RECYCLE,
+    SQLITE_POOL_SIZE,
     SQLITE_TIMEOUT,
     get_database_url,
 )
 from src.utils.errors import DatabaseError
 from src.utils.logging_config import get_logger
+from src.utils.package_check import has_orjson
 from src.utils.validation import quote_identifier
 
 logger = get_logger(__name__)
 
+# Use orjson's C decoder when available, falling back to the standard library
+_json_loads = json.loads
+try:
+    if has_orjson():
+        import orjson
+        _json_loads = orjson.loads
+except ImportError:
+    pass
+
 # Global engine instance
 _engine: Engine | None = None
 _SessionLocal: sessionmaker[Session] | None = None
+# Guards so concurrent Streamlit sessions create the engine/factory exactly once
+_engine_lock = threading.Lock()
+_session_factory_lock = threading.Lock()
+
+# Schema version per engine (keyed by id), see check_schema_version()
+_schema_version_cache: dict[int, int] = {}
+
+# Per-connection SQLite pragmas, sent as one script when a connection opens.
+# page_size and auto_vacuum only take effect on a new, empty database and must
+# precede journal_mode=WAL (which writes the header); on existing databases
+# they are no-ops. journal_mode then comes before the remaining pragmas so
+# they apply under WAL.
+_CONNECTION_PRAGMAS = ";\n".join((
+    # Match larger file-system pages for fewer I/O operations per table scan
+    f"PRAGMA page_size={SQLITE_PAGE_SIZE}",
+    # Allow free pages to be reclaimed with incremental_vacuum (see checkpoint_wal)
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    # Enable WAL mode for better concurrent access
+    # Note: WAL mode can have issues on Windows with network-synced paths (OneDrive)
+    # but it's still better than DELETE mode for concurrency
+    "PRAGMA journal_mode=WAL",
+    # Enable foreign key constraints
+    "PRAGMA foreign_keys=ON",
+    # Optimize synchronous mode for better performance with WAL
+    # NORMAL is safe with WAL and provides good performance
+    "PRAGMA synchronous=NORMAL",
+    # Use memory for temporary tables (improves performance)
+    "PRAGMA temp_store=MEMORY",
+    # Increase page cache size for better performance (default is -2000, set to -64000 = 64MB)
+    "PRAGMA cache_size=-64000",
+    # Serve reads from a memory-mapped region instead of read() syscalls
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+    # Truncate the WAL file back to this size after checkpoints
+    f"PRAGMA journal_size_limit={SQLITE_JOURNAL_SIZE_LIMIT}",
+    # Windows-specific: Set busy timeout to handle concurrent access better
+    # This helps when multiple operations happen quickly
+    f"PRAGMA busy_timeout={int(SQLITE_TIMEOUT * 1000)}",  # Convert to milliseconds
+)) + ";"
+
+# Characters replaced when deriving index names; must stay in line with
+# create_index_on_column() in table_service so both produce the same names
+_INDEX_NAME_SANITIZE = str.maketrans({".": "_", "-": "_"})
+
+# Migrations tracked in the _migrations table; see migrate_database()
+_MIGRATION_IDS: frozenset[int] = frozenset(range(1, 9))
+
+# Precompiled statements used by migrations
+_DDL_MIGRATIONS_TABLE = text(
+    "CREATE TABLE IF NOT EXISTS _migrations (id INTEGER PRIMARY KEY, applied_at TEXT)"
+)
+_Q_APPLIED_MIGRATIONS = text("SELECT id FROM _migrations")
+_DML_RECORD_MIGRATION = text("INSERT OR IGNORE INTO _migrations VALUES (:id, CURRENT_TIMESTAMP)")
+_Q_SCHEMA_OBJECTS = text("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'index')")
+# Streamed in batches so large columns_added blobs aren't all held in memory
+_Q_ENRICHED_DATASETS = text(
+    "SELECT id, enriched_table_name, columns_added FROM enriched_dataset"
+).execution_options(yield_per=100)
+_PRAGMA_WAL_CHECKPOINT = text("PRAGMA wal_checkpoint(TRUNCATE)")
+# Run via executescript: a single execute steps the pragma once, freeing one page
+_PRAGMA_INCREMENTAL_VACUUM = "PRAGMA incremental_vacuum(1000);"
+_Q_SCHEMA_VERSION = text("SELECT version FROM schema_version LIMIT 1")
+_DDL_KNOWLEDGE_TABLE_INDEXES = (
+    text("CREATE INDEX IF NOT EXISTS idx_knowledge_table_data_type ON knowledge_table(data_type)"),
+    text("CREATE INDEX IF NOT EXISTS idx_knowledge_table_table_name ON knowledge_table(table_name)"),
+)
+_DDL_ENRICHED_DATASET_SOURCE_INDEX = text(
+    "CREATE INDEX IF NOT EXISTS idx_enriched_dataset_source_dataset_id ON enriched_dataset(source_dataset_id)"
+)
+
+
+def make_engine(database_url: str) -> Engine:
+    """
+    Build a SQLite engine with the application's pool and pragma settings.
+    
+    Bulk inserts should pass a list of dicts to a single execute, e.g.
+    ``session.execute(insert(UploadLog), rows)``; SQLAlchemy then batches them
+    into multi-row INSERT ... VALUES statements (insertmanyvalues) rather than
+    issuing one INSERT per row as session.add_all() + flush() does.
+    
+    Args:
+        database_url: SQLAlchemy database URL
+        
+    Returns:
+        New SQLAlchemy engine (not cached; see get_engine)
+    """
+    # Use a QueuePool so concurrent readers get their own connection
+    # and can run in parallel against the WAL snapshot
+    from sqlalchemy.pool import QueuePool, StaticPool
+
+    if IS_WINDOWS_ONEDRIVE:
+        # StaticPool maintains a single shared connection, better for
+        # Windows file locking on OneDrive-synced paths
+        pool_kwargs = {"poolclass": StaticPool}
+    else:
+        pool_kwargs = {
+            "poolclass": QueuePool,
+            "pool_size": SQLITE_POOL_SIZE,
+            "max_overflow": SQLITE_MAX_OVERFLOW,
+            "pool_recycle": SQLITE_POOL_RECYCLE,
+        }
+
+    engine = create_engine(
+        database_url,
+        connect_args={
+            "check_same_thread": SQLITE_CHECK_SAME_THREAD,
+            "timeout": SQLITE_TIMEOUT,
+            # Windows-specific: explicitly set isolation level for better locking
+            "isolation_level": None,  # Let SQLite handle transactions
+        },
+        pool_pre_ping=False,  # Not needed for SQLite
+        echo=False,  # Set to True for SQL debugging
+        use_insertmanyvalues=True,
+        insertmanyvalues_page_size=SQLITE_INSERTMANYVALUES_PAGE_SIZE,
+        **pool_kwargs,
+    )
+
+    # Enable foreign key constraints and optimize SQLite settings
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        # Issue all pragmas in a single executescript call
+        dbapi_conn.executescript(_CONNECTION_PRAGMAS)
+
+    if pool_kwargs["poolclass"] is QueuePool:
+        # Overflow checkouts open a new connection (and rerun the pragmas), so
+        # frequent overflow means SQLITE_POOL_SIZE is too small for the workload
+        @event.listens_for(engine, "checkout")
+        def log_pool_overflow(dbapi_conn, connection_record, connection_proxy):
+            if engine.pool.overflow() > 0:
+                logger.debug("Connection pool overflow in use: %s", engine.pool.status())
+
+    return engine
+
+
+def get_pool_status() -> dict[str, Any]:
+    """
+    Get connection pool statistics for diagnostics.
+    
+    Does not create the engine; returns an empty dict if it does not exist yet.
+    
+    Returns:
+        Dictionary with the pool class and, for QueuePool, its size and the
+        number of checked-in, checked-out and overflow connections
+    """
+    if _engine is None:
+        return {}
+
+    pool = _engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if hasattr(pool, "checkedout"):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    return status
 
 
 def get_engine() -> Engine:
@@ -38,55 +217,22 @@ def get_engine() -> Engine:
     """
     global _engine
 
-    if _engine is None:
-        try:
-            database_url = get_database_url()
+    if _engine is not None:
+        return _engine
 
-            # Create engine with SQLite-specific configuration
-            # Use StaticPool for Windows to avoid connection issues
-            # StaticPool maintains a single connection per thread, better for Windows file locking
-            from sqlalchemy.pool import StaticPool
-            
-            _engine = create_engine(
-                database_url,
-                connect_args={
-                    "check_same_thread": SQLITE_CHECK_SAME_THREAD,
-                    "timeout": SQLITE_TIMEOUT,
-                    # Windows-specific: explicitly set isolation level for better locking
-                    "isolation_level": None,  # Let SQLite handle transactions
-                },
-                poolclass=StaticPool,  # Single connection per thread for Windows
-                pool_pre_ping=False,  # Not needed for SQLite
-                echo=False,  # Set to True for SQL debugging
-            )
+    with _engine_lock:
+        # Re-check under the lock in case another thread created it first
+        if _engine is None:
+            try:
+                engine = make_engine(get_database_url())
 
-            # Enable foreign key constraints and optimize SQLite settings
-            @event.listens_for(_engine, "connect")
-            def set_sqlite_pragma(dbapi_conn, connection_record):
-                cursor = dbapi_conn.cursor()
-                # Enable foreign key constraints
-                cursor.execute("PRAGMA foreign_keys=ON")
-                # Enable WAL mode for better concurrent access
-                # Note: WAL mode can have issues on Windows with network-synced paths (OneDrive)
-                # but it's still better than DELETE mode for concurrency
-                cursor.execute("PRAGMA journal_mode=WAL")
-                # Optimize synchronous mode for better performance with WAL
-                # NORMAL is safe with WAL and provides good performance
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                # Use memory for temporary tables (improves performance)
-                cursor.execute("PRAGMA temp_store=MEMORY")
-                # Increase page cache size for better performance (default is -2000, set to -64000 = 64MB)
-                cursor.execute("PRAGMA cache_size=-64000")
-                # Windows-specific: Set busy timeout to handle concurrent access better
-                # This helps when multiple operations happen quickly
-                cursor.execute(f"PRAGMA busy_timeout={int(SQLITE_TIMEOUT * 1000)}")  # Convert to milliseconds
-                cursor.close()
-
-            logger.info("Database engine created successfully")
+                # Publish only after the pragma listener is registered
+                _engine = engine
+                logger.info("Database engine created successfully")
 
-        except Exception as e:
-            logger.error(f"Failed to create database engine: {e}", exc_info=True)
-            raise DatabaseError(f"Failed to create database engine: {e}") from e
+            except Exception as e:
+                logger.error("Failed to create database engine: %s", e, exc_info=True)
+                raise DatabaseError(f"Failed to create database engine: {e}") from e
 
     return _engine
 
@@ -100,20 +246,24 @@ def get_session_factory() -> sessionmaker[Session]:
     """
     global _SessionLocal
 
-    if _SessionLocal is None:
-        engine = get_engine()
-        _SessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=engine,
-            expire_on_commit=False,
-        )
+    if _SessionLocal is not None:
+        return _SessionLocal
+
+    with _session_factory_lock:
+        if _SessionLocal is None:
+            engine = get_engine()
+            _SessionLocal = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=engine,
+                expire_on_commit=False,
+            )
 
     return _SessionLocal
 
 
 @contextmanager
-def get_session() -> Generator[Session, None, None]:
+def get_session(*, readonly: bool = False) -> Generator[Session, None, None]:
     """
     Get database session with automatic cleanup.
     
@@ -122,6 +272,10 @@ def get_session() -> Generator[Session, None, None]:
             # Use session
             pass
     
+    Args:
+        readonly: If True, the session is rolled back instead of committed on
+            exit, skipping the commit for pure-read workloads
+    
     Yields:
         Database session
     """
@@ -130,264 +284,391 @@ def get_session() -> Generator[Session, None, None]:
 
     try:
         yield session
-        session.commit()
+        if readonly:
+            session.rollback()
+        else:
+            session.commit()
     except Exception as e:
         session.rollback()
-        logger.error(f"Database session error: {e}", exc_info=True)
+        logger.error("Database session error: %s", e, exc_info=True)
         raise
     finally:
         # Explicitly close session and ensure connection is returned to pool
         session.close()
-        # Note: StaticPool will handle connection cleanup automatically
+        # Note: the pool handles connection cleanup automatically
         # No need to dispose the engine here as it's shared
 
 
+# Session for read-only call sites (never commits)
+get_readonly_session = partial(get_session, readonly=True)
+
+
+@contextmanager
+def count_queries(bind: Any) -> Generator[list[str], None, None]:
+    """
+    Record the SQL statements executed on an engine or connection.
+
+    Intended for tests that guard against N+1 regressions. The listener is
+    only attached inside the block, so there is no cost otherwise.
+
+    Usage:
+        with count_queries(engine) as queries:
+            repo.get_all()
+        assert len(queries) == 1
+
+    Args:
+        bind: Engine or Connection to listen on
+
+    Yields:
+        List that collects each executed statement
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+
+def _get_table_columns(conn, table_name: str, cache: dict[str, set[str]]) -> set[str]:
+    """
+    Get column names for a table, memoized for the duration of a migration run.
+    
+    Args:
+        conn: Active database connection
+        table_name: Table to inspect
+        cache: Per-run cache of table name to column names
+        
+    Returns:
+        Set of column names in the table
+    """
+    columns = cache.get(table_name)
+    if columns is None:
+        # Quote table name for PRAGMA (though PRAGMA doesn't strictly require it, it's safer)
+        result = conn.execute(text(f"PRAGMA table_info({quote_identifier(table_name)})"))
+        columns = {row[1] for row in result.fetchall()}
+        cache[table_name] = columns
+    return columns
+
+
 def migrate_database() -> None:
     """
     Migrate database schema - add missing columns and update structure.
     
-    This function handles schema migrations for existing databases.
+    This function handles schema migrations for existing databases. All
+    migrations run in a single transaction so they are committed (and
+    fsynced) once, and roll back together if a required migration fails.
+    Completed migrations are recorded in the _migrations table, so a fully
+    migrated database only costs a single lookup.
     """
     try:
         from src.config.settings import UNIQUE_ID_COLUMN_NAME
         
         engine = get_engine()
-        with engine.connect() as conn:
+        with engine.begin() as conn:
+            # The driver runs with isolation_level=None (autocommit), so open the
+            # transaction explicitly; engine.begin() commits it on exit
+            conn.exec_driver_sql("BEGIN")
+
+            conn.execute(_DDL_MIGRATIONS_TABLE)
+            applied = {row[0] for row in conn.execute(_Q_APPLIED_MIGRATIONS).fetchall()}
+            if applied.issuperset(_MIGRATION_IDS):
+                logger.debug("Database schema is current, no migrations to run")
+                return
+            newly_applied: list[int] = []
+
+            # Snapshot existing tables and indexes once instead of probing
+            # sqlite_master separately for every migration
+            schema_rows = conn.execute(_Q_SCHEMA_OBJECTS).fetchall()
+            tables = {row[0] for row in schema_rows if row[1] == "table"}
+            indexes = {row[0] for row in schema_rows if row[1] == "index"}
+            schema_columns: dict[str, set[str]] = {}
+
             # Migration 1: Add logo_path column to user_profile table
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='user_profile'")
-            )
-            if result.fetchone():
+            if 1 not in applied and "user_profile" in tables:
                 # Check if logo_path column exists
-                result = conn.execute(text("PRAGMA table_info(user_profile)"))
-                columns = [row[1] for row in result.fetchall()]
+                columns = _get_table_columns(conn, "user_profile", schema_columns)
                 
                 if "logo_path" not in columns:
                     logger.info("Adding logo_path column to user_profile table")
                     conn.execute(text("ALTER TABLE user_profile ADD COLUMN logo_path VARCHAR(500)"))
-                    conn.commit()
+                    schema_columns.pop("user_profile", None)
                     logger.info("Successfully added logo_path column")
+                newly_applied.append(1)
             
             # Migration 2: Rename unique_id column to uuid_value in all dataset tables
-            # Get all dataset tables (dataset_* pattern) and enriched tables (enriched_* pattern)
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND (name LIKE 'dataset_%' OR name LIKE 'enriched_%')")
-            )
-            tables = [row[0] for row in result.fetchall()]
-            
-            for table_name in tables:
-                # Check if unique_id column exists in this table
-                # Quote table name for PRAGMA (though PRAGMA doesn't strictly require it, it's safer)
-                quoted_table = quote_identifier(table_name)
-                result = conn.execute(text(f"PRAGMA table_info({quoted_table})"))
-                columns = {row[1]: row[0] for row in result.fetchall()}  # name: cid
+            if 2 not in applied:
+                # Get all dataset tables (dataset_* pattern) and enriched tables (enriched_* pattern)
+                data_tables = sorted(
+                    name for name in tables if name.startswith(("dataset_", "enriched_"))
+                )
                 
-                if "unique_id" in columns and UNIQUE_ID_COLUMN_NAME not in columns:
-                    logger.info(f"Renaming unique_id to {UNIQUE_ID_COLUMN_NAME} in table {table_name}")
-                    # SQLite 3.25.0+ supports ALTER TABLE RENAME COLUMN
-                    # Quote identifiers to handle any edge cases
-                    quoted_unique_id = quote_identifier("unique_id")
-                    quoted_uuid_value = quote_identifier(UNIQUE_ID_COLUMN_NAME)
-                    conn.execute(text(f"ALTER TABLE {quoted_table} RENAME COLUMN {quoted_unique_id} TO {quoted_uuid_value}"))
-                    conn.commit()
-                    logger.info(f"Successfully renamed column in table {table_name}")
+                for table_name in data_tables:
+                    # Check if unique_id column exists in this table
+                    columns = _get_table_columns(conn, table_name, schema_columns)
+                    
+                    if "unique_id" in columns and UNIQUE_ID_COLUMN_NAME not in columns:
+                        logger.info("Renaming unique_id to %s in table %s", UNIQUE_ID_COLUMN_NAME, table_name)
+                        # SQLite 3.25.0+ supports ALTER TABLE RENAME COLUMN
+                        # Quote identifiers to handle any edge cases
+                        quoted_table = quote_identifier(table_name)
+                        quoted_unique_id = quote_identifier("unique_id")
+                        quoted_uuid_value = quote_identifier(UNIQUE_ID_COLUMN_NAME)
+                        conn.execute(text(f"ALTER TABLE {quoted_table} RENAME COLUMN {quoted_unique_id} TO {quoted_uuid_value}"))
+                        schema_columns.pop(table_name, None)
+                        logger.info("Successfully renamed column in table %s", table_name)
+                newly_applied.append(2)
             
             # Migration 3: Create note table if it doesn't exist
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='note'")
-            )
-            if not result.fetchone():
-                logger.info("Creating note table")
-                from src.database.models import Note
-                Note.__table__.create(bind=conn, checkfirst=True)
-                conn.commit()
-                logger.info("Successfully created note table")
+            if 3 not in applied:
+                if "note" not in tables:
+                    logger.info("Creating note table")
+                    from src.database.models import Note
+                    Note.__table__.create(bind=conn, checkfirst=True)
+                    tables.add("note")
+                    logger.info("Successfully created note table")
+                newly_applied.append(3)
             
             # Migration 4: Create data_analysis table if it doesn't exist
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='data_analysis'")
-            )
-            if not result.fetchone():
-                logger.info("Creating data_analysis table")
-                from src.database.models import DataAnalysis
-                DataAnalysis.__table__.create(bind=conn, checkfirst=True)
-                conn.commit()
-                logger.info("Successfully created data_analysis table")
+            if 4 not in applied:
+                if "data_analysis" not in tables:
+                    logger.info("Creating data_analysis table")
+                    from src.database.models import DataAnalysis
+                    DataAnalysis.__table__.create(bind=conn, checkfirst=True)
+                    tables.add("data_analysis")
+                    logger.info("Successfully created data_analysis table")
+                newly_applied.append(4)
             
             # Migration 5: Create knowledge_table table if it doesn't exist
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='knowledge_table'")
-            )
-            if not result.fetchone():
-                logger.info("Creating knowledge_table table")
-                from src.database.models import KnowledgeTable
-                KnowledgeTable.__table__.create(bind=conn, checkfirst=True)
-                
-                # Create indexes for performance
-                conn.execute(text("CREATE INDEX IF NOT EXISTS idx_knowledge_table_data_type ON knowledge_table(data_type)"))
-                conn.execute(text("CREATE INDEX IF NOT EXISTS idx_knowledge_table_table_name ON knowledge_table(table_name)"))
-                
-                conn.commit()
-                logger.info("Successfully created knowledge_table table with indexes")
+            if 5 not in applied:
+                if "knowledge_table" not in tables:
+                    logger.info("Creating knowledge_table table")
+                    from src.database.models import KnowledgeTable
+                    KnowledgeTable.__table__.create(bind=conn, checkfirst=True)
+                    
+                    # Create indexes for performance
+                    for index_ddl in _DDL_KNOWLEDGE_TABLE_INDEXES:
+                        conn.execute(index_ddl)
+                    
+                    tables.add("knowledge_table")
+                    logger.info("Successfully created knowledge_table table with indexes")
+                newly_applied.append(5)
             
             # Migration 6: Index existing enriched columns for search performance
             # This must be inside the connection context to ensure proper transaction handling
-            try:
-                from src.database.models import EnrichedDataset
-                
-                # Check if enriched_dataset table exists before querying
-                result = conn.execute(
-                    text("SELECT name FROM sqlite_master WHERE type='table' AND name='enriched_dataset'")
-                )
-                if not result.fetchone():
-                    logger.info("Migration 6: enriched_dataset table does not exist, skipping index creation")
-                else:
-                    enriched_datasets = conn.execute(
-                        text("SELECT id, enriched_table_name, columns_added FROM enriched_dataset")
-                    ).fetchall()
-                    
-                    indexed_count = 0
-                    failed_count = 0
-                    for enriched_dataset_row in enriched_datasets:
-                        enriched_id = enriched_dataset_row[0]
-                        enriched_table_name = enriched_dataset_row[1]
-                        columns_added_json = enriched_dataset_row[2]
-                        
-                        if not columns_added_json:
-                            logger.debug(f"Migration 6: EnrichedDataset ID {enriched_id} has no columns_added, skipping")
-                            continue
-                        
-                        # Parse columns_added (JSON array of strings)
-                        import json
-                        try:
-                            columns_added = json.loads(columns_added_json) if isinstance(columns_added_json, str) else columns_added_json
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.warning(f"Migration 6: Failed to parse columns_added JSON for EnrichedDataset ID {enriched_id}: {e}")
-                            continue
-                        
-                        if not isinstance(columns_added, list):
-                            logger.warning(f"Migration 6: columns_added is not a list for EnrichedDataset ID {enriched_id}, skipping")
-                            continue
-                        
-                        # Create index for each enriched column
-                        for enriched_col_name in columns_added:
-                            if not isinstance(enriched_col_name, str):
+            if 6 not in applied:
+                try:
+                    # Check if enriched_dataset table exists before querying
+                    if "enriched_dataset" not in tables:
+                        logger.info("Migration 6: enriched_dataset table does not exist, skipping index creation")
+                    else:
+                        # Phase 1: collect (enriched_id, table, column, index_name) jobs,
+                        # streaming rows rather than materializing them with fetchall()
+                        index_jobs: list[tuple[int, str, str, str]] = []
+                        for enriched_dataset_row in conn.execute(_Q_ENRICHED_DATASETS):
+                            enriched_id = enriched_dataset_row[0]
+                            enriched_table_name = enriched_dataset_row[1]
+                            columns_added_json = enriched_dataset_row[2]
+                            
+                            if not columns_added_json:
+                                logger.debug("Migration 6: EnrichedDataset ID %s has no columns_added, skipping", enriched_id)
+                                continue
+                            
+                            # Parse columns_added (JSON array of strings)
+                            try:
+                                columns_added = _json_loads(columns_added_json) if isinstance(columns_added_json, (str, bytes)) else columns_added_json
+                            except (ValueError, TypeError) as e:  # Both decoders raise ValueError subclasses
                                 logger.warning(
-                                    f"Migration 6: Invalid column name type for EnrichedDataset ID {enriched_id}, "
-                                    f"column: {enriched_col_name}, type: {type(enriched_col_name)}"
+                                    "Migration 6: Failed to parse columns_added JSON for EnrichedDataset ID %s: %s",
+                                    enriched_id,
+                                    e,
                                 )
                                 continue
                             
-                            # Check if index already exists
-                            safe_table = enriched_table_name.replace(".", "_").replace("-", "_")
-                            safe_column = enriched_col_name.replace(".", "_").replace("-", "_")
-                            index_name = f"idx_{safe_table}_{safe_column}_not_null"
+                            if not isinstance(columns_added, list):
+                                logger.warning(
+                                    "Migration 6: columns_added is not a list for EnrichedDataset ID %s, skipping",
+                                    enriched_id,
+                                )
+                                continue
                             
-                            try:
-                                existing_index = conn.execute(
-                                    text("SELECT name FROM sqlite_master WHERE type='index' AND name=?"),
-                                    (index_name,)
-                                ).fetchone()
+                            # Sanitize the table name once per dataset, not once per column
+                            safe_table = enriched_table_name.translate(_INDEX_NAME_SANITIZE)
+                            for enriched_col_name in columns_added:
+                                if not isinstance(enriched_col_name, str):
+                                    logger.warning(
+                                        "Migration 6: Invalid column name type for EnrichedDataset ID %s, "
+                                        "column: %s, type: %s",
+                                        enriched_id,
+                                        enriched_col_name,
+                                        type(enriched_col_name),
+                                    )
+                                    continue
                                 
-                                if not existing_index:
+                                safe_column = enriched_col_name.translate(_INDEX_NAME_SANITIZE)
+                                index_name = f"idx_{safe_table}_{safe_column}_not_null"
+                                index_jobs.append((enriched_id, enriched_table_name, enriched_col_name, index_name))
+                        
+                        # Phase 2: create indexes grouped by table so each table's pages
+                        # stay hot in the page cache across its index builds.
+                        # SQLite allows a single writer, so the builds run sequentially
+                        # inside the migration transaction rather than on parallel connections.
+                        index_jobs.sort(key=lambda job: job[1])
+                        
+                        indexed_count = 0
+                        failed_count = 0
+                        for enriched_id, enriched_table_name, enriched_col_name, index_name in index_jobs:
+                            try:
+                                # Check the sqlite_master snapshot instead of probing per index
+                                if index_name not in indexes:
                                     # Create index directly using SQL
                                     # Quote identifiers to handle spaces/special characters
                                     quoted_table = quote_identifier(enriched_table_name)
                                     quoted_col = quote_identifier(enriched_col_name)
-                                    conn.execute(text(
-                                        f"CREATE INDEX IF NOT EXISTS {index_name} "
-                                        f"ON {quoted_table}({quoted_col}) "
-                                        f"WHERE {quoted_col} IS NOT NULL"
-                                    ))
+                                    # Savepoint per index so one failure doesn't abort the migration transaction
+                                    with conn.begin_nested():
+                                        conn.execute(text(
+                                            f"CREATE INDEX IF NOT EXISTS {index_name} "
+                                            f"ON {quoted_table}({quoted_col}) "
+                                            f"WHERE {quoted_col} IS NOT NULL"
+                                        ))
+                                    indexes.add(index_name)
                                     indexed_count += 1
                                     logger.debug(
-                                        f"Migration 6: Created index {index_name} on {enriched_table_name}.{enriched_col_name}"
+                                        "Migration 6: Created index %s on %s.%s",
+                                        index_name,
+                                        enriched_table_name,
+                                        enriched_col_name,
                                     )
                                 else:
                                     logger.debug(
-                                        f"Migration 6: Index {index_name} already exists for {enriched_table_name}.{enriched_col_name}"
+                                        "Migration 6: Index %s already exists for %s.%s",
+                                        index_name,
+                                        enriched_table_name,
+                                        enriched_col_name,
                                     )
                             except Exception as e:
                                 failed_count += 1
                                 logger.warning(
-                                    f"Migration 6: Failed to create index on {enriched_table_name}.{enriched_col_name} "
-                                    f"for EnrichedDataset ID {enriched_id}: {e}"
+                                    "Migration 6: Failed to create index on %s.%s for EnrichedDataset ID %s: %s",
+                                    enriched_table_name,
+                                    enriched_col_name,
+                                    enriched_id,
+                                    e,
                                 )
                                 continue
-                    
-                    if indexed_count > 0:
-                        conn.commit()
-                        logger.info(
-                            f"Migration 6: Created {indexed_count} indexes on existing enriched columns "
-                            f"({failed_count} failures)"
-                        )
-                    elif failed_count > 0:
-                        logger.warning(f"Migration 6: Failed to create {failed_count} indexes, no indexes created")
-                    else:
-                        logger.info("Migration 6: No new indexes needed for enriched columns")
                         
-            except Exception as e:
-                logger.error(f"Migration 6 (index enriched columns) failed: {e}", exc_info=True)
-                # Don't raise - allow migration to continue even if this fails
-                # The indexes are for performance, not critical for functionality
+                        if indexed_count > 0:
+                            logger.info(
+                                "Migration 6: Created %d indexes on existing enriched columns (%d failures)",
+                                indexed_count,
+                                failed_count,
+                            )
+                        elif failed_count > 0:
+                            logger.warning("Migration 6: Failed to create %d indexes, no indexes created", failed_count)
+                        else:
+                            logger.info("Migration 6: No new indexes needed for enriched columns")
+                        
+                        # Leave unrecorded on failures so the next startup retries
+                        if failed_count == 0:
+                            newly_applied.append(6)
+                            
+                except Exception as e:
+                    logger.error("Migration 6 (index enriched columns) failed: %s", e, exc_info=True)
+                    # Don't raise - allow migration to continue even if this fails
+                    # The indexes are for performance, not critical for functionality
             
             # Migration 7: Add theme_mode and wide_mode columns to user_profile table
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='user_profile'")
-            )
-            if result.fetchone():
+            if 7 not in applied and "user_profile" in tables:
                 # Check existing columns
-                result = conn.execute(text("PRAGMA table_info(user_profile)"))
-                columns = [row[1] for row in result.fetchall()]
+                columns = _get_table_columns(conn, "user_profile", schema_columns)
                 
                 if "theme_mode" not in columns:
                     logger.info("Migration 7: Adding theme_mode column to user_profile table")
                     conn.execute(text("ALTER TABLE user_profile ADD COLUMN theme_mode VARCHAR(20) DEFAULT 'dark'"))
-                    conn.commit()
+                    schema_columns.pop("user_profile", None)
                     logger.info("Migration 7: Successfully added theme_mode column")
                 
                 if "wide_mode" not in columns:
                     logger.info("Migration 7: Adding wide_mode column to user_profile table")
                     conn.execute(text("ALTER TABLE user_profile ADD COLUMN wide_mode BOOLEAN DEFAULT 1"))
-                    conn.commit()
+                    schema_columns.pop("user_profile", None)
                     logger.info("Migration 7: Successfully added wide_mode column")
+                newly_applied.append(7)
             
             # Migration 8: Add indexes for enriched_dataset table
-            try:
-                result = conn.execute(
-                    text("SELECT name FROM sqlite_master WHERE type='table' AND name='enriched_dataset'")
-                )
-                if result.fetchone():
-                    # Check if indexes already exist
-                    result = conn.execute(
-                        text("SELECT name FROM sqlite_master WHERE type='index' AND name='idx_enriched_dataset_source_dataset_id'")
-                    )
-                    if not result.fetchone():
-                        logger.info("Migration 8: Creating index on enriched_dataset.source_dataset_id")
-                        conn.execute(
-                            text("CREATE INDEX IF NOT EXISTS idx_enriched_dataset_source_dataset_id ON enriched_dataset(source_dataset_id)")
-                        )
-                        conn.commit()
-                        logger.info("Migration 8: Created index idx_enriched_dataset_source_dataset_id")
+            if 8 not in applied:
+                try:
+                    if "enriched_dataset" in tables:
+                        # Check if indexes already exist
+                        if "idx_enriched_dataset_source_dataset_id" not in indexes:
+                            logger.info("Migration 8: Creating index on enriched_dataset.source_dataset_id")
+                            # Savepoint so a failure here doesn't abort the migration transaction
+                            with conn.begin_nested():
+                                conn.execute(_DDL_ENRICHED_DATASET_SOURCE_INDEX)
+                            logger.info("Migration 8: Created index idx_enriched_dataset_source_dataset_id")
+                        else:
+                            logger.debug("Migration 8: Index idx_enriched_dataset_source_dataset_id already exists")
+                        
+                        # Note: enriched_table_name already has a unique constraint which acts as an index
+                        # but we can still create an explicit index if needed for clarity
+                        # For now, we skip it since unique constraints create indexes automatically
+                        
+                        logger.info("Migration 8: Added indexes for enriched_dataset table")
+                        newly_applied.append(8)
                     else:
-                        logger.debug("Migration 8: Index idx_enriched_dataset_source_dataset_id already exists")
-                    
-                    # Note: enriched_table_name already has a unique constraint which acts as an index
-                    # but we can still create an explicit index if needed for clarity
-                    # For now, we skip it since unique constraints create indexes automatically
-                    
-                    conn.commit()
-                    logger.info("Migration 8: Added indexes for enriched_dataset table")
-                else:
-                    logger.debug("Migration 8: enriched_dataset table does not exist, skipping index creation")
-            except Exception as e:
-                logger.warning(f"Migration 8 (add enriched_dataset indexes) failed: {e}. Continuing...")
+                        logger.debug("Migration 8: enriched_dataset table does not exist, skipping index creation")
+                except Exception as e:
+                    logger.warning("Migration 8 (add enriched_dataset indexes) failed: %s. Continuing...", e)
+            
+            # Record completed migrations in the same transaction
+            for migration_id in newly_applied:
+                conn.execute(_DML_RECORD_MIGRATION, {"id": migration_id})
                     
     except Exception as e:
-        logger.error(f"Failed to migrate database: {e}", exc_info=True)
+        logger.error("Failed to migrate database: %s", e, exc_info=True)
         raise DatabaseError(f"Failed to migrate database: {e}") from e
 
 
+def _create_schema(engine: Engine, metadata: MetaData) -> None:
+    """
+    Create all tables, their indexes and updated_at triggers with a single executescript call.
+    
+    Every statement uses IF NOT EXISTS, so this is safe on existing databases.
+    The script runs in one transaction, so SQLite parses it and takes the
+    schema lock once instead of once per table.
+    
+    Args:
+        engine: Database engine
+        metadata: Metadata containing the tables to create
+    """
+    from src.database.models import updated_at_trigger_ddl
+
+    statements = []
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table, if_not_exists=True).compile(dialect=engine.dialect)).strip())
+        for index in table.indexes:
+            statements.append(str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect)).strip())
+        if "updated_at" in table.c:
+            statements.extend(updated_at_trigger_ddl(table.name, engine.dialect.name))
+    ddl_script = "BEGIN;\n" + ";\n".join(statements) + ";\nCOMMIT;"
+
+    raw_conn = engine.raw_connection()
+    try:
+        try:
+            raw_conn.driver_connection.executescript(ddl_script)
+        except Exception:
+            if raw_conn.driver_connection.in_transaction:
+                raw_conn.driver_connection.rollback()
+            raise
+    finally:
+        raw_conn.close()
+
+
 def init_database() -> None:
     """
     Initialize database - create all tables and run migrations.
@@ -398,37 +679,70 @@ def init_database() -> None:
     try:
         from src.database.models import Base
 
+        # page_size and auto_vacuum are applied by the connection pragmas, which
+        # run before anything is written to a brand-new database file
         engine = get_engine()
-        Base.metadata.create_all(bind=engine)
+        try:
+            _create_schema(engine, Base.metadata)
+        except Exception as e:
+            logger.warning("Batched schema creation failed, falling back to create_all: %s", e)
+            Base.metadata.create_all(bind=engine)
         
         # Run migrations for existing databases
         migrate_database()
         
+        # Keep the WAL file and free pages from growing between sessions
+        checkpoint_wal()
+        
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}", exc_info=True)
+        logger.error("Failed to initialize database: %s", e, exc_info=True)
         raise DatabaseError(f"Failed to initialize database: {e}") from e
 
 
+def checkpoint_wal() -> None:
+    """
+    Checkpoint the WAL into the main database file and reclaim free pages.
+    
+    Truncates the -wal file and releases up to 1000 free pages when the
+    database uses incremental auto-vacuum. Safe to call periodically, e.g.
+    from a background thread. Failures are logged and ignored.
+    """
+    try:
+        engine = get_engine()
+        with engine.connect() as conn:
+            conn.execute(_PRAGMA_WAL_CHECKPOINT).fetchall()
+            # executescript steps the pragma to completion, so all 1000 pages are freed
+            conn.connection.driver_connection.executescript(_PRAGMA_INCREMENTAL_VACUUM)
+    except Exception as e:
+        logger.warning("WAL checkpoint failed: %s. Continuing...", e)
+
+
 def check_schema_version() -> int:
     """
     Check database schema version.
     
+    The result is cached per engine, so repeated calls don't hit the database.
+    
     Returns:
         Schema version number (0 if not set)
     """
     try:
         engine = get_engine()
+        cached = _schema_version_cache.get(id(engine))
+        if cached is not None:
+            return cached
+
         with engine.connect() as conn:
-            result = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'"
-            )
-            if result.fetchone():
-                result = conn.execute("SELECT version FROM schema_version LIMIT 1")
-                row = result.fetchone()
-                return row[0] if row else 0
-            return 0
+            try:
+                row = conn.execute(_Q_SCHEMA_VERSION).fetchone()
+                version = row[0] if row else 0
+            except OperationalError:
+                # schema_version table doesn't exist
+                version = 0
+
+        _schema_version_cache[id(engine)] = version
+        return version
     except Exception as e:
-        logger.warning(f"Failed to check schema version: {e}")
+        logger.warning("Failed to check schema version: %s", e)
         return 0
-
@@ -3,25 +3,239 @@ SQLAlchemy models for CSV Wrangler.
 
 Defines database schema for DatasetConfig and UploadLog tables.
 """
-from datetime import datetime
-from typing import Any
+import functools
+import io
+import json
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Optional
 
 from sqlalchemy import (
     JSON,
+    DDL,
     Boolean,
     Column,
     DateTime,
+    Enum,
+    FetchedValue,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    bindparam,
+    delete,
+    event,
     create_engine,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    column_property,
+    mapped_column,
+    relationship,
+    selectinload,
 )
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+from src.config.settings import MAX_DATASET_SLOTS
+from src.utils.errors import ConfigurationError
+from src.utils.package_check import has_ormsgpack
+
+# Use MessagePack for large config columns when available, JSON bytes otherwise
+_msgpack = None
+try:
+    if has_ormsgpack():
+        import ormsgpack as _msgpack
+except ImportError:
+    pass
+
+
+class SerializableMixin:
+    """Provides to_dict() for mapped models via the shared rows_to_dicts serializer."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert model to dictionary."""
+        return rows_to_dicts(type(self), (self,))[0]
+
+
+class Base(SerializableMixin, DeclarativeBase):
+    """Declarative base for all CSV Wrangler models."""
+
 
-Base = declarative_base()
+def _utcnow() -> datetime:
+    """
+    Client-side timestamp default (naive UTC, same as SQL CURRENT_TIMESTAMP).
+    
+    Sending the value with the INSERT lets multi-row inserts go out as a single
+    batched statement; server_default is kept for rows written outside the ORM.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Identifier-like lookup columns (names, table names, filenames): TEXT with byte-wise
+# "C" collation on PostgreSQL so equality/unique checks skip locale-aware comparison;
+# unchanged VARCHAR(255) on SQLite
+IdentText = Text(collation="C").with_variant(String(255), "sqlite")
+
+# Frequently updated tables get fillfactor=70 on PostgreSQL (see the after_create
+# listeners at the end of this module): leaving 30% free space per page lets
+# updated_at/config updates stay on the same page (HOT) and skip index writes
+_HOT_UPDATE_TABLES = ("dataset_config", "enriched_dataset", "data_analysis")
+
+# Closed value sets: native ENUM on PostgreSQL, VARCHAR + CHECK constraint on SQLite
+UPLOAD_FILE_TYPES = ("CSV", "PICKLE")
+ANALYSIS_OPERATION_TYPES = ("groupby", "pivot", "merge", "join", "concat", "apply", "map")
+UploadFileType = Enum(*UPLOAD_FILE_TYPES, name="file_type_enum", create_constraint=True)
+AnalysisOperationType = Enum(
+    *ANALYSIS_OPERATION_TYPES, name="op_type_enum", create_constraint=True
+)
+
+# JSON column type: binary JSONB on PostgreSQL (parsed once on write), plain JSON on SQLite
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class MsgPackJSON(TypeDecorator):
+    """
+    JSON-compatible values stored as MessagePack bytes (BLOB / BYTEA).
+    
+    Used for the large configuration columns, which are read far more often than
+    written and decode several times faster from MessagePack than from JSON text.
+    Values are written as JSON bytes when ormsgpack is not installed, or when a value
+    has non-string dict keys (JSON stringifies them, which callers rely on).
+    Reads accept MessagePack, JSON bytes, and JSON text from rows written before
+    this type was introduced.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+        if value is None:
+            return None
+        if _msgpack is not None:
+            try:
+                return _msgpack.packb(value)
+            except TypeError:
+                pass
+        return json.dumps(value).encode("utf-8")
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        # JSON text from a column created before MsgPackJSON, or JSON bytes.
+        # A MessagePack map/array never starts with "{" or "[".
+        if isinstance(value, str) or value[:1] in (b"{", b"["):
+            return json.loads(value)
+        if _msgpack is None:
+            raise ConfigurationError(
+                "Stored configuration is MessagePack-encoded but ormsgpack is not installed",
+                config_key="ormsgpack",
+            )
+        return _msgpack.unpackb(value)
+
+# Below this many rows a multi-row INSERT is cheaper than setting up a COPY stream
+BULK_COPY_THRESHOLD = 100
+
+
+def _copy_text_value(value: Any) -> str:
+    """Encode a single value for PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class BulkCopyMixin:
+    """
+    Bulk insert support for append-heavy log tables.
+    
+    On PostgreSQL, large batches are streamed through COPY ... FROM STDIN on the
+    raw DBAPI connection. Other dialects (SQLite) and small batches use a single
+    executemany INSERT, which SQLAlchemy batches via insertmanyvalues.
+    """
+
+    @classmethod
+    def bulk_copy(cls, session: Any, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert many rows in one round-trip without building ORM instances.
+        
+        Args:
+            session: Database session
+            rows: Column-name to value mappings; all rows must share the same keys
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        if session.bind.dialect.name != "postgresql" or len(rows) < BULK_COPY_THRESHOLD:
+            session.execute(_compiled_insert(cls), rows)
+            return len(rows)
+
+        columns = [c.name for c in cls.__table__.columns if c.name in rows[0]]
+        buf = io.StringIO()
+        buf.writelines(
+            "\t".join([_copy_text_value(row.get(name)) for name in columns]) + "\n"
+            for row in rows
+        )
+        buf.seek(0)
+
+        raw = session.connection().connection
+        cur = raw.cursor()
+        try:
+            cur.copy_from(buf, cls.__tablename__, columns=columns, sep="\t")
+        finally:
+            cur.close()
+        return len(rows)
+
+
+class DatasetScopedMixin:
+    """
+    Set-based deletes for rows that belong to a dataset.
+    
+    Subclasses name their dataset foreign key column in _dataset_fk.
+    """
+
+    _dataset_fk: str = "dataset_id"
+
+    @classmethod
+    def bulk_delete_for_dataset(cls, session: Any, dataset_id: int) -> int:
+        """
+        Delete every row for a dataset with a single DELETE ... WHERE statement.
+        
+        Uses synchronize_session=False, so instances already loaded in the session
+        are not updated; call session.expire_all() before re-reading them.
+        
+        Args:
+            session: Database session
+            dataset_id: Dataset ID
+            
+        Returns:
+            Number of rows deleted
+        """
+        stmt = (
+            delete(cls)
+            .where(getattr(cls, cls._dataset_fk) == dataset_id)
+            .execution_options(synchronize_session=False)
+        )
+        return session.execute(stmt).rowcount
 
 
 class DatasetConfig(Base):
@@ -35,43 +249,56 @@ class DatasetConfig(Base):
     """
 
     __tablename__ = "dataset_config"
+    __table_args__ = (
+        # Unique only over the real slots (1-5), so the index stays a handful of entries
+        Index(
+            "uq_dataset_config_slot_number",
+            "slot_number",
+            unique=True,
+            postgresql_where=text(f"slot_number BETWEEN 1 AND {MAX_DATASET_SLOTS}"),
+            sqlite_where=text(f"slot_number BETWEEN 1 AND {MAX_DATASET_SLOTS}"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False, unique=True)
-    slot_number = Column(Integer, nullable=False, unique=True)  # 1-5
-    table_name = Column(String(255), nullable=False, unique=True)
-    columns_config = Column(
-        JSON, nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(IdentText, nullable=False, unique=True)
+    slot_number: Mapped[int] = mapped_column(Integer, nullable=False)  # 1-5
+    table_name: Mapped[str] = mapped_column(IdentText, nullable=False, unique=True)
+    columns_config: Mapped[dict] = mapped_column(
+        MsgPackJSON, nullable=False
     )  # {"column_name": {"type": "TEXT", "is_image": False}}
-    duplicate_filter_column = Column(String(255), nullable=True)
-    image_columns = Column(JSON, nullable=False, default=lambda: [])  # List of column names
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    duplicate_filter_column: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    image_columns: Mapped[list] = mapped_column(
+        JSONType, nullable=False, default=lambda: []
+    )  # List of column names
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     # Relationship to upload logs
-    upload_logs = relationship("UploadLog", back_populates="dataset", cascade="all, delete-orphan")
+    # selectin: listing N datasets loads all their logs in one IN (...) query
+    # passive_deletes: ON DELETE CASCADE removes the logs, so unloaded logs are
+    # not SELECTed just to be deleted
+    upload_logs: Mapped[list["UploadLog"]] = relationship(
+        "UploadLog",
+        back_populates="dataset",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
 
     def __repr__(self) -> str:
         return f"<DatasetConfig(id={self.id}, name='{self.name}', slot_number={self.slot_number})>"
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "slot_number": self.slot_number,
-            "table_name": self.table_name,
-            "columns_config": self.columns_config,
-            "duplicate_filter_column": self.duplicate_filter_column,
-            "image_columns": self.image_columns,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class UploadLog(Base):
+
+class UploadLog(BulkCopyMixin, DatasetScopedMixin, Base):
     """
     Log of CSV file uploads to datasets.
     
@@ -79,31 +306,39 @@ class UploadLog(Base):
     """
 
     __tablename__ = "upload_log"
+    __table_args__ = (
+        # Covers the per-dataset upload history list (filtered by dataset, newest first)
+        Index(
+            "idx_upload_log_dataset_id_upload_date",
+            "dataset_id",
+            "upload_date",
+            postgresql_include=["filename", "row_count"],
+        ),
+        # Duplicate-filename check; not unique since uploads may skip that check
+        Index("idx_upload_log_dataset_id_filename", "dataset_id", "filename"),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    dataset_id = Column(Integer, ForeignKey("dataset_config.id", ondelete="CASCADE"), nullable=False)
-    filename = Column(String(255), nullable=False)
-    file_type = Column(String(50), nullable=False)  # CSV or PICKLE
-    row_count = Column(Integer, nullable=False)
-    upload_date = Column(DateTime, nullable=False, server_default=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    dataset_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("dataset_config.id", ondelete="CASCADE"), nullable=False
+    )
+    filename: Mapped[str] = mapped_column(IdentText, nullable=False)
+    file_type: Mapped[str] = mapped_column(UploadFileType, nullable=False)  # CSV or PICKLE
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    upload_date: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
 
     # Relationship to dataset
-    dataset = relationship("DatasetConfig", back_populates="upload_logs")
+    # raise_on_sql: loading it per log is an N+1; load it with selectinload
+    # (identity-map hits still work)
+    dataset: Mapped["DatasetConfig"] = relationship(
+        "DatasetConfig", back_populates="upload_logs", lazy="raise_on_sql"
+    )
 
     def __repr__(self) -> str:
         return f"<UploadLog(id={self.id}, dataset_id={self.dataset_id}, filename='{self.filename}')>"
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "dataset_id": self.dataset_id,
-            "filename": self.filename,
-            "file_type": self.file_type,
-            "row_count": self.row_count,
-            "upload_date": self.upload_date.isoformat() if self.upload_date else None,
-        }
-
 
 class UserProfile(Base):
     """
@@ -114,33 +349,33 @@ class UserProfile(Base):
 
     __tablename__ = "user_profile"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)
-    logo_path = Column(String(500), nullable=True)  # Path to uploaded logo file
-    theme_mode = Column(String(20), nullable=True, default="dark")  # "dark" or "light"
-    wide_mode = Column(Boolean, nullable=True, default=True)  # Always use wide layout
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    logo_path: Mapped[Optional[str]] = mapped_column(
+        String(500), nullable=True
+    )  # Path to uploaded logo file
+    theme_mode: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True, default="dark"
+    )  # "dark" or "light"
+    wide_mode: Mapped[Optional[bool]] = mapped_column(
+        Boolean, nullable=True, default=True
+    )  # Always use wide layout
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     def __repr__(self) -> str:
         return f"<UserProfile(id={self.id}, name='{self.name}')>"
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "logo_path": self.logo_path,
-            "theme_mode": self.theme_mode,
-            "wide_mode": self.wide_mode,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class EnrichedDataset(Base):
+
+class EnrichedDataset(DatasetScopedMixin, Base):
     """
     Tracks enriched datasets created from source datasets.
     
@@ -153,26 +388,43 @@ class EnrichedDataset(Base):
     """
 
     __tablename__ = "enriched_dataset"
+    _dataset_fk = "source_dataset_id"
+    __table_args__ = (
+        # Same name as Migration 8 so existing databases are not indexed twice
+        Index("idx_enriched_dataset_source_dataset_id", "source_dataset_id"),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)  # User-friendly name
-    source_dataset_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(IdentText, nullable=False)  # User-friendly name
+    source_dataset_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("dataset_config.id", ondelete="CASCADE"), nullable=False
     )
-    enriched_table_name = Column(String(255), nullable=False, unique=True)
-    source_table_name = Column(String(255), nullable=False)
-    enrichment_config = Column(
-        JSON, nullable=False
+    enriched_table_name: Mapped[str] = mapped_column(IdentText, nullable=False, unique=True)
+    source_table_name: Mapped[str] = mapped_column(IdentText, nullable=False)
+    enrichment_config: Mapped[dict] = mapped_column(
+        MsgPackJSON, nullable=False
     )  # {"column_name": "enrichment_function_name"}
-    columns_added = Column(JSON, nullable=False, default=lambda: [])  # List of enriched column names
-    last_sync_date = Column(DateTime, nullable=True)  # Last time enriched table was synced
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    columns_added: Mapped[list] = mapped_column(
+        JSONType, nullable=False, default=lambda: []
+    )  # List of enriched column names
+    last_sync_date: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )  # Last time enriched table was synced
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     # Relationship to source dataset
-    source_dataset = relationship("DatasetConfig", foreign_keys=[source_dataset_id])
+    source_dataset: Mapped["DatasetConfig"] = relationship(
+        "DatasetConfig", foreign_keys=[source_dataset_id], lazy="raise_on_sql"
+    )
 
     def __repr__(self) -> str:
         return (
@@ -180,21 +432,6 @@ class EnrichedDataset(Base):
             f"source_dataset_id={self.source_dataset_id})>"
         )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "source_dataset_id": self.source_dataset_id,
-            "enriched_table_name": self.enriched_table_name,
-            "source_table_name": self.source_table_name,
-            "enrichment_config": self.enrichment_config,
-            "columns_added": self.columns_added,
-            "last_sync_date": self.last_sync_date.isoformat() if self.last_sync_date else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
 
 class Note(Base):
     """
@@ -205,24 +442,30 @@ class Note(Base):
 
     __tablename__ = "note"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    content = Column(Text, nullable=False)
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Deferred: fetched only when accessed or undeferred (see NoteRepository.get_all)
+    content: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_group="body"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
-    def __repr__(self) -> str:
-        return f"<Note(id={self.id}, content_length={len(self.content) if self.content else 0})>"
+    # Computed by SQL with the row, so repr/logging never needs the full TEXT value
+    content_length: Mapped[Optional[int]] = column_property(func.length(content))
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "content": self.content,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    def __repr__(self) -> str:
+        length = self.content_length
+        if length is None:  # Not loaded from the database yet
+            length = len(self.content) if self.content else 0
+        return f"<Note(id={self.id}, content_length={length})>"
 
 
 class KnowledgeTable(Base):
@@ -236,18 +479,34 @@ class KnowledgeTable(Base):
 
     __tablename__ = "knowledge_table"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False, unique=True)  # User-friendly name, unique globally
-    data_type = Column(String(50), nullable=False)  # phone_numbers, emails, web_domains
-    table_name = Column(String(255), nullable=False, unique=True)  # Database table name
-    primary_key_column = Column(String(255), nullable=False)  # Source column for Key_ID generation
-    columns_config = Column(
-        JSON, nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(
+        IdentText, nullable=False, unique=True
+    )  # User-friendly name, unique globally
+    data_type: Mapped[str] = mapped_column(
+        String(50), nullable=False
+    )  # phone_numbers, emails, web_domains
+    table_name: Mapped[str] = mapped_column(
+        IdentText, nullable=False, unique=True
+    )  # Database table name
+    primary_key_column: Mapped[str] = mapped_column(
+        IdentText, nullable=False
+    )  # Source column for Key_ID generation
+    columns_config: Mapped[dict] = mapped_column(
+        MsgPackJSON, nullable=False
     )  # {"column_name": {"type": "TEXT", "is_image": False}}
-    key_id_column = Column(String(255), nullable=False, default="Key_ID")  # Always "Key_ID"
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    key_id_column: Mapped[str] = mapped_column(
+        String(255), nullable=False, default="Key_ID"
+    )  # Always "Key_ID"
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     def __repr__(self) -> str:
@@ -256,22 +515,8 @@ class KnowledgeTable(Base):
             f"data_type='{self.data_type}')>"
         )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "data_type": self.data_type,
-            "table_name": self.table_name,
-            "primary_key_column": self.primary_key_column,
-            "columns_config": self.columns_config,
-            "key_id_column": self.key_id_column,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class DataAnalysis(Base):
+
+class DataAnalysis(BulkCopyMixin, DatasetScopedMixin, Base):
     """
     Tracks data analysis operations performed on datasets.
     
@@ -280,40 +525,71 @@ class DataAnalysis(Base):
     """
 
     __tablename__ = "data_analysis"
+    _dataset_fk = "source_dataset_id"
+    __table_args__ = (
+        Index(
+            "idx_data_analysis_source_dates",
+            "source_dataset_id",
+            "date_range_start",
+            "date_range_end",
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)  # User-friendly name for the analysis
-    operation_type = Column(
-        String(50), nullable=False
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(
+        String(255), nullable=False
+    )  # User-friendly name for the analysis
+    operation_type: Mapped[str] = mapped_column(
+        AnalysisOperationType, nullable=False
     )  # groupby, pivot, merge, join, concat, apply, map
-    source_dataset_id = Column(
+    source_dataset_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("dataset_config.id", ondelete="CASCADE"), nullable=False
     )
-    secondary_dataset_id = Column(
+    secondary_dataset_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("dataset_config.id", ondelete="CASCADE"), nullable=True
     )  # For merge/join/concat operations
-    operation_config = Column(
-        JSON, nullable=False
+    operation_config: Mapped[dict] = mapped_column(
+        MsgPackJSON, nullable=False
     )  # {"columns": [...], "aggregations": {...}, "join_keys": [...], etc.}
-    result_file_path = Column(String(500), nullable=False)  # Path to parquet file
-    visualization_config = Column(
-        JSON, nullable=True
+    result_file_path: Mapped[str] = mapped_column(
+        String(500), nullable=False
+    )  # Path to parquet file
+    visualization_config: Mapped[Optional[dict]] = mapped_column(
+        MsgPackJSON, nullable=True
     )  # {"chart_type": "bar", "x_column": "...", "y_column": "...", etc.}
-    date_range_start = Column(DateTime, nullable=True)  # Start date for filtering
-    date_range_end = Column(DateTime, nullable=True)  # End date for filtering
-    date_column = Column(String(255), nullable=True)  # Column used for date filtering
-    last_refreshed_at = Column(DateTime, nullable=False, server_default=func.now())
-    source_updated_at = Column(
-        DateTime, nullable=False, server_default=func.now()
+    date_range_start: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )  # Start date for filtering
+    date_range_end: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )  # End date for filtering
+    date_column: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True
+    )  # Column used for date filtering
+    last_refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    source_updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
     )  # Timestamp of source dataset when analysis was created/refreshed
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(
-        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     # Relationships
-    source_dataset = relationship("DatasetConfig", foreign_keys=[source_dataset_id])
-    secondary_dataset = relationship("DatasetConfig", foreign_keys=[secondary_dataset_id])
+    source_dataset: Mapped["DatasetConfig"] = relationship(
+        "DatasetConfig", foreign_keys=[source_dataset_id], lazy="raise_on_sql"
+    )
+    secondary_dataset: Mapped[Optional["DatasetConfig"]] = relationship(
+        "DatasetConfig", foreign_keys=[secondary_dataset_id], lazy="raise_on_sql"
+    )
 
     def __repr__(self) -> str:
         return (
@@ -321,30 +597,144 @@ class DataAnalysis(Base):
             f"operation_type='{self.operation_type}', source_dataset_id={self.source_dataset_id})>"
         )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "operation_type": self.operation_type,
-            "source_dataset_id": self.source_dataset_id,
-            "secondary_dataset_id": self.secondary_dataset_id,
-            "operation_config": self.operation_config,
-            "result_file_path": self.result_file_path,
-            "visualization_config": self.visualization_config,
-            "date_range_start": self.date_range_start.isoformat()
-            if self.date_range_start
-            else None,
-            "date_range_end": self.date_range_end.isoformat()
-            if self.date_range_end
-            else None,
-            "date_column": self.date_column,
-            "last_refreshed_at": self.last_refreshed_at.isoformat()
-            if self.last_refreshed_at
-            else None,
-            "source_updated_at": self.source_updated_at.isoformat()
-            if self.source_updated_at
-            else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+
+@functools.lru_cache(maxsize=32)
+def _serializer_spec(cls: type) -> tuple[tuple[str, ...], attrgetter, tuple[str, ...]]:
+    """Return (column keys, attribute getter, datetime keys) for a model class."""
+    # Table columns only; SQL-expression properties such as Note.content_length are skipped
+    columns = {
+        key: column
+        for key, column in cls.__mapper__.columns.items()
+        if isinstance(column, Column)
+    }
+    keys = tuple(columns)
+    datetime_keys = tuple(
+        key for key, column in columns.items() if isinstance(column.type, DateTime)
+    )
+    return keys, attrgetter(*keys), datetime_keys
+
+
+def rows_to_dicts(cls: type, rows: Iterable[Any]) -> list[dict[str, Any]]:
+    """
+    Serialize model instances to dictionaries.
+    
+    Column keys and the attribute getter are resolved once per class, so each row
+    costs a single attrgetter call plus the datetime-to-ISO conversion.
+    
+    Args:
+        cls: Model class of the rows
+        rows: Model instances to serialize
+        
+    Returns:
+        List of dictionaries keyed by column name, datetimes as ISO strings
+    """
+    keys, getter, datetime_keys = _serializer_spec(cls)
+    isoformat = datetime.isoformat
+    out = []
+    for row in rows:
+        d = dict(zip(keys, getter(row)))
+        # created_at/updated_at etc. are usually identical on a row, so format
+        # each distinct value once
+        last_value = last_iso = None
+        for key in datetime_keys:
+            value = d[key]
+            if value is None:
+                continue
+            if value != last_value:
+                last_value, last_iso = value, isoformat(value)
+            d[key] = last_iso
+        out.append(d)
+    return out
+
+
+# Statement objects are built once per model so SQLAlchemy's compiled cache is hit
+# on every call; all variable values go through bind parameters.
+@functools.lru_cache(maxsize=32)
+def _compiled_insert(cls: type) -> Any:
+    """Return a cached INSERT statement for a model class."""
+    return insert(cls)
+
+
+@functools.lru_cache(maxsize=32)
+def _compiled_by_id(cls: type) -> Any:
+    """Return a cached SELECT-by-primary-key statement (bind param ``id``)."""
+    return select(cls).where(cls.id == bindparam("id"))
+
+
+def list_with_sources(session: Any) -> list["DataAnalysis"]:
+    """
+    Get all data analyses with their source and secondary datasets loaded.
+    
+    source_dataset/secondary_dataset are lazy="raise_on_sql", so listings that
+    touch them must load them up front; selectinload does this in one extra
+    IN (...) query per relationship instead of one query per analysis.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        List of DataAnalysis instances, newest first
+    """
+    stmt = (
+        select(DataAnalysis)
+        .options(
+            selectinload(DataAnalysis.source_dataset),
+            selectinload(DataAnalysis.secondary_dataset),
+        )
+        .order_by(DataAnalysis.created_at.desc())
+    )
+    return list(session.scalars(stmt))
+
+
+def updated_at_trigger_ddl(table_name: str, dialect_name: str) -> list[str]:
+    """
+    Get DDL for the trigger that maintains a table's updated_at column.
+    
+    updated_at is set by the database on UPDATE rather than sent by the ORM with
+    every statement; the columns are marked server_onupdate=FetchedValue() so the
+    ORM expires them after a flush. An explicitly assigned updated_at is kept.
+    
+    Args:
+        table_name: Table with an updated_at column
+        dialect_name: SQLAlchemy dialect name ("sqlite" or "postgresql")
+        
+    Returns:
+        List of DDL statements (empty for unsupported dialects)
+    """
+    trigger_name = f"trg_{table_name}_updated_at"
+    if dialect_name == "sqlite":
+        # recursive_triggers is off, so the inner UPDATE does not re-fire the trigger
+        return [
+            f"CREATE TRIGGER IF NOT EXISTS {trigger_name} "
+            f"AFTER UPDATE ON {table_name} FOR EACH ROW "
+            f"WHEN NEW.updated_at IS OLD.updated_at "
+            f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP "
+            f"WHERE id = NEW.id; END"
+        ]
+    if dialect_name == "postgresql":
+        return [
+            "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$ "
+            "BEGIN IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN "
+            "NEW.updated_at = now(); END IF; RETURN NEW; END; $$ LANGUAGE plpgsql",
+            f"CREATE OR REPLACE TRIGGER {trigger_name} "
+            f"BEFORE UPDATE ON {table_name} FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+        ]
+    return []
+
+
+def _create_updated_at_trigger(target: Any, connection: Any, **kw: Any) -> None:
+    """Create the updated_at trigger after a table is created via metadata.create_all."""
+    for statement in updated_at_trigger_ddl(target.name, connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+
+for _table in Base.metadata.tables.values():
+    if "updated_at" in _table.c:
+        event.listen(_table, "after_create", _create_updated_at_trigger)
+
+# Table-level WITH (...) options need SQLAlchemy 2.1, so set fillfactor after creation
+_HOT_UPDATE_FILLFACTOR_DDL = DDL("ALTER TABLE %(table)s SET (fillfactor = 70)").execute_if(
+    dialect="postgresql"
+)
+for _table_name in _HOT_UPDATE_TABLES:
+    event.listen(Base.metadata.tables[_table_name], "after_create", _HOT_UPDATE_FILLFACTOR_DDL)
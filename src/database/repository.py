@@ -3,10 +3,15 @@ Repository pattern implementation for CSV Wrangler.
 
 Provides data access abstraction layer following Repository pattern.
 """
-from typing import Any, Optional
+import functools
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
 
+from sqlalchemy import bindparam, delete, exists, inspect, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 
 from src.database.models import (
     DataAnalysis,
@@ -17,20 +22,266 @@ from src.database.models import (
     UploadLog,
     UserProfile,
 )
-from src.utils.errors import DatabaseError, ValidationError
+from src.utils.errors import CSVWranglerError, DatabaseError, ValidationError
 from src.utils.logging_config import get_logger
 from src.utils.validation import handle_integrity_error
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Single-row lookups built once at import time; values go through bind parameters
+# so every call reuses the same compiled SQL from SQLAlchemy's statement cache.
+# Slot numbers are only unique within the real slot range, hence LIMIT 1.
+_Q_DATASET_BY_SLOT = (
+    select(DatasetConfig).where(DatasetConfig.slot_number == bindparam("slot_number")).limit(1)
+)
+_Q_DATASET_BY_NAME = select(DatasetConfig).where(DatasetConfig.name == bindparam("name"))
+_Q_UPLOAD_LOG_BY_FILENAME = (
+    select(UploadLog)
+    .where(UploadLog.dataset_id == bindparam("dataset_id"), UploadLog.filename == bindparam("filename"))
+    .limit(1)
+)
+_Q_FIRST_PROFILE = select(UserProfile).limit(1)
+_Q_PROFILE_EXISTS = select(exists().select_from(UserProfile))
+_Q_KNOWLEDGE_TABLE_BY_NAME = select(KnowledgeTable).where(KnowledgeTable.name == bindparam("name"))
+_Q_KNOWLEDGE_TABLE_BY_TABLE_NAME = (
+    select(KnowledgeTable).where(KnowledgeTable.table_name == bindparam("table_name"))
+)
+
+# Collection queries, likewise built once
+_Q_ALL_DATASETS = select(DatasetConfig).order_by(DatasetConfig.slot_number)
+_Q_ALL_DATASET_SUMMARIES = select(
+    DatasetConfig.id, DatasetConfig.name, DatasetConfig.slot_number
+).order_by(DatasetConfig.slot_number)
+_Q_UPLOAD_LOGS_BY_DATASET = (
+    select(UploadLog)
+    .where(UploadLog.dataset_id == bindparam("dataset_id"))
+    # Every log shares one dataset; selectin skips it if already in the session
+    .options(selectinload(UploadLog.dataset))
+    .order_by(UploadLog.upload_date.desc())
+)
+_Q_ALL_NOTES = select(Note).order_by(Note.created_at.desc())
+_Q_ALL_NOTES_WITH_CONTENT = _Q_ALL_NOTES.options(undefer_group("body"))
+_Q_ALL_ANALYSES = select(DataAnalysis).order_by(DataAnalysis.created_at.desc())
+_Q_ANALYSES_BY_SOURCE = (
+    select(DataAnalysis)
+    .where(DataAnalysis.source_dataset_id == bindparam("dataset_id"))
+    # Many-to-one, so joining adds columns rather than rows
+    .options(
+        joinedload(DataAnalysis.source_dataset),
+        joinedload(DataAnalysis.secondary_dataset),
+    )
+    .order_by(DataAnalysis.created_at.desc())
+)
+_Q_KNOWLEDGE_TABLES_BY_DATA_TYPE = (
+    select(KnowledgeTable)
+    .where(KnowledgeTable.data_type == bindparam("data_type"))
+    .order_by(KnowledgeTable.created_at.desc())
+)
+_Q_ALL_KNOWLEDGE_TABLES = select(KnowledgeTable).order_by(
+    KnowledgeTable.data_type, KnowledgeTable.created_at.desc()
+)
+# Enriched dataset names are not unique, hence LIMIT 1
+_Q_ENRICHED_BY_NAME = select(EnrichedDataset).where(EnrichedDataset.name == bindparam("name")).limit(1)
+_Q_ENRICHED_BY_TABLE_NAME = select(EnrichedDataset).where(
+    EnrichedDataset.enriched_table_name == bindparam("enriched_table_name")
+)
+_Q_ENRICHED_BY_SOURCE = (
+    select(EnrichedDataset)
+    .where(EnrichedDataset.source_dataset_id == bindparam("source_dataset_id"))
+    .order_by(EnrichedDataset.created_at.desc())
+)
+_Q_ALL_ENRICHED = select(EnrichedDataset).order_by(EnrichedDataset.created_at.desc())
+_Q_ALL_ENRICHED_SUMMARIES = (
+    select(EnrichedDataset.id, EnrichedDataset.name, EnrichedDataset.source_dataset_id, DatasetConfig.name)
+    .outerjoin(DatasetConfig, EnrichedDataset.source_dataset_id == DatasetConfig.id)
+    .order_by(EnrichedDataset.created_at.desc())
+)
+_Q_ENRICHED_SUMMARIES_BY_SOURCE = _Q_ALL_ENRICHED_SUMMARIES.where(
+    EnrichedDataset.source_dataset_id == bindparam("source_dataset_id")
+)
+
+# Deletes by primary key in one statement; rowcount tells whether the row existed.
+# Dependent upload logs/analyses/enriched datasets go via ON DELETE CASCADE.
+# "fetch" keeps the identity map in sync, since the bound id can't be evaluated.
+_DML_DELETE_DATASET = (
+    delete(DatasetConfig)
+    .where(DatasetConfig.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+_DML_DELETE_NOTE = (
+    delete(Note)
+    .where(Note.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+_DML_DELETE_ANALYSIS = (
+    delete(DataAnalysis)
+    .where(DataAnalysis.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+_DML_DELETE_KNOWLEDGE_TABLE = (
+    delete(KnowledgeTable)
+    .where(KnowledgeTable.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+_DML_DELETE_ENRICHED = (
+    delete(EnrichedDataset)
+    .where(EnrichedDataset.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+
+# Field labels for handle_integrity_error messages, per model
+_DATASET_FIELDS = {"name": "Dataset name", "slot_number": "Slot number", "table_name": "Table name"}
+_UPLOAD_LOG_FIELDS = {"filename": "Filename", "dataset_id": "Dataset ID"}
+_PROFILE_FIELDS = {"name": "User name", "logo_path": "Logo path"}
+_ANALYSIS_FIELDS = {
+    "name": "Analysis name",
+    "source_dataset_id": "Source dataset ID",
+    "secondary_dataset_id": "Secondary dataset ID",
+}
+_KNOWLEDGE_TABLE_FIELDS = {"name": "Knowledge Table name", "table_name": "Table name"}
+_ENRICHED_DATASET_FIELDS = {
+    "name": "Enriched dataset name",
+    "enriched_table_name": "Enriched table name",
+    "source_dataset_id": "Source dataset ID",
+}
+
+
+def _db_operation(
+    operation: str,
+    description: str,
+    integrity_context: Optional[dict[str, str]] = None,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorate a repository method with the shared error translation.
+    
+    Application errors (ValidationError, DatabaseError, ...) pass through.
+    IntegrityError becomes a ValidationError via handle_integrity_error when
+    integrity_context is given; any other exception is logged and re-raised as
+    DatabaseError. Repositories only flush; the get_session() context manager
+    commits or rolls back.
+    
+    Args:
+        operation: Operation name recorded on DatabaseError
+        description: Human-readable action for messages, e.g. "create dataset"
+        integrity_context: Field labels for handle_integrity_error, or None to
+            treat IntegrityError like any other failure
+    """
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+            try:
+                return method(self, *args, **kwargs)
+            except CSVWranglerError:
+                raise
+            except IntegrityError as e:
+                if integrity_context is None:
+                    logger.error("Failed to %s: %s", description, e, exc_info=True)
+                    raise DatabaseError(f"Failed to {description}: {e}", operation=operation) from e
+                raise handle_integrity_error(e, integrity_context) from e
+            except Exception as e:
+                logger.error("Failed to %s: %s", description, e, exc_info=True)
+                raise DatabaseError(f"Failed to {description}: {e}", operation=operation) from e
+
+        return wrapper
+
+    return decorator
+
+
+def _reload_updated_at(session: Session, instance: Any) -> None:
+    """
+    Reload updated_at after a flush, if the flush expired it.
+    
+    updated_at is set by a database trigger (server_onupdate), so an UPDATE
+    expires it; only that column is reselected, and nothing is queried when
+    the flush issued no UPDATE for the instance.
+    
+    Args:
+        session: Database session
+        instance: Model instance with an updated_at column
+    """
+    if "updated_at" in inspect(instance).expired_attributes:
+        session.refresh(instance, attribute_names=["updated_at"])
+
+
+def _load_unset_columns(session: Session, instance: Any) -> None:
+    """
+    Load the column attributes an INSERT left unset, if there are any.
+    
+    Model defaults are applied in Python and the id comes back with the
+    INSERT, so after a flush usually every column is already loaded and
+    nothing is queried. Only nullable columns that were never assigned and SQL
+    expressions such as Note.content_length are reselected. That keeps them
+    readable once the session has closed.
+    
+    Args:
+        session: Database session
+        instance: Freshly inserted model instance
+    """
+    state = inspect(instance)
+    unset = [key for key in state.mapper.column_attrs.keys() if key in state.unloaded]
+    if unset:
+        session.refresh(instance, attribute_names=unset)
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSummary:
+    """Read-only id/name/slot view of a dataset, for listings that need no ORM object."""
+
+    id: int
+    name: str
+    slot_number: int
+
+
+@dataclass(frozen=True, slots=True)
+class EnrichedDatasetSummary:
+    """Read-only id/name view of an enriched dataset with its source dataset's name."""
+
+    id: int
+    name: str
+    source_dataset_id: int
+    source_name: Optional[str]
+
 
 class DatasetRepository:
     """Repository for DatasetConfig operations."""
 
+    # Process-wide (attribute, value) -> dataset id map for get_by_slot/get_by_name.
+    # Only ids are cached; the row is loaded in the caller's session by primary
+    # key (an identity-map hit when already loaded), and an entry that no longer
+    # matches is dropped, so a stale entry costs one query rather than a wrong row.
+    _id_cache: dict[tuple[str, Any], int] = {}
+    _id_cache_lock = threading.Lock()
+
     def __init__(self, session: Session):
         """Initialize repository with database session."""
         self.session = session
 
+    def _get_cached(self, attr: str, value: Any) -> Optional[DatasetConfig]:
+        """Get a dataset through the id cache, or None on a miss or stale entry."""
+        dataset_id = self._id_cache.get((attr, value))
+        if dataset_id is None:
+            return None
+        dataset = self.session.get(DatasetConfig, dataset_id)
+        if dataset is None or getattr(dataset, attr) != value:
+            self._forget(dataset_id)
+            return None
+        return dataset
+
+    def _remember(self, dataset: DatasetConfig) -> None:
+        """Cache the slot and name of a loaded dataset."""
+        with self._id_cache_lock:
+            self._id_cache[("slot_number", dataset.slot_number)] = dataset.id
+            self._id_cache[("name", dataset.name)] = dataset.id
+
+    @classmethod
+    def _forget(cls, dataset_id: int) -> None:
+        """Drop all cache entries pointing at a dataset."""
+        with cls._id_cache_lock:
+            for key in [key for key, cached_id in cls._id_cache.items() if cached_id == dataset_id]:
+                del cls._id_cache[key]
+
     def create(self, dataset: DatasetConfig) -> DatasetConfig:
         """
         Create a new dataset configuration.
@@ -45,22 +296,30 @@ class DatasetRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(dataset)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(dataset)
-            logger.debug(f"Created dataset: {dataset.name}")
-            return dataset
-        except IntegrityError as e:
-            context = {
-                "name": "Dataset name",
-                "slot_number": "Slot number",
-                "table_name": "Table name",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create dataset: {e}", exc_info=True)
-            raise DatabaseError(f"Failed to create dataset: {e}", operation="create_dataset") from e
+        created = self.create_many([dataset])[0]
+        _load_unset_columns(self.session, created)
+        logger.debug("Created dataset: %s", created.name)
+        return created
+
+    @_db_operation("create_dataset", "create dataset", integrity_context=_DATASET_FIELDS)
+    def create_many(self, datasets: list[DatasetConfig]) -> list[DatasetConfig]:
+        """
+        Create several dataset configurations with a single flush.
+        
+        Args:
+            datasets: DatasetConfig instances to create
+            
+        Returns:
+            The created instances, with IDs populated
+            
+        Raises:
+            ValidationError: If unique constraint violation
+            DatabaseError: If creation fails
+        """
+        self.session.add_all(datasets)
+        self.session.flush()  # One flush for the batch, but don't commit
+        logger.debug("Created %s dataset(s)", len(datasets))
+        return datasets
 
     def get_by_id(self, dataset_id: int) -> Optional[DatasetConfig]:
         """
@@ -84,11 +343,14 @@ class DatasetRepository:
         Returns:
             DatasetConfig instance or None if not found
         """
-        return (
-            self.session.query(DatasetConfig)
-            .filter_by(slot_number=slot_number)
-            .first()
-        )
+        dataset = self._get_cached("slot_number", slot_number)
+        if dataset is None:
+            dataset = self.session.execute(
+                _Q_DATASET_BY_SLOT, {"slot_number": slot_number}
+            ).scalar_one_or_none()
+            if dataset is not None:
+                self._remember(dataset)
+        return dataset
 
     def get_by_name(self, name: str) -> Optional[DatasetConfig]:
         """
@@ -100,21 +362,35 @@ class DatasetRepository:
         Returns:
             DatasetConfig instance or None if not found
         """
-        return (
-            self.session.query(DatasetConfig)
-            .filter_by(name=name)
-            .first()
-        )
+        dataset = self._get_cached("name", name)
+        if dataset is None:
+            dataset = self.session.execute(_Q_DATASET_BY_NAME, {"name": name}).scalar_one_or_none()
+            if dataset is not None:
+                self._remember(dataset)
+        return dataset
 
     def get_all(self) -> list[DatasetConfig]:
         """
-        Get all datasets.
+        Get all datasets, ordered by slot number.
         
         Returns:
             List of all DatasetConfig instances
         """
-        return self.session.query(DatasetConfig).all()
+        return list(self.session.scalars(_Q_ALL_DATASETS))
+
+    def get_all_summaries(self) -> list[DatasetSummary]:
+        """
+        Get id, name and slot number of all datasets, ordered by slot number.
+        
+        Selects only those columns, so no DatasetConfig is built and its
+        upload logs are not loaded.
+        
+        Returns:
+            List of DatasetSummary instances
+        """
+        return [DatasetSummary(*row) for row in self.session.execute(_Q_ALL_DATASET_SUMMARIES)]
 
+    @_db_operation("update_dataset", "update dataset", integrity_context=_DATASET_FIELDS)
     def update(self, dataset: DatasetConfig) -> DatasetConfig:
         """
         Update dataset configuration.
@@ -129,22 +405,13 @@ class DatasetRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If update fails
         """
-        try:
-            self.session.flush()  # Flush changes, but don't commit
-            self.session.refresh(dataset)
-            logger.debug(f"Updated dataset: {dataset.name}")
-            return dataset
-        except IntegrityError as e:
-            context = {
-                "name": "Dataset name",
-                "slot_number": "Slot number",
-                "table_name": "Table name",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to update dataset: {e}", exc_info=True)
-            raise DatabaseError(f"Failed to update dataset: {e}", operation="update_dataset") from e
+        self.session.flush()  # Flush changes, but don't commit
+        _reload_updated_at(self.session, dataset)
+        self._forget(dataset.id)  # Slot or name may have changed
+        logger.debug("Updated dataset: %s", dataset.name)
+        return dataset
 
+    @_db_operation("delete_dataset", "delete dataset")
     def delete(self, dataset_id: int) -> None:
         """
         Delete dataset by ID.
@@ -156,16 +423,11 @@ class DatasetRepository:
             ValidationError: If dataset not found
             DatabaseError: If deletion fails
         """
-        dataset = self.get_by_id(dataset_id)
-        if not dataset:
+        result = self.session.execute(_DML_DELETE_DATASET, {"id": dataset_id})
+        if result.rowcount == 0:
             raise ValidationError(f"Dataset with ID {dataset_id} not found")
-
-        try:
-            self.session.delete(dataset)
-            logger.debug(f"Deleted dataset: {dataset_id}")
-        except Exception as e:
-            logger.error(f"Failed to delete dataset: {e}", exc_info=True)
-            raise DatabaseError(f"Failed to delete dataset: {e}", operation="delete_dataset") from e
+        self._forget(dataset_id)
+        logger.debug("Deleted dataset: %s", dataset_id)
 
 
 class UploadLogRepository:
@@ -189,21 +451,30 @@ class UploadLogRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(upload_log)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(upload_log)
-            logger.debug(f"Created upload log: {upload_log.filename}")
-            return upload_log
-        except IntegrityError as e:
-            context = {
-                "filename": "Filename",
-                "dataset_id": "Dataset ID",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create upload log: {e}", exc_info=True)
-            raise DatabaseError(f"Failed to create upload log: {e}", operation="create_upload_log") from e
+        created = self.create_many([upload_log])[0]
+        _load_unset_columns(self.session, created)
+        logger.debug("Created upload log: %s", created.filename)
+        return created
+
+    @_db_operation("create_upload_log", "create upload log", integrity_context=_UPLOAD_LOG_FIELDS)
+    def create_many(self, upload_logs: list[UploadLog]) -> list[UploadLog]:
+        """
+        Create several upload log entries with a single flush.
+        
+        Args:
+            upload_logs: UploadLog instances to create
+            
+        Returns:
+            The created instances, with IDs populated
+            
+        Raises:
+            ValidationError: If unique constraint violation
+            DatabaseError: If creation fails
+        """
+        self.session.add_all(upload_logs)
+        self.session.flush()  # One flush for the batch, but don't commit
+        logger.debug("Created %s upload log(s)", len(upload_logs))
+        return upload_logs
 
     def get_by_id(self, upload_log_id: int) -> Optional[UploadLog]:
         """
@@ -219,7 +490,7 @@ class UploadLogRepository:
 
     def get_by_dataset_id(self, dataset_id: int) -> list[UploadLog]:
         """
-        Get all upload logs for a dataset.
+        Get all upload logs for a dataset, with their dataset loaded.
         
         Args:
             dataset_id: Dataset ID
@@ -227,11 +498,22 @@ class UploadLogRepository:
         Returns:
             List of UploadLog instances
         """
-        return (
-            self.session.query(UploadLog)
-            .filter_by(dataset_id=dataset_id)
-            .order_by(UploadLog.upload_date.desc())
-            .all()
+        return list(self.session.scalars(_Q_UPLOAD_LOGS_BY_DATASET, {"dataset_id": dataset_id}))
+
+    def iter_by_dataset_id(self, dataset_id: int, batch: int = 1000) -> Iterator[UploadLog]:
+        """
+        Stream upload logs for a dataset in batches instead of building a list.
+        
+        Args:
+            dataset_id: Dataset ID
+            batch: Rows fetched per batch
+            
+        Returns:
+            Iterator of UploadLog instances, valid while the session is open
+        """
+        return self.session.scalars(
+            _Q_UPLOAD_LOGS_BY_DATASET.execution_options(yield_per=batch),
+            {"dataset_id": dataset_id},
         )
 
     def check_duplicate_filename(
@@ -247,11 +529,9 @@ class UploadLogRepository:
         Returns:
             UploadLog instance if found, None otherwise
         """
-        return (
-            self.session.query(UploadLog)
-            .filter_by(dataset_id=dataset_id, filename=filename)
-            .first()
-        )
+        return self.session.execute(
+            _Q_UPLOAD_LOG_BY_FILENAME, {"dataset_id": dataset_id, "filename": filename}
+        ).scalar_one_or_none()
 
 
 class UserProfileRepository:
@@ -261,6 +541,7 @@ class UserProfileRepository:
         """Initialize repository with database session."""
         self.session = session
 
+    @_db_operation("create_profile", "create user profile", integrity_context=_PROFILE_FIELDS)
     def create(self, profile: UserProfile) -> UserProfile:
         """
         Create a new user profile.
@@ -275,23 +556,11 @@ class UserProfileRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(profile)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(profile)
-            logger.debug(f"Created user profile: {profile.name}")
-            return profile
-        except IntegrityError as e:
-            context = {
-                "name": "User name",
-                "logo_path": "Logo path",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create user profile: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to create user profile: {e}", operation="create_profile"
-            ) from e
+        self.session.add(profile)
+        self.session.flush()  # Flush to get ID, but don't commit
+        _load_unset_columns(self.session, profile)
+        logger.debug("Created user profile: %s", profile.name)
+        return profile
 
     def get_by_id(self, profile_id: int) -> Optional[UserProfile]:
         """
@@ -312,8 +581,9 @@ class UserProfileRepository:
         Returns:
             UserProfile instance or None if not found
         """
-        return self.session.query(UserProfile).first()
+        return self.session.execute(_Q_FIRST_PROFILE).scalar_one_or_none()
 
+    @_db_operation("update_profile", "update user profile", integrity_context=_PROFILE_FIELDS)
     def update(self, profile: UserProfile) -> UserProfile:
         """
         Update user profile.
@@ -328,22 +598,10 @@ class UserProfileRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If update fails
         """
-        try:
-            self.session.flush()  # Flush changes, but don't commit
-            self.session.refresh(profile)
-            logger.debug(f"Updated user profile: {profile.name}")
-            return profile
-        except IntegrityError as e:
-            context = {
-                "name": "User name",
-                "logo_path": "Logo path",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to update user profile: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to update user profile: {e}", operation="update_profile"
-            ) from e
+        self.session.flush()  # Flush changes, but don't commit
+        _reload_updated_at(self.session, profile)
+        logger.debug("Updated user profile: %s", profile.name)
+        return profile
 
     def exists(self) -> bool:
         """
@@ -352,7 +610,8 @@ class UserProfileRepository:
         Returns:
             True if profile exists, False otherwise
         """
-        return self.session.query(UserProfile).first() is not None
+        # SELECT EXISTS(...) returns a single boolean; no UserProfile row is hydrated
+        return bool(self.session.scalar(_Q_PROFILE_EXISTS))
 
 
 class NoteRepository:
@@ -376,20 +635,30 @@ class NoteRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(note)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(note)
-            logger.debug(f"Created note: ID {note.id}")
-            return note
-        except IntegrityError as e:
-            context = {}
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create note: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to create note: {e}", operation="create_note"
-            ) from e
+        created = self.create_many([note])[0]
+        _load_unset_columns(self.session, created)
+        logger.debug("Created note: ID %s", created.id)
+        return created
+
+    @_db_operation("create_note", "create note", integrity_context={})
+    def create_many(self, notes: list[Note]) -> list[Note]:
+        """
+        Create several notes with a single flush.
+        
+        Args:
+            notes: Note instances to create
+            
+        Returns:
+            The created instances, with IDs populated
+            
+        Raises:
+            ValidationError: If unique constraint violation
+            DatabaseError: If creation fails
+        """
+        self.session.add_all(notes)
+        self.session.flush()  # One flush for the batch, but don't commit
+        logger.debug("Created %s note(s)", len(notes))
+        return notes
 
     def get_by_id(self, note_id: int) -> Optional[Note]:
         """
@@ -403,19 +672,21 @@ class NoteRepository:
         """
         return self.session.get(Note, note_id)
 
-    def get_all(self) -> list[Note]:
+    def get_all(self, include_content: bool = True) -> list[Note]:
         """
         Get all notes, ordered by creation date (newest first).
         
+        Args:
+            include_content: Load the deferred content column in the same query;
+                pass False for listings that only need ids/timestamps
+        
         Returns:
             List of Note instances
         """
-        return (
-            self.session.query(Note)
-            .order_by(Note.created_at.desc())
-            .all()
-        )
+        stmt = _Q_ALL_NOTES_WITH_CONTENT if include_content else _Q_ALL_NOTES
+        return list(self.session.scalars(stmt))
 
+    @_db_operation("delete_note", "delete note")
     def delete(self, note_id: int) -> None:
         """
         Delete a note by ID.
@@ -426,24 +697,14 @@ class NoteRepository:
         Raises:
             DatabaseError: If deletion fails
         """
-        try:
-            note = self.session.get(Note, note_id)
-            if note:
-                self.session.delete(note)
-                logger.debug(f"Deleted note: ID {note_id}")
-            else:
-                raise ValidationError(
-                    f"Note with ID {note_id} not found",
-                    field="note_id",
-                    value=note_id,
-                )
-        except ValidationError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to delete note: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to delete note: {e}", operation="delete_note"
-            ) from e
+        result = self.session.execute(_DML_DELETE_NOTE, {"id": note_id})
+        if result.rowcount == 0:
+            raise ValidationError(
+                f"Note with ID {note_id} not found",
+                field="note_id",
+                value=note_id,
+            )
+        logger.debug("Deleted note: ID %s", note_id)
 
 
 class DataAnalysisRepository:
@@ -467,24 +728,30 @@ class DataAnalysisRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(analysis)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(analysis)
-            logger.debug(f"Created data analysis: ID {analysis.id}")
-            return analysis
-        except IntegrityError as e:
-            context = {
-                "name": "Analysis name",
-                "source_dataset_id": "Source dataset ID",
-                "secondary_dataset_id": "Secondary dataset ID",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create data analysis: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to create data analysis: {e}", operation="create_analysis"
-            ) from e
+        created = self.create_many([analysis])[0]
+        _load_unset_columns(self.session, created)
+        logger.debug("Created data analysis: ID %s", created.id)
+        return created
+
+    @_db_operation("create_analysis", "create data analysis", integrity_context=_ANALYSIS_FIELDS)
+    def create_many(self, analyses: list[DataAnalysis]) -> list[DataAnalysis]:
+        """
+        Create several data analyses with a single flush.
+        
+        Args:
+            analyses: DataAnalysis instances to create
+            
+        Returns:
+            The created instances, with IDs populated
+            
+        Raises:
+            ValidationError: If unique constraint violation
+            DatabaseError: If creation fails
+        """
+        self.session.add_all(analyses)
+        self.session.flush()  # One flush for the batch, but don't commit
+        logger.debug("Created %s data analysis record(s)", len(analyses))
+        return analyses
 
     def get_by_id(self, analysis_id: int) -> Optional[DataAnalysis]:
         """
@@ -505,15 +772,11 @@ class DataAnalysisRepository:
         Returns:
             List of DataAnalysis instances
         """
-        return (
-            self.session.query(DataAnalysis)
-            .order_by(DataAnalysis.created_at.desc())
-            .all()
-        )
+        return list(self.session.scalars(_Q_ALL_ANALYSES))
 
     def get_by_source_dataset(self, dataset_id: int) -> list[DataAnalysis]:
         """
-        Get all analyses for a source dataset.
+        Get all analyses for a source dataset, with source/secondary datasets loaded.
         
         Args:
             dataset_id: Source dataset ID
@@ -521,13 +784,9 @@ class DataAnalysisRepository:
         Returns:
             List of DataAnalysis instances
         """
-        return (
-            self.session.query(DataAnalysis)
-            .filter(DataAnalysis.source_dataset_id == dataset_id)
-            .order_by(DataAnalysis.created_at.desc())
-            .all()
-        )
+        return list(self.session.scalars(_Q_ANALYSES_BY_SOURCE, {"dataset_id": dataset_id}))
 
+    @_db_operation("update_analysis", "update data analysis", integrity_context=_ANALYSIS_FIELDS)
     def update(self, analysis: DataAnalysis) -> DataAnalysis:
         """
         Update data analysis.
@@ -542,24 +801,12 @@ class DataAnalysisRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If update fails
         """
-        try:
-            self.session.flush()  # Flush changes, but don't commit
-            self.session.refresh(analysis)
-            logger.debug(f"Updated data analysis: ID {analysis.id}")
-            return analysis
-        except IntegrityError as e:
-            context = {
-                "name": "Analysis name",
-                "source_dataset_id": "Source dataset ID",
-                "secondary_dataset_id": "Secondary dataset ID",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to update data analysis: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to update data analysis: {e}", operation="update_analysis"
-            ) from e
+        self.session.flush()  # Flush changes, but don't commit
+        _reload_updated_at(self.session, analysis)
+        logger.debug("Updated data analysis: ID %s", analysis.id)
+        return analysis
 
+    @_db_operation("delete_analysis", "delete data analysis")
     def delete(self, analysis_id: int) -> None:
         """
         Delete a data analysis by ID.
@@ -570,24 +817,14 @@ class DataAnalysisRepository:
         Raises:
             DatabaseError: If deletion fails
         """
-        try:
-            analysis = self.session.get(DataAnalysis, analysis_id)
-            if analysis:
-                self.session.delete(analysis)
-                logger.debug(f"Deleted data analysis: ID {analysis_id}")
-            else:
-                raise ValidationError(
-                    f"Data analysis with ID {analysis_id} not found",
-                    field="analysis_id",
-                    value=analysis_id,
-                )
-        except ValidationError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to delete data analysis: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to delete data analysis: {e}", operation="delete_analysis"
-            ) from e
+        result = self.session.execute(_DML_DELETE_ANALYSIS, {"id": analysis_id})
+        if result.rowcount == 0:
+            raise ValidationError(
+                f"Data analysis with ID {analysis_id} not found",
+                field="analysis_id",
+                value=analysis_id,
+            )
+        logger.debug("Deleted data analysis: ID %s", analysis_id)
 
 
 class KnowledgeTableRepository:
@@ -611,23 +848,30 @@ class KnowledgeTableRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(knowledge_table)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(knowledge_table)
-            logger.debug(f"Created Knowledge Table: {knowledge_table.name}")
-            return knowledge_table
-        except IntegrityError as e:
-            context = {
-                "name": "Knowledge Table name",
-                "table_name": "Table name",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create Knowledge Table: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to create Knowledge Table: {e}", operation="create_knowledge_table"
-            ) from e
+        created = self.create_many([knowledge_table])[0]
+        _load_unset_columns(self.session, created)
+        logger.debug("Created Knowledge Table: %s", created.name)
+        return created
+
+    @_db_operation("create_knowledge_table", "create Knowledge Table", integrity_context=_KNOWLEDGE_TABLE_FIELDS)
+    def create_many(self, knowledge_tables: list[KnowledgeTable]) -> list[KnowledgeTable]:
+        """
+        Create several Knowledge Tables with a single flush.
+        
+        Args:
+            knowledge_tables: KnowledgeTable instances to create
+            
+        Returns:
+            The created instances, with IDs populated
+            
+        Raises:
+            ValidationError: If unique constraint violation
+            DatabaseError: If creation fails
+        """
+        self.session.add_all(knowledge_tables)
+        self.session.flush()  # One flush for the batch, but don't commit
+        logger.debug("Created %s Knowledge Table(s)", len(knowledge_tables))
+        return knowledge_tables
 
     def get_by_id(self, knowledge_table_id: int) -> Optional[KnowledgeTable]:
         """
@@ -651,11 +895,9 @@ class KnowledgeTableRepository:
         Returns:
             KnowledgeTable instance or None if not found
         """
-        return (
-            self.session.query(KnowledgeTable)
-            .filter_by(name=name)
-            .first()
-        )
+        return self.session.execute(
+            _Q_KNOWLEDGE_TABLE_BY_NAME, {"name": name}
+        ).scalar_one_or_none()
 
     def get_by_table_name(self, table_name: str) -> Optional[KnowledgeTable]:
         """
@@ -667,11 +909,9 @@ class KnowledgeTableRepository:
         Returns:
             KnowledgeTable instance or None if not found
         """
-        return (
-            self.session.query(KnowledgeTable)
-            .filter_by(table_name=table_name)
-            .first()
-        )
+        return self.session.execute(
+            _Q_KNOWLEDGE_TABLE_BY_TABLE_NAME, {"table_name": table_name}
+        ).scalar_one_or_none()
 
     def get_by_data_type(self, data_type: str) -> list[KnowledgeTable]:
         """
@@ -683,11 +923,8 @@ class KnowledgeTableRepository:
         Returns:
             List of KnowledgeTable instances
         """
-        return (
-            self.session.query(KnowledgeTable)
-            .filter_by(data_type=data_type)
-            .order_by(KnowledgeTable.created_at.desc())
-            .all()
+        return list(
+            self.session.scalars(_Q_KNOWLEDGE_TABLES_BY_DATA_TYPE, {"data_type": data_type})
         )
 
     def get_all(self) -> list[KnowledgeTable]:
@@ -697,12 +934,21 @@ class KnowledgeTableRepository:
         Returns:
             List of all KnowledgeTable instances
         """
-        return (
-            self.session.query(KnowledgeTable)
-            .order_by(KnowledgeTable.data_type, KnowledgeTable.created_at.desc())
-            .all()
-        )
+        return list(self.session.scalars(_Q_ALL_KNOWLEDGE_TABLES))
+
+    def iter_all(self, batch: int = 1000) -> Iterator[KnowledgeTable]:
+        """
+        Stream all Knowledge Tables in batches instead of building a list.
+        
+        Args:
+            batch: Rows fetched per batch
+            
+        Returns:
+            Iterator of KnowledgeTable instances, valid while the session is open
+        """
+        return self.session.scalars(_Q_ALL_KNOWLEDGE_TABLES.execution_options(yield_per=batch))
 
+    @_db_operation("update_knowledge_table", "update Knowledge Table", integrity_context=_KNOWLEDGE_TABLE_FIELDS)
     def update(self, knowledge_table: KnowledgeTable) -> KnowledgeTable:
         """
         Update Knowledge Table configuration.
@@ -717,23 +963,12 @@ class KnowledgeTableRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If update fails
         """
-        try:
-            self.session.flush()  # Flush changes, but don't commit
-            self.session.refresh(knowledge_table)
-            logger.debug(f"Updated Knowledge Table: {knowledge_table.name}")
-            return knowledge_table
-        except IntegrityError as e:
-            context = {
-                "name": "Knowledge Table name",
-                "table_name": "Table name",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to update Knowledge Table: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to update Knowledge Table: {e}", operation="update_knowledge_table"
-            ) from e
+        self.session.flush()  # Flush changes, but don't commit
+        _reload_updated_at(self.session, knowledge_table)
+        logger.debug("Updated Knowledge Table: %s", knowledge_table.name)
+        return knowledge_table
 
+    @_db_operation("delete_knowledge_table", "delete Knowledge Table")
     def delete(self, knowledge_table_id: int) -> None:
         """
         Delete Knowledge Table by ID.
@@ -745,22 +980,14 @@ class KnowledgeTableRepository:
             ValidationError: If Knowledge Table not found
             DatabaseError: If deletion fails
         """
-        knowledge_table = self.get_by_id(knowledge_table_id)
-        if not knowledge_table:
+        result = self.session.execute(_DML_DELETE_KNOWLEDGE_TABLE, {"id": knowledge_table_id})
+        if result.rowcount == 0:
             raise ValidationError(
                 f"Knowledge Table with ID {knowledge_table_id} not found",
                 field="knowledge_table_id",
                 value=knowledge_table_id,
             )
-
-        try:
-            self.session.delete(knowledge_table)
-            logger.debug(f"Deleted Knowledge Table: {knowledge_table_id}")
-        except Exception as e:
-            logger.error(f"Failed to delete Knowledge Table: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to delete Knowledge Table: {e}", operation="delete_knowledge_table"
-            ) from e
+        logger.debug("Deleted Knowledge Table: %s", knowledge_table_id)
 
 
 class EnrichedDatasetRepository:
@@ -770,6 +997,7 @@ class EnrichedDatasetRepository:
         """Initialize repository with database session."""
         self.session = session
 
+    @_db_operation("create_enriched_dataset", "create enriched dataset", integrity_context=_ENRICHED_DATASET_FIELDS)
     def create(self, enriched_dataset: EnrichedDataset) -> EnrichedDataset:
         """
         Create a new enriched dataset.
@@ -784,24 +1012,11 @@ class EnrichedDatasetRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If creation fails
         """
-        try:
-            self.session.add(enriched_dataset)
-            self.session.flush()  # Flush to get ID, but don't commit
-            self.session.refresh(enriched_dataset)
-            logger.debug(f"Created enriched dataset: {enriched_dataset.name}")
-            return enriched_dataset
-        except IntegrityError as e:
-            context = {
-                "name": "Enriched dataset name",
-                "enriched_table_name": "Enriched table name",
-                "source_dataset_id": "Source dataset ID",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to create enriched dataset: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to create enriched dataset: {e}", operation="create_enriched_dataset"
-            ) from e
+        self.session.add(enriched_dataset)
+        self.session.flush()  # Flush to get ID, but don't commit
+        _load_unset_columns(self.session, enriched_dataset)
+        logger.debug("Created enriched dataset: %s", enriched_dataset.name)
+        return enriched_dataset
 
     def get_by_id(self, enriched_dataset_id: int) -> Optional[EnrichedDataset]:
         """
@@ -825,11 +1040,7 @@ class EnrichedDatasetRepository:
         Returns:
             EnrichedDataset instance or None if not found
         """
-        return (
-            self.session.query(EnrichedDataset)
-            .filter_by(name=name)
-            .first()
-        )
+        return self.session.execute(_Q_ENRICHED_BY_NAME, {"name": name}).scalar_one_or_none()
 
     def get_by_enriched_table_name(self, enriched_table_name: str) -> Optional[EnrichedDataset]:
         """
@@ -841,11 +1052,9 @@ class EnrichedDatasetRepository:
         Returns:
             EnrichedDataset instance or None if not found
         """
-        return (
-            self.session.query(EnrichedDataset)
-            .filter_by(enriched_table_name=enriched_table_name)
-            .first()
-        )
+        return self.session.execute(
+            _Q_ENRICHED_BY_TABLE_NAME, {"enriched_table_name": enriched_table_name}
+        ).scalar_one_or_none()
 
     def get_by_source_dataset(self, source_dataset_id: int) -> list[EnrichedDataset]:
         """
@@ -857,11 +1066,8 @@ class EnrichedDatasetRepository:
         Returns:
             List of EnrichedDataset instances
         """
-        return (
-            self.session.query(EnrichedDataset)
-            .filter_by(source_dataset_id=source_dataset_id)
-            .order_by(EnrichedDataset.created_at.desc())
-            .all()
+        return list(
+            self.session.scalars(_Q_ENRICHED_BY_SOURCE, {"source_dataset_id": source_dataset_id})
         )
 
     def get_all(self) -> list[EnrichedDataset]:
@@ -871,12 +1077,30 @@ class EnrichedDatasetRepository:
         Returns:
             List of all EnrichedDataset instances
         """
-        return (
-            self.session.query(EnrichedDataset)
-            .order_by(EnrichedDataset.created_at.desc())
-            .all()
-        )
+        return list(self.session.scalars(_Q_ALL_ENRICHED))
+
+    def get_all_summaries(self, source_dataset_id: Optional[int] = None) -> list[EnrichedDatasetSummary]:
+        """
+        Get id, name and source of enriched datasets, newest first.
+        
+        The source dataset name comes from the same query, so listings need
+        no per-row lookup of the source dataset.
+        
+        Args:
+            source_dataset_id: Optional source dataset ID to filter by
+            
+        Returns:
+            List of EnrichedDatasetSummary instances
+        """
+        if source_dataset_id:
+            rows = self.session.execute(
+                _Q_ENRICHED_SUMMARIES_BY_SOURCE, {"source_dataset_id": source_dataset_id}
+            )
+        else:
+            rows = self.session.execute(_Q_ALL_ENRICHED_SUMMARIES)
+        return [EnrichedDatasetSummary(*row) for row in rows]
 
+    @_db_operation("update_enriched_dataset", "update enriched dataset", integrity_context=_ENRICHED_DATASET_FIELDS)
     def update(self, enriched_dataset: EnrichedDataset) -> EnrichedDataset:
         """
         Update enriched dataset.
@@ -891,24 +1115,12 @@ class EnrichedDatasetRepository:
             ValidationError: If unique constraint violation
             DatabaseError: If update fails
         """
-        try:
-            self.session.flush()  # Flush changes, but don't commit
-            self.session.refresh(enriched_dataset)
-            logger.debug(f"Updated enriched dataset: {enriched_dataset.name}")
-            return enriched_dataset
-        except IntegrityError as e:
-            context = {
-                "name": "Enriched dataset name",
-                "enriched_table_name": "Enriched table name",
-                "source_dataset_id": "Source dataset ID",
-            }
-            raise handle_integrity_error(e, context) from e
-        except Exception as e:
-            logger.error(f"Failed to update enriched dataset: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to update enriched dataset: {e}", operation="update_enriched_dataset"
-            ) from e
+        self.session.flush()  # Flush changes, but don't commit
+        _reload_updated_at(self.session, enriched_dataset)
+        logger.debug("Updated enriched dataset: %s", enriched_dataset.name)
+        return enriched_dataset
 
+    @_db_operation("delete_enriched_dataset", "delete enriched dataset")
     def delete(self, enriched_dataset_id: int) -> None:
         """
         Delete enriched dataset by ID.
@@ -920,20 +1132,12 @@ class EnrichedDatasetRepository:
             ValidationError: If enriched dataset not found
             DatabaseError: If deletion fails
         """
-        enriched_dataset = self.get_by_id(enriched_dataset_id)
-        if not enriched_dataset:
+        result = self.session.execute(_DML_DELETE_ENRICHED, {"id": enriched_dataset_id})
+        if result.rowcount == 0:
             raise ValidationError(
                 f"Enriched dataset with ID {enriched_dataset_id} not found",
                 field="enriched_dataset_id",
                 value=enriched_dataset_id,
             )
-
-        try:
-            self.session.delete(enriched_dataset)
-            logger.debug(f"Deleted enriched dataset: {enriched_dataset_id}")
-        except Exception as e:
-            logger.error(f"Failed to delete enriched dataset: {e}", exc_info=True)
-            raise DatabaseError(
-                f"Failed to delete enriched dataset: {e}", operation="delete_enriched_dataset"
-            ) from e
+        logger.debug("Deleted enriched dataset: %s", enriched_dataset_id)
 
@@ -13,38 +13,51 @@ if str(project_root) not in sys.path:
 
 import streamlit as st
 
-from src.database.connection import init_database
+from src.database.connection import get_session, init_database
 from src.config.settings import ensure_userdata_directories, LOGO_DIR
-from src.utils.logging_config import setup_logging
-from src.__version__ import __version__, VERSION_HISTORY
+from src.services.profile_service import (
+    create_user_profile,
+    get_profile_summary,
+    is_app_initialized_cached,
+    load_logo_bytes,
+)
+from src.ui.components.sidebar import render_sidebar
+from src.utils.logging_config import get_logger, setup_logging
+from src.utils.preference_manager import apply_user_preferences
+from src.__version__ import __version__, VERSION_HISTORY_SORTED
 
-# Setup logging
-logger = setup_logging()
 
-# Ensure directories exist
-ensure_userdata_directories()
+@st.cache_resource(show_spinner=False)
+def _bootstrap():
+    """
+    Set up logging, userdata directories and the database once per process.
+    
+    main.py re-executes on every rerun; the cached resource keeps schema
+    creation and migrations off that path. A failure is not cached, so the
+    next run retries.
+    """
+    app_logger = setup_logging()
+    ensure_userdata_directories()
+    init_database()
+    return app_logger
+
 
-# Initialize database
 try:
-    init_database()
+    logger = _bootstrap()
 except Exception as e:
-    logger.error(f"Failed to initialize database: {e}", exc_info=True)
+    get_logger(__name__).error(f"Failed to initialize database: {e}", exc_info=True)
     # Can't use st.error() before st.set_page_config(), so just stop
-    import sys
     print(f"ERROR: Failed to initialize database: {e}", file=sys.stderr)
     sys.exit(1)
 
-# Check if app is initialized and apply user preferences
-# This must happen before st.set_page_config() which must be the first Streamlit command
-from src.database.connection import get_session
-from src.services.profile_service import is_app_initialized
-
-# Get user preferences and apply to page config
-# MUST be first Streamlit command, so we need to check initialization first
-try:
-    with get_session() as session:
-        if is_app_initialized(session):
-            from src.utils.preference_manager import apply_user_preferences
+# One session per rerun serves both the preference check and the page body
+with get_session() as session:
+    # Check if app is initialized and apply user preferences
+    # This must happen before st.set_page_config() which must be the first Streamlit command
+    app_initialized = False
+    try:
+        app_initialized = is_app_initialized_cached(session)
+        if app_initialized:
             apply_user_preferences(session)
         else:
             # Default config for initialization screen
@@ -54,20 +67,18 @@ try:
                 layout="wide",
                 initial_sidebar_state="expanded",
             )
-except Exception as e:
-    # Fallback to default config if preference loading fails
-    logger.warning(f"Failed to load user preferences: {e}")
-    st.set_page_config(
-        page_title="CSV Wrangler",
-        page_icon="📊",
-        layout="wide",
-        initial_sidebar_state="expanded",
-    )
-
-from src.services.profile_service import get_current_profile
+    except Exception as e:
+        # Fallback to default config if preference loading fails
+        logger.warning(f"Failed to load user preferences: {e}")
+        session.rollback()  # Keep the session usable for the page body
+        st.set_page_config(
+            page_title="CSV Wrangler",
+            page_icon="📊",
+            layout="wide",
+            initial_sidebar_state="expanded",
+        )
 
-with get_session() as session:
-    if not is_app_initialized(session):
+    if not app_initialized:
         # Show initialization UI on main page
         st.title("📊 CSV Wrangler")
         st.markdown("**Manage large CSV and Pickle datasets with ease**")
@@ -82,7 +93,6 @@ with get_session() as session:
             if st.form_submit_button("Initialize Application"):
                 if user_name and user_name.strip():
                     try:
-                        from src.services.profile_service import create_user_profile
                         profile = create_user_profile(session, user_name.strip())
                         st.success(f"Welcome, {profile.name}! Application initialized.")
                         st.rerun()
@@ -94,26 +104,27 @@ with get_session() as session:
         st.stop()
     else:
         # App is initialized - render uniform sidebar
-        from src.ui.components.sidebar import render_sidebar
         render_sidebar()
         
-        # Get profile for logo display
-        profile = get_current_profile(session)
+        # Get profile for logo display (cached across reruns)
+        profile = get_profile_summary()
         
         # Main page content - App Info
         st.title("📊 CSV Wrangler")
-        st.markdown("**Manage large CSV and Pickle datasets with ease**")
-        st.markdown("---")
+        st.markdown("**Manage large CSV and Pickle datasets with ease**\n\n---")
         
         # Logo display section
         col_logo, col_info = st.columns([1, 2])
         
         with col_logo:
             st.subheader("Logo")
-            if profile and profile.logo_path:
-                logo_path = Path(profile.logo_path)
+            if profile and profile["logo_path"]:
+                logo_path = Path(profile["logo_path"])
                 if logo_path.exists():
-                    st.image(str(logo_path), use_container_width=True)
+                    st.image(
+                        load_logo_bytes(str(logo_path), logo_path.stat().st_mtime),
+                        use_container_width=True,
+                    )
                 else:
                     st.info("Logo file not found. Please upload a new logo in Settings.")
             else:
@@ -121,12 +132,15 @@ with get_session() as session:
         
         with col_info:
             st.subheader("Application Information")
-            st.markdown(f"**Version:** {__version__}")
-            st.markdown("**Description:** A powerful tool for managing and exploring large CSV and Pickle datasets.")
+            st.markdown(
+                f"**Version:** {__version__}\n\n"
+                "**Description:** A powerful tool for managing and exploring large CSV and Pickle datasets."
+            )
             
-            st.markdown("---")
-            st.markdown("### Core Features")
             st.markdown("""
+            ---
+            ### Core Features
+            
             - **Multi-Dataset Management**: Manage up to 5 datasets simultaneously
             - **File Support**: Upload and process CSV and Pickle files
             - **Data Exploration**: Advanced filtering and search capabilities
@@ -139,13 +153,15 @@ with get_session() as session:
         
         # Version history
         st.subheader("Version History")
-        for version, info in sorted(VERSION_HISTORY.items(), reverse=True):
+        for version, info in VERSION_HISTORY_SORTED:
             with st.expander(f"Version {version} - {info['description']}", expanded=False):
-                st.markdown(f"**Date:** {info['date']}")
-                st.markdown(f"**Status:** {info['status']}")
-                st.markdown("**Features:**")
-                for feature in info['features']:
-                    st.markdown(f"  - {feature}")
+                # One markdown element per entry instead of one per line
+                feature_lines = "\n".join(f"  - {feature}" for feature in info['features'])
+                st.markdown(
+                    f"**Date:** {info['date']}\n\n"
+                    f"**Status:** {info['status']}\n\n"
+                    f"**Features:**\n{feature_lines}"
+                )
         
         st.markdown("---")
         
@@ -154,17 +170,23 @@ with get_session() as session:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown("**Dataset Management**")
-            st.markdown("- Navigate to Dataset pages (1-5) to initialize and manage datasets")
-            st.markdown("- Upload CSV or Pickle files to your datasets")
+            st.markdown(
+                "**Dataset Management**\n"
+                "- Navigate to Dataset pages (1-5) to initialize and manage datasets\n"
+                "- Upload CSV or Pickle files to your datasets"
+            )
         
         with col2:
-            st.markdown("**Data Exploration**")
-            st.markdown("- Use DataFrame View for advanced filtering")
-            st.markdown("- Use Enrichment Suite to validate and format data")
+            st.markdown(
+                "**Data Exploration**\n"
+                "- Use DataFrame View for advanced filtering\n"
+                "- Use Enrichment Suite to validate and format data"
+            )
         
         with col3:
-            st.markdown("**Settings**")
-            st.markdown("- Configure datasets and view statistics")
-            st.markdown("- Upload a custom logo for your organization")
+            st.markdown(
+                "**Settings**\n"
+                "- Configure datasets and view statistics\n"
+                "- Upload a custom logo for your organization"
+            )
 
@@ -5,11 +5,10 @@ Allows users to create enriched datasets with validation and formatting function
 """
 import streamlit as st
 
-from sqlalchemy import inspect
-
 from src.config.settings import UNIQUE_ID_COLUMN_NAME
 from src.database.connection import get_session
 from src.database.repository import DatasetRepository
+from src.services.cached_listings import list_datasets, list_table_columns
 from src.services.enrichment_service import (
     create_enriched_dataset,
     delete_enriched_dataset,
@@ -33,7 +32,7 @@ st.markdown("---")
 
 with get_session() as session:
     repo = DatasetRepository(session)
-    all_datasets = repo.get_all()
+    all_datasets = list_datasets()
     
     if not all_datasets:
         st.info("No datasets initialized yet. Please initialize a dataset first.")
@@ -41,24 +40,25 @@ with get_session() as session:
     
     # Dataset selector
     st.subheader("Select Source Dataset")
-    dataset_options = {f"{d.name} (Slot {d.slot_number})": d.id for d in all_datasets}
-    selected_dataset_name = st.selectbox(
+    selected_summary = st.selectbox(
         "Choose a dataset to enrich",
-        options=list(dataset_options.keys()),
+        options=all_datasets,
+        format_func=lambda d: f"{d.name} (Slot {d.slot_number})",
         key="enrichment_dataset_selector",
     )
     
-    if selected_dataset_name:
-        selected_dataset_id = dataset_options[selected_dataset_name]
+    if selected_summary:
+        selected_dataset_id = selected_summary.id
         selected_dataset = repo.get_by_id(selected_dataset_id)
         
         if selected_dataset:
             st.markdown("---")
             
             # Get actual table columns from database (more reliable than columns_config)
-            inspector = inspect(session.bind)
             try:
-                table_columns = [col["name"] for col in inspector.get_columns(selected_dataset.table_name)]
+                table_columns = list_table_columns(selected_dataset.table_name)
+                if not table_columns:
+                    raise ValidationError(f"Table '{selected_dataset.table_name}' not found")
                 # Filter out unique_id - it's automatically added and shouldn't be enriched
                 dataset_columns = [col for col in table_columns if col != UNIQUE_ID_COLUMN_NAME]
             except Exception as e:
@@ -4,11 +4,11 @@ DataFrame View page for CSV Wrangler v1.1.
 Advanced data exploration with filtering and search capabilities.
 """
 import streamlit as st
-import pandas as pd
 
-from src.database.connection import get_session
+from src.database.connection import get_readonly_session, get_session
 from src.database.repository import DatasetRepository
 from src.services.dataframe_service import (
+    detect_date_columns,
     get_dataset_columns,
     get_dataset_row_count,
     get_enriched_dataset_columns,
@@ -16,14 +16,252 @@ from src.services.dataframe_service import (
     load_dataset_dataframe,
     load_enriched_dataset_dataframe,
 )
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from typing import Optional
 
+import pandas as pd
+
 from src.database.models import EnrichedDataset
-from src.services.enrichment_service import get_enriched_datasets
-from src.services.export_service import filter_by_date_range
-from src.ui.components.dataframe_filter import render_dataframe_filter_ui
+from src.services.cached_listings import list_datasets, list_enriched_datasets
+from src.services.export_service import dataframe_to_csv_bytes, filter_by_date_range
+from src.ui.components.dataframe_filter import get_sql_search_term, render_dataframe_filter_ui
 from src.ui.components.sidebar import render_sidebar
+from src.utils.cache_manager import get_cache_version
+
+# Rows sent to the browser for the preview grid (the grid shows ~20 at a time)
+_PREVIEW_ROW_LIMIT = 5_000
+
+# Most recent loaded/date-filtered frames kept per browser session
+_FRAME_CACHE_KEY = "dataframe_frame_cache"
+_FRAME_CACHE_SIZE = 4
+
+
+def _remember_frame(cache_key: tuple, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Get a frame from this session's most recent results, building it on a miss.
+    
+    st.cache_data already skips the query for a repeated load, but it
+    unpickles a fresh copy of the frame on every hit. Keeping the last few
+    frames in session state makes switching back to an earlier selection
+    free. Frames are shared between reruns, so callers must not modify them.
+    
+    Args:
+        cache_key: Hashable key describing the frame
+        build: Function that loads the frame on a miss
+        
+    Returns:
+        The remembered or newly built frame
+    """
+    cache = st.session_state.setdefault(_FRAME_CACHE_KEY, OrderedDict())
+    if cache_key in cache:
+        cache.move_to_end(cache_key)
+        return cache[cache_key]
+    
+    frame = build()
+    cache[cache_key] = frame
+    while len(cache) > _FRAME_CACHE_SIZE:
+        cache.popitem(last=False)
+    return frame
+
+
+@st.fragment
+def _render_data_view(
+    session_key: str,
+    selected_id: int,
+    is_enriched: bool,
+    row_limit: int,
+    include_images: bool,
+    total_rows: int,
+    display_name: str,
+    enriched_info: Optional[dict[str, str]] = None,
+) -> None:
+    """
+    Render the loaded DataFrame with its date filter, filters and download.
+    
+    Runs as a fragment: the filter widgets rerun only this section, not the
+    dataset selector and sidebar. Loads through its own session because the
+    page session is closed by the time a fragment rerun happens.
+    
+    Args:
+        session_key: Key identifying the selected dataset in session state
+        selected_id: Dataset or enriched dataset ID
+        is_enriched: Whether selected_id refers to an enriched dataset
+        row_limit: Maximum number of rows to load
+        include_images: Whether to load image columns
+        total_rows: Total row count shown next to the loaded count
+        display_name: Name used for the download file
+        enriched_info: Label/value pairs describing an enriched dataset
+    """
+    # The search box sits below the data, but its term is known from the last
+    # run: apply it in SQL so the row limit counts matching rows
+    filter_key_prefix = f"dataframe_{session_key}"
+    search_term = get_sql_search_term(filter_key_prefix)
+    
+    # Loaded frames are remembered per (dataset, load options, data version)
+    load_dataframe = load_enriched_dataset_dataframe if is_enriched else load_dataset_dataframe
+    if is_enriched:
+        data_version = get_cache_version(enriched_dataset_id=selected_id)
+    else:
+        data_version = get_cache_version(dataset_id=selected_id)
+    frame_key = (session_key, row_limit, include_images, total_rows, data_version, search_term)
+    
+    with get_readonly_session() as session:
+        try:
+            with st.spinner(f"Loading {row_limit} rows..."):
+                df = _remember_frame(
+                    frame_key,
+                    lambda: load_dataframe(
+                        session,
+                        selected_id,
+                        limit=row_limit,
+                        include_image_columns=include_images,
+                        order_by_recent=True,
+                        search_term=search_term,
+                    ),
+                )
+
+            if df.empty and search_term:
+                st.info(f"No rows match '{search_term}'.")
+                if st.button("Clear search", key=f"{filter_key_prefix}_clear_search"):
+                    st.session_state.pop(f"{filter_key_prefix}_search", None)
+                    st.rerun()
+            elif df.empty:
+                st.info("Dataset is empty. Upload some data first.")
+            else:
+                st.success(f"✅ Loaded {len(df)} rows (Total in dataset: {total_rows:,})")
+
+                # Detect date/datetime columns (remembered across reruns for the same frame)
+                date_columns_key = (session_key, df.shape, tuple(df.columns))
+                cached_date_columns = st.session_state.get("dataframe_date_columns")
+                if cached_date_columns and cached_date_columns[0] == date_columns_key:
+                    date_columns = cached_date_columns[1]
+                else:
+                    date_columns = detect_date_columns(df)
+                    st.session_state["dataframe_date_columns"] = (date_columns_key, date_columns)
+
+                # Date range filtering (only if date columns exist).
+                # No copy: the filter helpers return new frames and never modify df
+                filtered_df = df
+                if date_columns:
+                    st.markdown("---")
+                    st.subheader("📅 Date Range Filter")
+
+                    date_col1, date_col2, date_col3 = st.columns([2, 1, 1])
+
+                    with date_col1:
+                        # Select date column if multiple exist
+                        if len(date_columns) > 1:
+                            selected_date_column = st.selectbox(
+                                "Select date column",
+                                options=date_columns,
+                                key=f"{session_key}_date_column",
+                                help="Choose which date column to filter by",
+                            )
+                        else:
+                            selected_date_column = date_columns[0]
+                            st.caption(f"📅 Filtering by: **{selected_date_column}**")
+
+                    with date_col2:
+                        start_date = st.date_input(
+                            "Start date",
+                            value=None,
+                            key=f"{session_key}_start_date",
+                            help="Filter rows from this date onwards (inclusive)",
+                        )
+
+                    with date_col3:
+                        end_date = st.date_input(
+                            "End date",
+                            value=None,
+                            key=f"{session_key}_end_date",
+                            help="Filter rows up to this date (inclusive)",
+                        )
+
+                    # Apply date filter if dates are selected
+                    if start_date is not None or end_date is not None:
+                        try:
+                            start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
+                            end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
+
+                            # Query the range in SQL so the row limit counts matching rows,
+                            # then refine in pandas for values SQLite cannot parse as dates
+                            filtered_df = _remember_frame(
+                                frame_key + (selected_date_column, start_datetime, end_datetime),
+                                lambda: filter_by_date_range(
+                                    load_dataframe(
+                                        session,
+                                        selected_id,
+                                        limit=row_limit,
+                                        include_image_columns=include_images,
+                                        order_by_recent=True,
+                                        date_column=selected_date_column,
+                                        start_date=start_datetime,
+                                        end_date=end_datetime,
+                                        search_term=search_term,
+                                    ),
+                                    selected_date_column,
+                                    start_datetime,
+                                    end_datetime,
+                                ),
+                            )
+
+                            st.info(f"📊 Date filter applied: {len(filtered_df):,} rows in range")
+                        except Exception as e:
+                            st.warning(f"⚠️ Date filter error: {e}")
+                            filtered_df = df  # Fallback to original
+
+                # Advanced filtering
+                filtered_df = render_dataframe_filter_ui(
+                    filtered_df, key_prefix=filter_key_prefix
+                )
+
+                st.markdown("---")
+
+                # Display DataFrame
+                st.subheader("Data Preview")
+                st.dataframe(
+                    filtered_df.head(_PREVIEW_ROW_LIMIT),
+                    use_container_width=True,
+                    height=600,
+                )
+                if len(filtered_df) > _PREVIEW_ROW_LIMIT:
+                    st.caption(
+                        f"Preview limited to the first {_PREVIEW_ROW_LIMIT:,} rows; "
+                        "the download includes all filtered rows."
+                    )
+
+                # Statistics
+                col_stat1, col_stat2, col_stat3 = st.columns(3)
+                with col_stat1:
+                    st.metric("Rows Loaded", len(df))
+                with col_stat2:
+                    st.metric("Rows After Filter", len(filtered_df))
+                with col_stat3:
+                    st.metric("Columns", len(df.columns))
+
+                # Download option (CSV is only built once requested, not on every rerun)
+                st.markdown("---")
+                if st.checkbox("Prepare CSV download", key=f"{session_key}_prepare_csv"):
+                    csv_data = dataframe_to_csv_bytes(filtered_df)
+                    download_filename = f"{display_name}_filtered.csv"
+                    st.download_button(
+                        "📥 Download Filtered Data (CSV)",
+                        data=csv_data,
+                        file_name=download_filename,
+                        mime="text/csv",
+                    )
+
+                # Show enriched dataset info if applicable
+                if enriched_info:
+                    with st.expander("ℹ️ Enriched Dataset Information"):
+                        for label, value in enriched_info.items():
+                            st.write(f"**{label}:** {value}")
+
+        except Exception as e:
+            st.error(f"Failed to load DataFrame: {e}")
+
 
 # Render uniform sidebar
 render_sidebar()
@@ -34,8 +272,8 @@ st.markdown("---")
 
 with get_session() as session:
     repo = DatasetRepository(session)
-    all_datasets = repo.get_all()
-    all_enriched_datasets = get_enriched_datasets(session)
+    all_datasets = list_datasets()
+    all_enriched_datasets = list_enriched_datasets()
     
     if not all_datasets and not all_enriched_datasets:
         st.info("No datasets initialized yet. Please initialize a dataset first.")
@@ -44,29 +282,32 @@ with get_session() as session:
     # Dataset selector - combine regular and enriched datasets
     st.subheader("Select Dataset")
     
-    dataset_options = {}
-    # Add regular datasets
-    for d in all_datasets:
-        dataset_options[f"{d.name} (Slot {d.slot_number})"] = ("dataset", d.id)
-    
-    # Add enriched datasets
-    for ed in all_enriched_datasets:
-        source_dataset = repo.get_by_id(ed.source_dataset_id)
-        source_name = source_dataset.name if source_dataset else f"Dataset {ed.source_dataset_id}"
-        dataset_options[f"⭐ {ed.name} (from {source_name})"] = ("enriched", ed.id)
+    # (type, id, label) per dataset; the selectbox returns the chosen tuple directly
+    dataset_options = [
+        ("dataset", d.id, f"{d.name} (Slot {d.slot_number})") for d in all_datasets
+    ]
+    dataset_options.extend(
+        (
+            "enriched",
+            ed.id,
+            f"⭐ {ed.name} (from {ed.source_name or f'Dataset {ed.source_dataset_id}'})",
+        )
+        for ed in all_enriched_datasets
+    )
     
     if not dataset_options:
         st.info("No datasets available. Please initialize a dataset first.")
         st.stop()
     
-    selected_dataset_name = st.selectbox(
+    selected_option = st.selectbox(
         "Choose a dataset to explore",
-        options=list(dataset_options.keys()),
+        options=dataset_options,
+        format_func=lambda option: option[2],
         key="dataframe_dataset_selector",
     )
     
-    if selected_dataset_name:
-        dataset_type, selected_id = dataset_options[selected_dataset_name]
+    if selected_option:
+        dataset_type, selected_id, _ = selected_option
         is_enriched = dataset_type == "enriched"
         
         if is_enriched:
@@ -87,11 +328,9 @@ with get_session() as session:
             session_key = f"{dataset_type}_{selected_id}"
             
             if is_enriched:
-                total_rows = get_enriched_dataset_row_count(session, selected_id)
                 has_image_columns = bool(selected_dataset.image_columns) if selected_dataset else False
                 display_name = selected_enriched_dataset.name if selected_enriched_dataset else "Unknown"
             else:
-                total_rows = get_dataset_row_count(session, selected_id)
                 has_image_columns = bool(selected_dataset.image_columns)
                 display_name = selected_dataset.name
             
@@ -132,152 +371,35 @@ with get_session() as session:
             if st.session_state.get("dataframe_loaded") and st.session_state.get(
                 "dataframe_dataset_key"
             ) == session_key:
-                try:
-                    with st.spinner(f"Loading {row_limit} rows..."):
-                        if is_enriched:
-                            df = load_enriched_dataset_dataframe(
-                                session,
-                                selected_id,
-                                limit=row_limit,
-                                include_image_columns=include_images,
-                                order_by_recent=True,
-                            )
-                        else:
-                            df = load_dataset_dataframe(
-                                session,
-                                selected_id,
-                                limit=row_limit,
-                                include_image_columns=include_images,
-                                order_by_recent=True,
-                            )
-                    
-                    if df.empty:
-                        st.info("Dataset is empty. Upload some data first.")
-                    else:
-                        st.success(f"✅ Loaded {len(df)} rows (Total in dataset: {total_rows:,})")
-                        
-                        # Detect date/datetime columns
-                        date_columns = []
-                        for col in df.columns:
-                            # Check if already datetime type
-                            if pd.api.types.is_datetime64_any_dtype(df[col]):
-                                date_columns.append(col)
-                            else:
-                                # Try to detect date columns by name and sample values
-                                col_lower = col.lower()
-                                if any(pattern in col_lower for pattern in ["date", "time", "created", "updated", "timestamp"]):
-                                    # Try to parse a sample value
-                                    sample = df[col].dropna().head(10)
-                                    if len(sample) > 0:
-                                        try:
-                                            pd.to_datetime(sample.iloc[0], errors="raise")
-                                            date_columns.append(col)
-                                        except (ValueError, TypeError):
-                                            pass
-                        
-                        # Date range filtering (only if date columns exist)
-                        filtered_df = df.copy()
-                        if date_columns:
-                            st.markdown("---")
-                            st.subheader("📅 Date Range Filter")
-                            
-                            date_col1, date_col2, date_col3 = st.columns([2, 1, 1])
-                            
-                            with date_col1:
-                                # Select date column if multiple exist
-                                if len(date_columns) > 1:
-                                    selected_date_column = st.selectbox(
-                                        "Select date column",
-                                        options=date_columns,
-                                        key=f"{session_key}_date_column",
-                                        help="Choose which date column to filter by",
-                                    )
-                                else:
-                                    selected_date_column = date_columns[0]
-                                    st.caption(f"📅 Filtering by: **{selected_date_column}**")
-                            
-                            with date_col2:
-                                start_date = st.date_input(
-                                    "Start date",
-                                    value=None,
-                                    key=f"{session_key}_start_date",
-                                    help="Filter rows from this date onwards (inclusive)",
-                                )
-                            
-                            with date_col3:
-                                end_date = st.date_input(
-                                    "End date",
-                                    value=None,
-                                    key=f"{session_key}_end_date",
-                                    help="Filter rows up to this date (inclusive)",
-                                )
-                            
-                            # Apply date filter if dates are selected
-                            if start_date is not None or end_date is not None:
-                                try:
-                                    start_datetime = datetime.combine(start_date, datetime.min.time()) if start_date else None
-                                    end_datetime = datetime.combine(end_date, datetime.max.time()) if end_date else None
-                                    
-                                    filtered_df = filter_by_date_range(
-                                        filtered_df,
-                                        selected_date_column,
-                                        start_datetime,
-                                        end_datetime,
-                                    )
-                                    
-                                    rows_filtered = len(df) - len(filtered_df)
-                                    if rows_filtered > 0:
-                                        st.info(f"📊 Date filter applied: {len(filtered_df):,} rows remain (filtered out {rows_filtered:,} rows)")
-                                except Exception as e:
-                                    st.warning(f"⚠️ Date filter error: {e}")
-                                    filtered_df = df.copy()  # Fallback to original
-                        
-                        # Advanced filtering
-                        filtered_df = render_dataframe_filter_ui(
-                            filtered_df, key_prefix=f"dataframe_{session_key}"
-                        )
-                        
-                        st.markdown("---")
-                        
-                        # Display DataFrame
-                        st.subheader("Data Preview")
-                        st.dataframe(
-                            filtered_df,
-                            use_container_width=True,
-                            height=600,
-                        )
-                        
-                        # Statistics
-                        col_stat1, col_stat2, col_stat3 = st.columns(3)
-                        with col_stat1:
-                            st.metric("Rows Loaded", len(df))
-                        with col_stat2:
-                            st.metric("Rows After Filter", len(filtered_df))
-                        with col_stat3:
-                            st.metric("Columns", len(df.columns))
-                        
-                        # Download option
-                        st.markdown("---")
-                        csv_data = filtered_df.to_csv(index=False)
-                        download_filename = f"{display_name}_filtered.csv"
-                        st.download_button(
-                            "📥 Download Filtered Data (CSV)",
-                            data=csv_data,
-                            file_name=download_filename,
-                            mime="text/csv",
+                # Counted only once data is requested, not on every visit to the page
+                if is_enriched:
+                    total_rows = get_enriched_dataset_row_count(session, selected_id)
+                else:
+                    total_rows = get_dataset_row_count(session, selected_id)
+                
+                enriched_info = None
+                if is_enriched and selected_enriched_dataset:
+                    columns_added = selected_enriched_dataset.columns_added
+                    enriched_info = {
+                        "Name": selected_enriched_dataset.name,
+                        "Source Dataset": source_dataset.name if source_dataset else "Unknown",
+                        "Enriched Columns": ", ".join(columns_added) if columns_added else "None",
+                    }
+                    if selected_enriched_dataset.last_sync_date:
+                        enriched_info["Last Synced"] = selected_enriched_dataset.last_sync_date.strftime(
+                            "%Y-%m-%d %H:%M:%S"
                         )
-                        
-                        # Show enriched dataset info if applicable
-                        if is_enriched and selected_enriched_dataset:
-                            with st.expander("ℹ️ Enriched Dataset Information"):
-                                st.write(f"**Name:** {selected_enriched_dataset.name}")
-                                st.write(f"**Source Dataset:** {source_dataset.name if source_dataset else 'Unknown'}")
-                                st.write(f"**Enriched Columns:** {', '.join(selected_enriched_dataset.columns_added) if selected_enriched_dataset.columns_added else 'None'}")
-                                if selected_enriched_dataset.last_sync_date:
-                                    st.write(f"**Last Synced:** {selected_enriched_dataset.last_sync_date.strftime('%Y-%m-%d %H:%M:%S')}")
                 
-                except Exception as e:
-                    st.error(f"Failed to load DataFrame: {e}")
+                _render_data_view(
+                    session_key,
+                    selected_id,
+                    is_enriched,
+                    row_limit,
+                    include_images,
+                    total_rows,
+                    display_name,
+                    enriched_info,
+                )
             else:
                 st.info("👆 Click 'Load Data' to explore the dataset")
 
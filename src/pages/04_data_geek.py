@@ -9,12 +9,13 @@ from typing import Optional
 import streamlit as st
 
 from src.database.connection import get_session
-from src.database.repository import DatasetRepository
+from src.database.repository import DataAnalysisRepository, DatasetRepository
 from src.services.analysis_service import (
     create_analysis,
     detect_date_columns,
     get_all_analyses,
-    load_filtered_dataset,
+    load_analysis_result,
+    load_dataset_sample,
 )
 from src.services.dataframe_service import get_dataset_columns
 from src.ui.components.analysis_container import render_analysis_container
@@ -49,22 +50,28 @@ with get_session() as session:
     st.subheader("📊 Dataset Selection & Filtering")
     
     # Dataset selector
-    dataset_options = {f"{d.name} (Slot {d.slot_number})": d.id for d in all_datasets}
-    selected_dataset_name = st.selectbox(
+    # Options are IDs (stable across reruns); labels and the selection come from datasets_by_id
+    datasets_by_id = {d.id: d for d in all_datasets}
+    selected_dataset_id = st.selectbox(
         "Select dataset",
-        options=list(dataset_options.keys()),
+        options=list(datasets_by_id),
+        format_func=lambda dataset_id: (
+            f"{datasets_by_id[dataset_id].name} (Slot {datasets_by_id[dataset_id].slot_number})"
+        ),
         key="data_geek_dataset_selector",
     )
     
-    if not selected_dataset_name:
+    if not selected_dataset_id:
         st.stop()
     
-    selected_dataset_id = dataset_options[selected_dataset_name]
-    selected_dataset = repo.get_by_id(selected_dataset_id)
+    selected_dataset = datasets_by_id[selected_dataset_id]
     
-    if not selected_dataset:
-        st.error("Selected dataset not found")
-        st.stop()
+    # One small sample (cached by the loader) serves date detection and column listing
+    try:
+        df_sample = load_dataset_sample(session, selected_dataset_id)
+    except Exception as e:
+        st.error(f"Failed to load dataset: {e}")
+        df_sample = None
     
     # Date range filtering
     st.markdown("**Date Range Filter (Optional)**")
@@ -78,10 +85,9 @@ with get_session() as session:
     date_range_end = None
     date_column = None
     
-    if use_date_filter:
-        # Load dataset to detect date columns
+    if use_date_filter and df_sample is not None:
+        # Detect date columns from the sample
         try:
-            df_sample = load_filtered_dataset(session, selected_dataset_id)
             date_columns = detect_date_columns(df_sample)
             
             with col_date2:
@@ -106,7 +112,7 @@ with get_session() as session:
                 st.warning("No date columns detected in dataset")
         
         except Exception as e:
-            st.warning(f"Could not load dataset for date detection: {e}")
+            st.warning(f"Could not detect date columns: {e}")
     
     # Convert date inputs to datetime
     if date_range_start:
@@ -121,11 +127,9 @@ with get_session() as session:
     st.markdown("Select an operation below to analyze your data:")
     
     # Get available columns for operations
-    try:
-        df_sample = load_filtered_dataset(session, selected_dataset_id)
+    if df_sample is not None:
         available_columns = [col for col in df_sample.columns if col != "uuid_value"]
-    except Exception as e:
-        st.error(f"Failed to load dataset: {e}")
+    else:
         available_columns = []
     
     # Get secondary datasets (exclude current)
@@ -135,28 +139,19 @@ with get_session() as session:
         if d.id != selected_dataset_id
     ]
     
-    # Operation configurations
-    operation_configs = []
-    
-    # GroupBy operation
-    groupby_config = render_groupby_config(available_columns, key_prefix="groupby")
-    if groupby_config:
-        operation_configs.append(groupby_config)
-    
-    # Pivot operation
-    pivot_config = render_pivot_config(available_columns, key_prefix="pivot")
-    if pivot_config:
-        operation_configs.append(pivot_config)
-    
-    # Merge operation
-    merge_config = render_merge_config(available_columns, secondary_datasets, key_prefix="merge")
-    if merge_config:
-        operation_configs.append(merge_config)
+    # Operation configuration renderers (each renders its own expander)
+    operation_renderers = [
+        (render_groupby_config, (available_columns,), "groupby"),
+        (render_pivot_config, (available_columns,), "pivot"),
+        (render_merge_config, (available_columns, secondary_datasets), "merge"),
+        (render_concat_config, (secondary_datasets,), "concat"),
+    ]
     
-    # Concat operation
-    concat_config = render_concat_config(secondary_datasets, key_prefix="concat")
-    if concat_config:
-        operation_configs.append(concat_config)
+    operation_configs = []
+    for render_config, render_args, key_prefix in operation_renderers:
+        op_config = render_config(*render_args, key_prefix=key_prefix)
+        if op_config:
+            operation_configs.append(op_config)
     
     # Process operation submissions
     for op_config in operation_configs:
@@ -193,30 +188,33 @@ with get_session() as session:
     if not all_analyses:
         st.info("No analyses created yet. Use the operations above to create your first analysis.")
     else:
-        # Check for visualization creation requests
-        for analysis in all_analyses:
-            viz_key = f"add_viz_{analysis.id}"
-            if viz_key in st.session_state and st.session_state[viz_key]:
-                try:
-                    from src.services.analysis_service import load_analysis_result
-                    from src.database.repository import DataAnalysisRepository
-                    
-                    result_df = load_analysis_result(analysis.result_file_path)
-                    
-                    st.markdown(f"**Add Visualization to: {analysis.name}**")
-                    viz_config = render_chart_type_selector(result_df, key_prefix=f"viz_{analysis.id}")
-                    
-                    if viz_config:
-                        # Update analysis with visualization config
-                        analysis.visualization_config = viz_config
-                        analysis_repo = DataAnalysisRepository(session)
-                        analysis_repo.update(analysis)
-                        del st.session_state[viz_key]
-                        st.success("Visualization added!")
-                        st.rerun()
-                except Exception as e:
-                    st.error(f"Failed to add visualization: {e}")
-                    logger.error(f"Visualization error: {e}", exc_info=True)
+        # Check for visualization creation requests (set by the "Add Chart" button)
+        viz_prefix = "add_viz_"
+        pending_viz_ids = {
+            int(key[len(viz_prefix):])
+            for key, requested in st.session_state.items()
+            if key.startswith(viz_prefix) and key[len(viz_prefix):].isdigit() and requested
+        }
+        pending_analyses = [a for a in all_analyses if a.id in pending_viz_ids] if pending_viz_ids else []
+        for analysis in pending_analyses:
+            viz_key = f"{viz_prefix}{analysis.id}"
+            try:
+                result_df = load_analysis_result(analysis.result_file_path)
+                
+                st.markdown(f"**Add Visualization to: {analysis.name}**")
+                viz_config = render_chart_type_selector(result_df, key_prefix=f"viz_{analysis.id}")
+                
+                if viz_config:
+                    # Update analysis with visualization config
+                    analysis.visualization_config = viz_config
+                    analysis_repo = DataAnalysisRepository(session)
+                    analysis_repo.update(analysis)
+                    del st.session_state[viz_key]
+                    st.success("Visualization added!")
+                    st.rerun()
+            except Exception as e:
+                st.error(f"Failed to add visualization: {e}")
+                logger.error(f"Visualization error: {e}", exc_info=True)
         
         # Display each analysis in a container
         for analysis in all_analyses:
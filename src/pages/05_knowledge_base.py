@@ -9,13 +9,11 @@ from collections import defaultdict
 from datetime import datetime
 
 from src.database.connection import get_session
-from src.database.repository import KnowledgeTableRepository
 from src.services.knowledge_service import (
     get_all_knowledge_tables,
-    get_knowledge_tables_by_type,
     initialize_knowledge_table,
 )
-from src.services.table_service import get_table_row_count
+from src.services.table_service import get_table_row_counts
 from src.ui.components.knowledge_container import render_knowledge_container
 from src.ui.components.knowledge_table_config import render_knowledge_table_config_ui
 from src.ui.components.sidebar import render_sidebar
@@ -32,10 +30,11 @@ st.markdown(
 st.markdown("---")
 
 with get_session() as session:
-    repo = KnowledgeTableRepository(session)
-    
     # Get all Knowledge Tables
     all_tables = get_all_knowledge_tables(session)
+    tables_by_id = {t.id: t for t in all_tables}
+    # Row counts for every table in one query, shared by the overview and selectors
+    row_counts = get_table_row_counts(session, [t.table_name for t in all_tables])
     
     # General Stats Section
     st.subheader("📊 Overview")
@@ -48,7 +47,7 @@ with get_session() as session:
         
         for table in all_tables:
             stats_by_type[table.data_type]["count"] += 1
-            row_count = get_table_row_count(session, table.table_name)
+            row_count = row_counts.get(table.table_name, 0)
             stats_by_type[table.data_type]["rows"] += row_count
             
             # Track latest updated timestamp
@@ -102,7 +101,7 @@ with get_session() as session:
                 
                 with st.expander(f"📋 {type_display} ({len(type_tables)} table{'s' if len(type_tables) != 1 else ''})", expanded=False):
                     for table in sorted(type_tables, key=lambda t: t.name):
-                        row_count = get_table_row_count(session, table.table_name)
+                        row_count = row_counts.get(table.table_name, 0)
                         updated_str = table.updated_at.strftime("%Y-%m-%d") if table.updated_at else "N/A"
                         
                         # Make table name clickable to select
@@ -178,25 +177,27 @@ with get_session() as session:
                     key=selected_data_type_key,
                 )
             
-            # Filter tables by selected data_type
-            filtered_tables = get_knowledge_tables_by_type(session, selected_data_type)
+            # Filter tables by selected data_type (all_tables is already ordered newest first per type)
+            filtered_tables = [t for t in all_tables if t.data_type == selected_data_type]
             
             with col2:
                 if filtered_tables:
-                    table_options = {
-                        f"{t.name} ({get_table_row_count(session, t.table_name)} rows, updated {t.updated_at.strftime('%Y-%m-%d') if t.updated_at else 'N/A'})": t.id
-                        for t in filtered_tables
-                    }
+                    def table_label(table_id: int) -> str:
+                        """Format a table option from its ID."""
+                        t = tables_by_id[table_id]
+                        updated_str = t.updated_at.strftime("%Y-%m-%d") if t.updated_at else "N/A"
+                        return f"{t.name} ({row_counts.get(t.table_name, 0)} rows, updated {updated_str})"
                     
-                    selected_table_name = st.selectbox(
+                    # Options are IDs (stable across reruns); labels and objects come from tables_by_id
+                    selected_table_id = st.selectbox(
                         "Select Knowledge Table",
-                        options=list(table_options.keys()),
+                        options=[t.id for t in filtered_tables],
+                        format_func=table_label,
                         key=f"knowledge_table_selector_{selected_data_type}",
                     )
                     
-                    if selected_table_name:
-                        selected_table_id = table_options[selected_table_name]
-                        selected_table = repo.get_by_id(selected_table_id)
+                    if selected_table_id:
+                        selected_table = tables_by_id[selected_table_id]
                         
                         # Store selected table ID in session state
                         st.session_state["selected_knowledge_table_id"] = selected_table_id
@@ -235,7 +236,7 @@ with get_session() as session:
     if selected_table is None:
         selected_table_id = st.session_state.get("selected_knowledge_table_id")
         if selected_table_id:
-            selected_table = repo.get_by_id(selected_table_id)
+            selected_table = tables_by_id.get(selected_table_id)
     
     if selected_table:
         st.markdown("---")
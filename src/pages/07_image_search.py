@@ -9,7 +9,7 @@ import pandas as pd
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_session
-from src.services.image_service import get_tables_with_image_columns
+from src.services.cached_listings import list_tables_with_image_columns
 from src.ui.components.image_detail_viewer import render_image_detail_viewer
 from src.ui.components.image_table_viewer import render_image_table_viewer
 
@@ -29,7 +29,7 @@ st.markdown(
 # Get database session
 with get_session() as session:
     # Get all tables with image columns
-    tables_with_images = get_tables_with_image_columns(session)
+    tables_with_images = list_tables_with_image_columns()
     
     if not tables_with_images:
         st.info(
@@ -83,48 +83,38 @@ with get_session() as session:
             
             # Display pinned detail viewers first (persistent)
             pinned_set_key = f"pinned_details_{selected_table['type']}_{selected_table['id']}"
-            if pinned_set_key in st.session_state:
-                pinned_indices = st.session_state[pinned_set_key]
-                # Convert to list if it's not already
-                if isinstance(pinned_indices, set):
-                    pinned_indices = list(pinned_indices)
-                if pinned_indices:
-                    st.markdown("---")
-                    st.subheader("📌 Pinned Details")
-                    for pinned_idx in sorted(pinned_indices):
-                        if 0 <= pinned_idx < len(df):
-                            # Get cached pinned row data or current row data
-                            pinned_data_key = f"pinned_row_data_{selected_table['type']}_{selected_table['id']}_{pinned_idx}"
-                            if pinned_data_key in st.session_state:
-                                # Use cached data (preserves original selection state)
-                                row_dict = st.session_state[pinned_data_key]
-                                # Convert dict back to Series with proper index
-                                row_data = pd.Series(row_dict)
-                            else:
-                                # Fallback to current DataFrame row (cache it for next time)
-                                row_data = df.iloc[pinned_idx]
-                                st.session_state[pinned_data_key] = row_data.to_dict()
-                            
-                            # Render pinned detail viewer
-                            render_image_detail_viewer(
-                                session=session,
-                                row_data=row_data,
-                                image_columns=selected_table["image_columns"],
-                                table_info=selected_table,
-                                row_index=pinned_idx,
-                                is_pinned=True,
-                            )
+            pinned_set = st.session_state.get(pinned_set_key, frozenset())
+            if pinned_set:
+                st.markdown("---")
+                st.subheader("📌 Pinned Details")
+                pinned_rows = [idx for idx in sorted(pinned_set) if 0 <= idx < len(df)]
+                pinned_data_prefix = f"pinned_row_data_{selected_table['type']}_{selected_table['id']}_"
+                
+                # Cache row data for pinned rows that have none yet, in one iloc call
+                # (cached data preserves the original selection state)
+                uncached_rows = [
+                    idx for idx in pinned_rows if f"{pinned_data_prefix}{idx}" not in st.session_state
+                ]
+                if uncached_rows:
+                    for idx, row_dict in zip(uncached_rows, df.iloc[uncached_rows].to_dict(orient="records")):
+                        st.session_state[f"{pinned_data_prefix}{idx}"] = row_dict
+                
+                for pinned_idx in pinned_rows:
+                    row_data = pd.Series(st.session_state[f"{pinned_data_prefix}{pinned_idx}"])
+                    
+                    # Render pinned detail viewer
+                    render_image_detail_viewer(
+                        session=session,
+                        row_data=row_data,
+                        image_columns=selected_table["image_columns"],
+                        table_info=selected_table,
+                        row_index=pinned_idx,
+                        is_pinned=True,
+                    )
             
             # Display detail viewer for currently selected row (if not already pinned)
             if selected_row_idx is not None:
-                # Check if this row is already pinned
-                is_currently_pinned = False
-                if pinned_set_key in st.session_state:
-                    pinned_list = st.session_state[pinned_set_key]
-                    # Convert to list if it's a set
-                    if isinstance(pinned_list, set):
-                        pinned_list = list(pinned_list)
-                    is_currently_pinned = selected_row_idx in pinned_list
+                is_currently_pinned = selected_row_idx in pinned_set
                 
                 if not is_currently_pinned:
                     if 0 <= selected_row_idx < len(df):
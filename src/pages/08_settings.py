@@ -9,6 +9,7 @@ from src.database.repository import DatasetRepository
 from src.services.dataset_service import delete_dataset, get_dataset_statistics
 from src.services.profile_service import (
     get_current_profile,
+    load_logo_bytes,
     update_profile_logo,
     update_profile_name,
 )
@@ -59,7 +60,10 @@ with get_session() as session:
             if profile.logo_path:
                 logo_path = Path(profile.logo_path)
                 if logo_path.exists():
-                    st.image(str(logo_path), use_container_width=True)
+                    st.image(
+                        load_logo_bytes(str(logo_path), logo_path.stat().st_mtime),
+                        use_container_width=True,
+                    )
                 else:
                     st.info("Logo file not found")
             else:
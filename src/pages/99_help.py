@@ -252,6 +252,18 @@ with tab5:
                 "install": "pip install python-dateutil",
                 "features": ["More date formats supported", "Better date parsing"],
             },
+            "orjson": {
+                "name": "orjson",
+                "description": "Fast JSON decoding",
+                "install": "pip install orjson",
+                "features": ["Faster database migrations on large enrichment catalogs"],
+            },
+            "ormsgpack": {
+                "name": "ormsgpack",
+                "description": "MessagePack serialization",
+                "install": "pip install ormsgpack",
+                "features": ["Smaller, faster-loading dataset and analysis configurations"],
+            },
         }
 
         for pkg in missing:
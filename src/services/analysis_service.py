@@ -12,9 +12,13 @@ import pandas as pd
 from sqlalchemy.orm import Session
 
 from src.config.settings import ANALYSIS_RESULTS_DIR, UNIQUE_ID_COLUMN_NAME
-from src.database.models import DataAnalysis, DatasetConfig
+from src.database.models import ANALYSIS_OPERATION_TYPES, DataAnalysis, DatasetConfig
 from src.database.repository import DataAnalysisRepository, DatasetRepository
-from src.services.dataframe_service import load_dataset_dataframe
+from src.services.dataframe_service import (
+    convert_to_arrow_strings,
+    detect_date_columns as _detect_frame_date_columns,
+    load_dataset_dataframe,
+)
 from src.services.export_service import filter_by_date_range
 from src.utils.errors import DatabaseError, ValidationError
 from src.utils.logging_config import get_logger
@@ -66,40 +70,43 @@ def load_filtered_dataset(
     return df
 
 
+def load_dataset_sample(session: Session, dataset_id: int, limit: int = 1000) -> pd.DataFrame:
+    """
+    Load the first rows of a dataset for column listing and date detection.
+    
+    Args:
+        session: Database session
+        dataset_id: Dataset ID
+        limit: Maximum number of rows to load
+        
+    Returns:
+        DataFrame with the dataset's non-image columns
+    """
+    return load_dataset_dataframe(
+        session=session,
+        dataset_id=dataset_id,
+        limit=limit,
+        offset=0,
+        include_image_columns=False,
+        order_by_recent=False,
+    )
+
+
 def detect_date_columns(df: pd.DataFrame) -> list[str]:
     """
     Detect date/datetime columns in DataFrame.
     
+    Uses the DataFrame view's detection (datetime dtypes, plus date-like
+    column names whose first value parses, in one to_datetime call) and
+    leaves out the unique ID column.
+    
     Args:
         df: DataFrame to analyze
         
     Returns:
         List of column names that appear to be dates
     """
-    date_columns = []
-    
-    for col in df.columns:
-        if col == UNIQUE_ID_COLUMN_NAME:
-            continue
-        
-        # Check if already datetime type
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            date_columns.append(col)
-            continue
-        
-        # Check column name patterns
-        col_lower = col.lower()
-        if any(pattern in col_lower for pattern in ["date", "time", "created", "updated", "timestamp"]):
-            # Try to convert sample values
-            try:
-                sample = df[col].dropna().head(10)
-                if len(sample) > 0:
-                    pd.to_datetime(sample.iloc[0], errors="raise")
-                    date_columns.append(col)
-            except (ValueError, TypeError):
-                pass
-    
-    return date_columns
+    return [col for col in _detect_frame_date_columns(df) if col != UNIQUE_ID_COLUMN_NAME]
 
 
 def execute_groupby(
@@ -398,7 +405,8 @@ def load_analysis_result(file_path: str) -> pd.DataFrame:
                 value=file_path,
             )
         
-        df = pd.read_parquet(path, engine="pyarrow")
+        # Load text columns as Arrow-backed strings instead of Python objects
+        df = convert_to_arrow_strings(pd.read_parquet(path, engine="pyarrow"))
         
         logger.info(f"Loaded analysis result from {file_path}: {len(df)} rows")
         return df
@@ -452,10 +460,9 @@ def create_analysis(
         date_column = validate_string_length(date_column, 255, "date_column")
     
     # Validate operation type
-    valid_operations = ["groupby", "pivot", "merge", "join", "concat", "apply", "map"]
-    if operation_type not in valid_operations:
+    if operation_type not in ANALYSIS_OPERATION_TYPES:
         raise ValidationError(
-            f"Invalid operation type: {operation_type}. Must be one of {valid_operations}",
+            f"Invalid operation type: {operation_type}. Must be one of {list(ANALYSIS_OPERATION_TYPES)}",
             field="operation_type",
             value=operation_type,
         )
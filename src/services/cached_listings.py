@@ -0,0 +1,74 @@
+"""
+Cached dataset listings for CSV Wrangler pages.
+
+Page selectors need only ids and names (or a table's column names), yet run
+on every Streamlit rerun. These helpers keep the listings in st.cache_data as
+plain values; create/delete paths clear them via invalidate_listing_cache().
+"""
+from typing import Any, Optional
+
+import streamlit as st
+
+from src.database.connection import get_readonly_session
+from src.database.repository import (
+    DatasetRepository,
+    DatasetSummary,
+    EnrichedDatasetRepository,
+    EnrichedDatasetSummary,
+)
+from src.services.image_service import get_tables_with_image_columns
+from src.services.table_service import get_table_column_names
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_datasets() -> list[DatasetSummary]:
+    """
+    Get all datasets as summaries, ordered by slot number.
+
+    Returns:
+        List of DatasetSummary instances
+    """
+    with get_readonly_session() as session:
+        return DatasetRepository(session).get_all_summaries()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_enriched_datasets(source_dataset_id: Optional[int] = None) -> list[EnrichedDatasetSummary]:
+    """
+    Get enriched datasets as summaries, newest first.
+
+    Args:
+        source_dataset_id: Optional source dataset ID to filter by
+
+    Returns:
+        List of EnrichedDatasetSummary instances
+    """
+    with get_readonly_session() as session:
+        return EnrichedDatasetRepository(session).get_all_summaries(source_dataset_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def list_table_columns(table_name: str) -> list[str]:
+    """
+    Get the column names of a data table.
+
+    Args:
+        table_name: Name of table
+
+    Returns:
+        List of column names (empty if the table does not exist)
+    """
+    with get_readonly_session() as session:
+        return get_table_column_names(session, table_name)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_tables_with_image_columns() -> list[dict[str, Any]]:
+    """
+    Get all datasets and enriched datasets that contain image columns.
+
+    Returns:
+        List of table info dictionaries (see get_tables_with_image_columns)
+    """
+    with get_readonly_session() as session:
+        return get_tables_with_image_columns(session)
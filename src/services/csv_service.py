@@ -45,7 +45,7 @@ def parse_csv_file(file_path: Path, encoding: Optional[str] = None, show_progres
         raise FileProcessingError("CSV file is empty")
 
     # Try specified encoding first, then auto-detect
-    encodings_to_try = [encoding] if encoding else CSV_ENCODINGS
+    encodings_to_try = (encoding,) if encoding else CSV_ENCODINGS
 
     last_error: Optional[Exception] = None
 
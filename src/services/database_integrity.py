@@ -8,7 +8,8 @@ from typing import Any
 from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 
-from src.database.models import DatasetConfig, EnrichedDataset, KnowledgeTable
+from src.database.models import DatasetConfig, EnrichedDataset
+from src.database.repository import KnowledgeTableRepository
 from src.utils.errors import DatabaseError
 from src.utils.logging_config import get_logger
 from src.utils.validation import quote_identifier, table_exists
@@ -63,6 +64,7 @@ def check_database_integrity(session: Session) -> dict[str, Any]:
             "note",
             "knowledge_table",
             "data_analysis",
+            "_migrations",
         }
         data_tables = all_tables - metadata_tables
         
@@ -96,8 +98,9 @@ def check_database_integrity(session: Session) -> dict[str, Any]:
                 })
         
         # Check Knowledge Tables
-        knowledge_tables = session.query(KnowledgeTable).all()
-        knowledge_table_names = {kt.table_name for kt in knowledge_tables}
+        knowledge_table_names = {
+            kt.table_name for kt in KnowledgeTableRepository(session).iter_all()
+        }
         
         # Find orphaned knowledge tables (table exists but no record)
         knowledge_tables_in_db = {t for t in data_tables if t.startswith("knowledge_")}
@@ -5,16 +5,20 @@ Provides utilities for loading dataset data into DataFrames
 with image column handling and efficient pagination.
 """
 import os
+from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from src.database.models import DatasetConfig, EnrichedDataset
+from src.services.table_service import get_table_max_rowid, get_table_row_count
 from src.utils.errors import DatabaseError, ValidationError
 from src.utils.logging_config import get_logger
+from src.utils.package_check import has_pyarrow
 from src.utils.validation import quote_identifier
 from src.utils.cache_manager import get_cache_version
 
@@ -30,6 +34,132 @@ def _is_test_mode() -> bool:
     )
 
 
+# SQLite datetime() output format, used for the date filter bounds
+_SQL_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _arrow_string_dtype() -> Optional[pd.StringDtype]:
+    """
+    Arrow-backed string dtype with NaN for missing values.
+    
+    This is the dtype pandas 3 infers for text by default (and pandas 2.x with
+    future.infer_string). Returns None without PyArrow or on pandas < 2.1.
+    """
+    if not has_pyarrow():
+        return None
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)  # pandas >= 2.3
+    except TypeError:
+        pass
+    try:
+        return pd.StringDtype("pyarrow_numpy")  # pandas 2.1 / 2.2
+    except (ValueError, ImportError):
+        return None
+
+
+_ARROW_STRING_DTYPE = _arrow_string_dtype()
+
+
+def convert_to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert text columns of a DataFrame to Arrow-backed strings.
+    
+    Converts columns explicitly rather than through the process-wide
+    future.infer_string option, which is not safe to toggle while other
+    Streamlit sessions build frames in their own threads. As with that
+    option, only object columns holding strings (and missing values) are
+    converted; mixed-type columns stay object.
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        DataFrame with Arrow-backed text columns, or df unchanged when
+        PyArrow is unavailable or there is nothing to convert
+    """
+    if _ARROW_STRING_DTYPE is None:
+        return df
+    string_columns = [
+        col for col, dtype in df.dtypes.items()
+        if dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+    ]
+    if not string_columns:
+        return df
+    return df.astype({col: _ARROW_STRING_DTYPE for col in string_columns})
+
+
+def _select_rows(
+    session: Session,
+    table_name: str,
+    columns_to_load: list[str],
+    limit: int,
+    offset: int,
+    order_by_recent: bool,
+    date_column: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    search_term: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Select rows of a data table into a DataFrame.
+    
+    With a date_column and at least one bound, the date range is applied in
+    SQL so LIMIT counts matching rows only. SQLite's datetime() understands
+    ISO-style text only; other values (different formats, numbers, NULL) are
+    kept for filter_by_date_range to decide, so the result is a superset of
+    what the pandas filter keeps.
+    
+    A search_term keeps rows where any loaded column contains it (LIKE,
+    which ignores ASCII case only). It is likewise a superset of the pandas
+    search in render_dataframe_filter_ui, which refines it.
+    """
+    quoted_columns = [quote_identifier(col) for col in columns_to_load]
+    columns_str = ", ".join(quoted_columns)
+    quoted_table = quote_identifier(table_name)
+    query = f"SELECT {columns_str} FROM {quoted_table}"
+    params: dict[str, str] = {}
+    conditions = []
+    
+    # Add date range filter
+    if date_column and (start_date or end_date):
+        quoted_date = quote_identifier(date_column)
+        bounds = []
+        if start_date:
+            bounds.append(f"datetime({quoted_date}) >= :start_date")
+            params["start_date"] = start_date.strftime(_SQL_DATETIME_FORMAT)
+        if end_date:
+            bounds.append(f"datetime({quoted_date}) <= :end_date")
+            params["end_date"] = end_date.strftime(_SQL_DATETIME_FORMAT)
+        conditions.append(
+            f"(typeof({quoted_date}) != 'text' OR datetime({quoted_date}) IS NULL"
+            f" OR ({' AND '.join(bounds)}))"
+        )
+    
+    # Add search filter (LIKE wildcards in the term are matched literally)
+    if search_term:
+        matches = [f"{col} LIKE :search_term ESCAPE '\\'" for col in quoted_columns]
+        conditions.append(f"({' OR '.join(matches)})")
+        escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params["search_term"] = f"%{escaped}%"
+    
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    
+    # Add ordering
+    if order_by_recent:
+        query += " ORDER BY rowid DESC"
+    
+    # Add limit and offset
+    query += f" LIMIT {limit}"
+    if offset > 0:
+        query += f" OFFSET {offset}"
+    
+    rows = session.execute(text(query), params).fetchall()
+    if not rows:
+        return pd.DataFrame(columns=columns_to_load)
+    return convert_to_arrow_strings(pd.DataFrame(rows, columns=columns_to_load))
+
+
 @st.cache_data(
     ttl=300,  # 5 minutes
     show_spinner=False,
@@ -43,6 +173,10 @@ def _load_dataset_dataframe_cached(
     offset: int,
     order_by_recent: bool,
     cache_version: int,
+    date_column: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    search_term: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Internal cached function for loading dataset DataFrame.
@@ -50,33 +184,13 @@ def _load_dataset_dataframe_cached(
     This function is cached and takes only hashable parameters.
     The session is obtained inside this function.
     """
-    from src.database.connection import get_session
-    
-    with get_session() as session:
-        # Build SELECT query
-        quoted_columns = [quote_identifier(col) for col in columns_to_load]
-        columns_str = ", ".join(quoted_columns)
-        quoted_table = quote_identifier(table_name)
-        query = f"SELECT {columns_str} FROM {quoted_table}"
-        
-        # Add ordering
-        if order_by_recent:
-            query += " ORDER BY rowid DESC"
-        
-        # Add limit and offset
-        query += f" LIMIT {limit}"
-        if offset > 0:
-            query += f" OFFSET {offset}"
-        
-        # Execute query
-        result = session.execute(text(query))
-        rows = result.fetchall()
-        
-        if not rows:
-            return pd.DataFrame(columns=columns_to_load)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(rows, columns=columns_to_load)
+    from src.database.connection import get_readonly_session
+    
+    with get_readonly_session() as session:
+        df = _select_rows(
+            session, table_name, columns_to_load, limit, offset, order_by_recent,
+            date_column, start_date, end_date, search_term,
+        )
         
         logger.debug(
             f"Cached load: {len(df)} rows from dataset {dataset_id} "
@@ -95,25 +209,18 @@ def _get_dataset_row_count_cached(
     table_name: str,
     dataset_id: int,
     cache_version: int,
+    max_rowid: int = 0,
 ) -> int:
-    """Internal cached function for getting row count."""
-    from src.database.connection import get_session
-    from src.utils.validation import table_exists
-    
-    with get_session() as session:
-        if not table_exists(session, table_name):
-            logger.warning(f"Table '{table_name}' does not exist. Returning 0 rows.")
-            return 0
-        
-        try:
-            quoted_table = quote_identifier(table_name)
-            query = text(f"SELECT COUNT(*) FROM {quoted_table}")
-            result = session.execute(query)
-            count = result.scalar() or 0
-            return count
-        except Exception as e:
-            logger.error(f"Failed to get row count: {e}", exc_info=True)
-            return 0
+    """
+    Internal cached function for getting row count.
+    
+    max_rowid is part of the cache key only: inserts from any session change
+    it, so the COUNT(*) is re-run after new rows arrive.
+    """
+    from src.database.connection import get_readonly_session
+    
+    with get_readonly_session() as session:
+        return get_table_row_count(session, table_name)
 
 
 def load_dataset_dataframe(
@@ -123,6 +230,10 @@ def load_dataset_dataframe(
     offset: int = 0,
     include_image_columns: bool = False,
     order_by_recent: bool = True,
+    date_column: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    search_term: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Load dataset data into DataFrame.
@@ -142,6 +253,10 @@ def load_dataset_dataframe(
         offset: Number of rows to skip (for pagination)
         include_image_columns: Whether to include image columns (default False)
         order_by_recent: Order by rowid DESC (most recent first, default True)
+        date_column: Optional column to filter by date range in SQL
+        start_date: Start date (inclusive) or None for no lower bound
+        end_date: End date (inclusive) or None for no upper bound
+        search_term: Optional text that at least one loaded column must contain
         
     Returns:
         DataFrame with dataset data
@@ -179,31 +294,19 @@ def load_dataset_dataframe(
                 col for col in columns_to_load if col not in dataset.image_columns
             ]
         
+        if date_column and date_column not in columns_to_load:
+            raise ValidationError(
+                f"Date column '{date_column}' not found in loaded columns",
+                field="date_column",
+                value=date_column,
+            )
+        
         # In test mode, bypass caching and use the passed session directly
         if _is_test_mode():
-            # Build SELECT query
-            quoted_columns = [quote_identifier(col) for col in columns_to_load]
-            columns_str = ", ".join(quoted_columns)
-            quoted_table = quote_identifier(dataset.table_name)
-            query = f"SELECT {columns_str} FROM {quoted_table}"
-            
-            # Add ordering
-            if order_by_recent:
-                query += " ORDER BY rowid DESC"
-            
-            # Add limit and offset
-            query += f" LIMIT {limit}"
-            if offset > 0:
-                query += f" OFFSET {offset}"
-            
-            # Execute query using the passed session
-            result = session.execute(text(query))
-            rows = result.fetchall()
-            
-            if not rows:
-                df = pd.DataFrame(columns=columns_to_load)
-            else:
-                df = pd.DataFrame(rows, columns=columns_to_load)
+            df = _select_rows(
+                session, dataset.table_name, columns_to_load, limit, offset, order_by_recent,
+                date_column, start_date, end_date, search_term,
+            )
         else:
             # Get cache version for invalidation
             cache_version = get_cache_version(dataset_id=dataset_id)
@@ -217,6 +320,10 @@ def load_dataset_dataframe(
                 offset=offset,
                 order_by_recent=order_by_recent,
                 cache_version=cache_version,
+                date_column=date_column,
+                start_date=start_date,
+                end_date=end_date,
+                search_term=search_term,
             )
         
         logger.info(
@@ -252,23 +359,9 @@ def get_dataset_row_count(session: Session, dataset_id: int) -> int:
     
     # In test mode, bypass caching and use the passed session directly
     if _is_test_mode():
-        from src.utils.validation import table_exists
-        
-        if not table_exists(session, dataset.table_name):
-            logger.warning(f"Table '{dataset.table_name}' does not exist. Returning 0 rows.")
-            return 0
-        
-        try:
-            quoted_table = quote_identifier(dataset.table_name)
-            query = text(f"SELECT COUNT(*) FROM {quoted_table}")
-            result = session.execute(query)
-            count = result.scalar() or 0
-            return count
-        except Exception as e:
-            logger.error(f"Failed to get row count: {e}", exc_info=True)
-            return 0
+        return get_table_row_count(session, dataset.table_name)
     else:
-        # Get cache version for invalidation
+        # Get cache version for invalidation; max_rowid also catches inserts from other sessions
         cache_version = get_cache_version(dataset_id=dataset_id)
         
         # Call cached function
@@ -276,6 +369,7 @@ def get_dataset_row_count(session: Session, dataset_id: int) -> int:
             table_name=dataset.table_name,
             dataset_id=dataset_id,
             cache_version=cache_version,
+            max_rowid=get_table_max_rowid(session, dataset.table_name),
         )
 
 
@@ -335,6 +429,10 @@ def _load_enriched_dataset_dataframe_cached(
     offset: int,
     order_by_recent: bool,
     cache_version: int,
+    date_column: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    search_term: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Internal cached function for loading enriched dataset DataFrame.
@@ -342,33 +440,13 @@ def _load_enriched_dataset_dataframe_cached(
     This function is cached and takes only hashable parameters.
     The session is obtained inside this function.
     """
-    from src.database.connection import get_session
-    
-    with get_session() as session:
-        # Build SELECT query
-        quoted_columns = [quote_identifier(col) for col in columns_to_load]
-        columns_str = ", ".join(quoted_columns)
-        quoted_table = quote_identifier(table_name)
-        query = f"SELECT {columns_str} FROM {quoted_table}"
-        
-        # Add ordering
-        if order_by_recent:
-            query += " ORDER BY rowid DESC"
-        
-        # Add limit and offset
-        query += f" LIMIT {limit}"
-        if offset > 0:
-            query += f" OFFSET {offset}"
-        
-        # Execute query
-        result = session.execute(text(query))
-        rows = result.fetchall()
-        
-        if not rows:
-            return pd.DataFrame(columns=columns_to_load)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(rows, columns=columns_to_load)
+    from src.database.connection import get_readonly_session
+    
+    with get_readonly_session() as session:
+        df = _select_rows(
+            session, table_name, columns_to_load, limit, offset, order_by_recent,
+            date_column, start_date, end_date, search_term,
+        )
         
         logger.debug(
             f"Cached load: {len(df)} rows from enriched dataset {enriched_dataset_id} "
@@ -387,25 +465,18 @@ def _get_enriched_dataset_row_count_cached(
     table_name: str,
     enriched_dataset_id: int,
     cache_version: int,
+    max_rowid: int = 0,
 ) -> int:
-    """Internal cached function for getting enriched dataset row count."""
-    from src.database.connection import get_session
-    from src.utils.validation import table_exists
-    
-    with get_session() as session:
-        if not table_exists(session, table_name):
-            logger.warning(f"Table '{table_name}' does not exist. Returning 0 rows.")
-            return 0
-        
-        try:
-            quoted_table = quote_identifier(table_name)
-            query = text(f"SELECT COUNT(*) FROM {quoted_table}")
-            result = session.execute(query)
-            count = result.scalar() or 0
-            return count
-        except Exception as e:
-            logger.error(f"Failed to get row count: {e}", exc_info=True)
-            return 0
+    """
+    Internal cached function for getting enriched dataset row count.
+    
+    max_rowid is part of the cache key only: inserts from any session change
+    it, so the COUNT(*) is re-run after new rows arrive.
+    """
+    from src.database.connection import get_readonly_session
+    
+    with get_readonly_session() as session:
+        return get_table_row_count(session, table_name)
 
 
 def load_enriched_dataset_dataframe(
@@ -415,6 +486,10 @@ def load_enriched_dataset_dataframe(
     offset: int = 0,
     include_image_columns: bool = False,
     order_by_recent: bool = True,
+    date_column: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    search_term: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Load enriched dataset data into DataFrame.
@@ -434,6 +509,10 @@ def load_enriched_dataset_dataframe(
         offset: Number of rows to skip (for pagination)
         include_image_columns: Whether to include image columns (default False)
         order_by_recent: Order by rowid DESC (most recent first, default True)
+        date_column: Optional column to filter by date range in SQL
+        start_date: Start date (inclusive) or None for no lower bound
+        end_date: End date (inclusive) or None for no upper bound
+        search_term: Optional text that at least one loaded column must contain
         
     Returns:
         DataFrame with enriched dataset data
@@ -462,31 +541,19 @@ def load_enriched_dataset_dataframe(
                     col for col in columns_to_load if col not in source_dataset.image_columns
                 ]
         
+        if date_column and date_column not in columns_to_load:
+            raise ValidationError(
+                f"Date column '{date_column}' not found in loaded columns",
+                field="date_column",
+                value=date_column,
+            )
+        
         # In test mode, bypass caching and use the passed session directly
         if _is_test_mode():
-            # Build SELECT query
-            quoted_columns = [quote_identifier(col) for col in columns_to_load]
-            columns_str = ", ".join(quoted_columns)
-            quoted_table = quote_identifier(enriched_dataset.enriched_table_name)
-            query = f"SELECT {columns_str} FROM {quoted_table}"
-            
-            # Add ordering
-            if order_by_recent:
-                query += " ORDER BY rowid DESC"
-            
-            # Add limit and offset
-            query += f" LIMIT {limit}"
-            if offset > 0:
-                query += f" OFFSET {offset}"
-            
-            # Execute query using the passed session
-            result = session.execute(text(query))
-            rows = result.fetchall()
-            
-            if not rows:
-                df = pd.DataFrame(columns=columns_to_load)
-            else:
-                df = pd.DataFrame(rows, columns=columns_to_load)
+            df = _select_rows(
+                session, enriched_dataset.enriched_table_name, columns_to_load, limit, offset, order_by_recent,
+                date_column, start_date, end_date, search_term,
+            )
         else:
             # Get cache version for invalidation
             cache_version = get_cache_version(enriched_dataset_id=enriched_dataset_id)
@@ -500,6 +567,10 @@ def load_enriched_dataset_dataframe(
                 offset=offset,
                 order_by_recent=order_by_recent,
                 cache_version=cache_version,
+                date_column=date_column,
+                start_date=start_date,
+                end_date=end_date,
+                search_term=search_term,
             )
         
         logger.info(
@@ -535,23 +606,9 @@ def get_enriched_dataset_row_count(session: Session, enriched_dataset_id: int) -
     
     # In test mode, bypass caching and use the passed session directly
     if _is_test_mode():
-        from src.utils.validation import table_exists
-        
-        if not table_exists(session, enriched_dataset.enriched_table_name):
-            logger.warning(f"Table '{enriched_dataset.enriched_table_name}' does not exist. Returning 0 rows.")
-            return 0
-        
-        try:
-            quoted_table = quote_identifier(enriched_dataset.enriched_table_name)
-            query = text(f"SELECT COUNT(*) FROM {quoted_table}")
-            result = session.execute(query)
-            count = result.scalar() or 0
-            return count
-        except Exception as e:
-            logger.error(f"Failed to get row count: {e}", exc_info=True)
-            return 0
+        return get_table_row_count(session, enriched_dataset.enriched_table_name)
     else:
-        # Get cache version for invalidation
+        # Get cache version for invalidation; max_rowid also catches inserts from other sessions
         cache_version = get_cache_version(enriched_dataset_id=enriched_dataset_id)
         
         # Call cached function
@@ -559,6 +616,7 @@ def get_enriched_dataset_row_count(session: Session, enriched_dataset_id: int) -
             table_name=enriched_dataset.enriched_table_name,
             enriched_dataset_id=enriched_dataset_id,
             cache_version=cache_version,
+            max_rowid=get_table_max_rowid(session, enriched_dataset.enriched_table_name),
         )
 
 
@@ -598,3 +656,38 @@ def get_enriched_dataset_columns(
         logger.error(f"Failed to get enriched dataset columns: {e}", exc_info=True)
         return []
 
+
+
+# Column-name fragments that suggest a column holds dates
+_DATE_NAME_PATTERNS = ("date", "time", "created", "updated", "timestamp")
+
+
+def detect_date_columns(df: pd.DataFrame) -> list[str]:
+    """
+    Detect date/datetime columns in a DataFrame.
+    
+    A column counts as a date column if it already has a datetime dtype, or if
+    its name suggests a date and its first non-null value parses as one. The
+    sample values of all candidate columns are parsed in one to_datetime call.
+    
+    Args:
+        df: DataFrame to inspect
+        
+    Returns:
+        Date column names, in DataFrame column order
+    """
+    datetime_columns = set(df.select_dtypes(include=["datetime", "datetimetz"]).columns)
+    candidates = [
+        col for col in df.columns
+        if col not in datetime_columns and any(p in str(col).lower() for p in _DATE_NAME_PATTERNS)
+    ]
+    
+    parsed_columns: set[str] = set()
+    if candidates and len(df) > 0:
+        first_values = df[candidates].bfill().iloc[0].dropna()
+        if not first_values.empty:
+            # format="mixed" parses each value on its own, like one scalar call per column
+            parsed = pd.to_datetime(first_values.astype(object), errors="coerce", format="mixed", utc=True)
+            parsed_columns = set(parsed.index[parsed.notna()])
+    
+    return [col for col in df.columns if col in datetime_columns or col in parsed_columns]
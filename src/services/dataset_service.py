@@ -10,7 +10,19 @@ from typing import Any, Optional
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy import Column, Integer, MetaData, String, Table, Text, create_engine, inspect, text
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    bindparam,
+    create_engine,
+    inspect,
+    select,
+    text,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -36,10 +48,21 @@ from src.utils.validation import (
     validate_image_columns,
     validate_string_length,
 )
-from src.utils.cache_manager import get_cache_version, invalidate_dataset_cache
+from src.utils.cache_manager import (
+    get_cache_version,
+    invalidate_dataset_cache,
+    invalidate_listing_cache,
+)
 
 logger = get_logger(__name__)
 
+# Probe for an earlier upload of a filename; served by idx_upload_log_dataset_id_filename
+_Q_UPLOAD_FILENAME_EXISTS = (
+    select(UploadLog.id)
+    .where(UploadLog.dataset_id == bindparam("dataset_id"), UploadLog.filename == bindparam("filename"))
+    .limit(1)
+)
+
 # SQLite type mapping
 SQLITE_TYPE_MAP = {
     "TEXT": Text,
@@ -213,6 +236,7 @@ def initialize_dataset(
         session.refresh(dataset)
 
         logger.info(f"Initialized dataset '{name}' in slot {slot_number}")
+        invalidate_listing_cache()
 
         return dataset
 
@@ -270,13 +294,11 @@ def check_duplicate_filename(
     Raises:
         DuplicateFileError: If filename already exists for this dataset
     """
-    existing = (
-        session.query(UploadLog)
-        .filter_by(dataset_id=dataset_id, filename=filename)
-        .first()
-    )
+    existing = session.execute(
+        _Q_UPLOAD_FILENAME_EXISTS, {"dataset_id": dataset_id, "filename": filename}
+    ).scalar()
 
-    if existing:
+    if existing is not None:
         raise DuplicateFileError(filename=filename, dataset_id=dataset_id)
 
 
@@ -425,9 +447,9 @@ def _get_dataset_statistics_cached(
     This function is cached and takes only hashable parameters.
     The session is obtained inside this function.
     """
-    from src.database.connection import get_session
+    from src.database.connection import get_readonly_session
     
-    with get_session() as session:
+    with get_readonly_session() as session:
         # Get row count - check if table exists first
         from src.utils.validation import quote_identifier, table_exists
         total_rows = 0
@@ -627,6 +649,7 @@ def delete_dataset(
         # Invalidate cache after successful deletion
         try:
             invalidate_dataset_cache(dataset_id)
+            invalidate_listing_cache()
         except Exception as cache_error:
             # Don't fail deletion if cache invalidation fails
             logger.warning(f"Failed to invalidate cache after deletion: {cache_error}")
@@ -33,7 +33,7 @@ from src.utils.validation import (
     validate_foreign_key,
     validate_string_length,
 )
-from src.utils.cache_manager import invalidate_enriched_dataset_cache
+from src.utils.cache_manager import invalidate_enriched_dataset_cache, invalidate_listing_cache
 
 logger = get_logger(__name__)
 
@@ -258,6 +258,7 @@ def create_enriched_dataset(
             f"Created enriched dataset '{name}' from dataset {source_dataset_id} "
             f"with {len(columns_added)} enriched columns"
         )
+        invalidate_listing_cache()
         
         return enriched_dataset
         
@@ -553,6 +554,7 @@ def delete_enriched_dataset(
         # Let context manager commit
         
         logger.info(f"Deleted enriched dataset {enriched_dataset_id} and table {table_name}")
+        invalidate_listing_cache()
         
     except Exception as e:
         # Rollback will happen in context manager
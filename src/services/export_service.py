@@ -3,10 +3,12 @@ Export service for CSV Wrangler.
 
 Handles exporting datasets to CSV and Pickle formats with date filtering.
 """
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from src.config.settings import EXPORT_DATE_FORMAT, EXPORT_FILENAME_FORMAT
@@ -14,10 +16,20 @@ from src.database.models import DatasetConfig
 from src.database.repository import DatasetRepository
 from src.utils.errors import DatabaseError, ValidationError
 from src.utils.logging_config import get_logger
+from src.utils.package_check import has_pyarrow
 from src.utils.validation import quote_identifier
 
 logger = get_logger(__name__)
 
+# PyArrow's multithreaded CSV writer when available, else pandas' to_csv
+pa = pa_csv = None
+try:
+    if has_pyarrow():
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+except ImportError:
+    pass
+
 
 def filter_by_date_range(
     df: pd.DataFrame,
@@ -47,20 +59,58 @@ def filter_by_date_range(
             value=date_column,
         )
 
-    filtered_df = df.copy()
-
     # Convert date column to datetime if needed
-    if not pd.api.types.is_datetime64_any_dtype(filtered_df[date_column]):
-        filtered_df[date_column] = pd.to_datetime(filtered_df[date_column])
+    dates = df[date_column]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
 
-    # Apply filters
+    # Apply both bounds as one mask and select once, without copying df first
+    mask = np.ones(len(df), dtype=bool)
     if start_date is not None:
-        filtered_df = filtered_df[filtered_df[date_column] >= start_date]
+        mask &= (dates >= start_date).to_numpy()
 
     if end_date is not None:
-        filtered_df = filtered_df[filtered_df[date_column] <= end_date]
+        mask &= (dates <= end_date).to_numpy()
+
+    return df[mask].assign(**{date_column: dates[mask]})
+
 
-    return filtered_df
+def _is_arrow_csv_safe(df: pd.DataFrame) -> bool:
+    """Whether Arrow writes every column of df exactly as pandas' to_csv would."""
+    return all(
+        pd.api.types.is_string_dtype(df[col]) or pd.api.types.is_integer_dtype(df[col])
+        for col in df.columns
+    )
+
+
+def dataframe_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to UTF-8 CSV bytes, without the index.
+    
+    Writes straight into a bytes buffer with PyArrow when it is installed,
+    avoiding pandas' intermediate str. Arrow formats datetimes, booleans and
+    floats differently from pandas, so only all-string/integer frames take
+    that path; everything else (including mixed-type object columns) is
+    written by pandas, matching export_dataset_to_csv.
+    
+    Args:
+        df: DataFrame to serialize
+        
+    Returns:
+        CSV file contents
+    """
+    if pa_csv is not None and _is_arrow_csv_safe(df):
+        try:
+            buffer = io.BytesIO()
+            pa_csv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                buffer,
+                write_options=pa_csv.WriteOptions(quoting_style="needed"),
+            )
+            return buffer.getvalue()
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.debug(f"PyArrow CSV write failed, using pandas: {e}")
+    return df.to_csv(index=False).encode("utf-8")
 
 
 def export_dataset_to_csv(
@@ -196,6 +246,14 @@ def export_dataset_to_pickle(
                 date_column = date_columns[0]
                 df = filter_by_date_range(df, date_column, start_date, end_date)
 
+        # Arrow-backed string columns (see dataframe_service) can only be
+        # unpickled with pyarrow and pandas >= 2.1, so store plain object columns
+        string_columns = [
+            col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.StringDtype)
+        ]
+        if string_columns:
+            df = df.astype({col: object for col in string_columns})
+
         # Export to Pickle
         with open(output_path, "wb") as f:
             pickle.dump(df, f)
@@ -9,8 +9,9 @@ from typing import Literal
 import pandas as pd
 
 from src.config.settings import (
-    SUPPORTED_CSV_EXTENSIONS,
-    SUPPORTED_PICKLE_EXTENSIONS,
+    SUPPORTED_CSV_EXTENSIONS_SET,
+    SUPPORTED_FILE_EXTENSIONS,
+    SUPPORTED_PICKLE_EXTENSIONS_SET,
 )
 from src.services.csv_service import parse_csv_file
 from src.services.pickle_service import parse_pickle_file
@@ -37,14 +38,14 @@ def detect_file_type(file_path: Path) -> FileType:
     """
     extension = file_path.suffix.lower()
 
-    if extension in SUPPORTED_CSV_EXTENSIONS:
+    if extension in SUPPORTED_CSV_EXTENSIONS_SET:
         return "CSV"
-    elif extension in SUPPORTED_PICKLE_EXTENSIONS:
+    elif extension in SUPPORTED_PICKLE_EXTENSIONS_SET:
         return "PICKLE"
     else:
         raise ValidationError(
             f"Unsupported file type: {extension}. "
-            f"Supported: {SUPPORTED_CSV_EXTENSIONS + SUPPORTED_PICKLE_EXTENSIONS}",
+            f"Supported: {list(SUPPORTED_FILE_EXTENSIONS)}",
             field="file_type",
             value=extension,
         )
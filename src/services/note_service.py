@@ -3,12 +3,14 @@ Note service for CSV Wrangler.
 
 Handles note creation, retrieval, and deletion for the sidebar notepad feature.
 """
-from typing import Optional
+from typing import Any, Optional
 
+import streamlit as st
 from sqlalchemy.orm import Session
 
 from src.database.models import Note
 from src.database.repository import NoteRepository
+from src.utils.cache_manager import invalidate_note_cache
 from src.utils.errors import DatabaseError, ValidationError
 from src.utils.logging_config import get_logger
 
@@ -45,6 +47,7 @@ def create_note(
     note = Note(content=content.strip())
     repo = NoteRepository(session)
     created = repo.create(note)
+    invalidate_note_cache()
     
     logger.info(f"Created note: ID {created.id}")
     
@@ -65,6 +68,29 @@ def get_all_notes(session: Session) -> list[Note]:
     return repo.get_all()
 
 
+@st.cache_data(
+    ttl=30,
+    show_spinner=False,
+)
+def get_note_summaries() -> list[dict[str, Any]]:
+    """
+    Get all notes as plain values (newest first), cached across reruns.
+    
+    Used by the sidebar, which is rendered on every page run. Cleared by
+    invalidate_note_cache() whenever a note is created or deleted.
+    
+    Returns:
+        List of dictionaries with id, content and created_at
+    """
+    from src.database.connection import get_readonly_session
+
+    with get_readonly_session() as session:
+        return [
+            {"id": note.id, "content": note.content, "created_at": note.created_at}
+            for note in NoteRepository(session).get_all()
+        ]
+
+
 def delete_note(
     session: Session,
     note_id: int,
@@ -91,5 +117,6 @@ def delete_note(
         )
     
     repo.delete(note_id)
+    invalidate_note_cache()
     logger.info(f"Deleted note: ID {note_id}")
 
@@ -3,12 +3,15 @@ Profile service for CSV Wrangler.
 
 Handles user profile creation and management.
 """
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
 
+import streamlit as st
 from sqlalchemy.orm import Session
 
 from src.database.models import UserProfile
 from src.database.repository import UserProfileRepository
+from src.utils.cache_manager import invalidate_profile_cache
 from src.utils.errors import ValidationError
 from src.utils.logging_config import get_logger
 from src.utils.validation import validate_file_path, validate_string_length
@@ -50,6 +53,7 @@ def create_user_profile(
         wide_mode=True,     # Default to wide mode
     )
     created = repo.create(profile)
+    invalidate_profile_cache()
 
     logger.info(f"Created user profile: {created.name}")
 
@@ -70,6 +74,27 @@ def is_app_initialized(session: Session) -> bool:
     return repo.exists()
 
 
+def is_app_initialized_cached(session: Session) -> bool:
+    """
+    Check if the app has been initialized, remembering a positive answer in session state.
+    
+    A profile is never removed once created, so after the first True the
+    check no longer touches the database on reruns.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        True if profile exists, False otherwise
+    """
+    if st.session_state.get("app_initialized"):
+        return True
+    initialized = is_app_initialized(session)
+    if initialized:
+        st.session_state["app_initialized"] = True
+    return initialized
+
+
 def get_current_profile(session: Session) -> Optional[UserProfile]:
     """
     Get the current user profile.
@@ -84,6 +109,56 @@ def get_current_profile(session: Session) -> Optional[UserProfile]:
     return repo.get_first()
 
 
+@st.cache_data(
+    ttl=60,
+    show_spinner=False,
+)
+def get_profile_summary() -> Optional[dict[str, Any]]:
+    """
+    Get the display fields of the current user profile, cached across reruns.
+    
+    Returns plain values rather than a UserProfile so the result can be cached
+    and used after the session is closed. Cleared by invalidate_profile_cache()
+    whenever the profile is created or changed.
+    
+    Returns:
+        Dictionary with id, name, logo_path and created_at, or None if not initialized
+    """
+    from src.database.connection import get_readonly_session
+
+    with get_readonly_session() as session:
+        profile = UserProfileRepository(session).get_first()
+        if profile is None:
+            return None
+        return {
+            "id": profile.id,
+            "name": profile.name,
+            "logo_path": profile.logo_path,
+            "created_at": profile.created_at,
+        }
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=4,  # Only the current logo (and a replaced one) is ever needed
+)
+def load_logo_bytes(logo_path: str, mtime: float) -> bytes:
+    """
+    Read the logo image file, cached across reruns.
+    
+    The file's modification time is part of the cache key, so replacing the
+    logo file is picked up without explicit invalidation.
+    
+    Args:
+        logo_path: Path to the logo file
+        mtime: Modification time of the file (os.stat st_mtime)
+        
+    Returns:
+        Image file contents
+    """
+    return Path(logo_path).read_bytes()
+
+
 def update_profile_logo(
     session: Session,
     logo_path: str,
@@ -116,6 +191,7 @@ def update_profile_logo(
     profile.logo_path = logo_path
     session.commit()
     session.refresh(profile)
+    invalidate_profile_cache()
     
     logger.info(f"Updated logo for profile: {profile.name}")
     
@@ -154,6 +230,7 @@ def update_profile_name(
     # Update name
     profile.name = new_name.strip()
     updated = repo.update(profile)
+    invalidate_profile_cache()
     
     logger.info(f"Updated profile name to: {updated.name}")
     
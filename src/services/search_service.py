@@ -24,6 +24,56 @@ logger = get_logger(__name__)
 VALID_DATA_TYPES = ["phone_numbers", "emails", "web_domains"]
 
 
+# Presence lookups combined per UNION ALL statement (SQLite allows 500 terms in a compound SELECT)
+_PRESENCE_BATCH_SIZE = 200
+
+
+def _count_key_matches(
+    session: Session,
+    lookups: list[tuple[str, str]],
+    key_id: str,
+) -> list[Optional[int]]:
+    """
+    Count rows matching key_id in several (table, column) pairs.
+    
+    Each batch of lookups runs as one UNION ALL of indexed COUNT(*) queries.
+    If a batch fails (e.g. a table or column is missing), its lookups are
+    retried one by one so a single broken source does not hide the others.
+    
+    Args:
+        session: Database session
+        lookups: (table_name, column_name) pairs to search
+        key_id: Standardized Key_ID value
+        
+    Returns:
+        Match count per lookup, in order (None where the lookup failed)
+    """
+    counts: list[Optional[int]] = []
+    for start in range(0, len(lookups), _PRESENCE_BATCH_SIZE):
+        batch = lookups[start:start + _PRESENCE_BATCH_SIZE]
+        queries = [
+            f"SELECT {i} AS idx, COUNT(*) FROM {quote_identifier(table)} "
+            f"WHERE {quote_identifier(column)} = :key_id"
+            for i, (table, column) in enumerate(batch)
+        ]
+        try:
+            batch_counts: list[Optional[int]] = [0] * len(batch)
+            for idx, count in session.execute(text(" UNION ALL ".join(queries)), {"key_id": key_id}):
+                batch_counts[idx] = int(count)
+        except Exception as e:
+            logger.warning(f"Batched presence search failed, searching sources individually: {e}")
+            batch_counts = []
+            for (table, column), query in zip(batch, queries):
+                try:
+                    row = session.execute(text(query), {"key_id": key_id}).one()
+                    batch_counts.append(int(row[1]))
+                except Exception as e:
+                    logger.warning(f"Failed to search {table}.{column}: {e}")
+                    batch_counts.append(None)
+        counts.extend(batch_counts)
+    return counts
+
+
 def search_knowledge_base(
     session: Session,
     search_value: str,
@@ -98,30 +148,6 @@ def search_knowledge_base(
             kt for kt in all_knowledge_tables if kt.name in source_filters
         ]
     
-    # Search Knowledge Tables (fast - uses Key_ID index)
-    knowledge_table_results = []
-    for kt in all_knowledge_tables:
-        try:
-            # Use indexed Key_ID column for fast lookup
-            quoted_table = quote_identifier(kt.table_name)
-            quoted_key_id = quote_identifier("Key_ID")
-            count_query = text(
-                f"SELECT COUNT(*) FROM {quoted_table} WHERE {quoted_key_id} = :key_id"
-            )
-            result = session.execute(count_query, {"key_id": standardized_key_id})
-            row_count = result.scalar() or 0
-            
-            knowledge_table_results.append({
-                "table_name": kt.table_name,
-                "table_id": kt.id,
-                "name": kt.name,
-                "row_count": int(row_count),
-                "has_data": row_count > 0,
-            })
-        except Exception as e:
-            logger.warning(f"Failed to search Knowledge Table {kt.name}: {e}")
-            continue
-    
     # Get all enriched datasets with matching function type
     all_enriched = session.query(EnrichedDataset).all()
     matching_enriched = [
@@ -138,8 +164,8 @@ def search_knowledge_base(
             if str(ed.id) in source_filters or ed.name in source_filters
         ]
     
-    # Search enriched datasets (fast - uses enriched column indexes)
-    enriched_dataset_results = []
+    # Collect the enriched columns to search
+    enriched_candidates = []
     for enriched_dataset in matching_enriched:
         # Ensure columns_added is a list (it's stored as JSON, might be None or wrong type)
         if not enriched_dataset.columns_added:
@@ -186,38 +212,47 @@ def search_knowledge_base(
                 )
                 continue
             
-            try:
-                # Use indexed enriched column for fast lookup
-                # Note: enriched_col_name is already sanitized (no spaces), but quote for safety
-                quoted_table = quote_identifier(enriched_dataset.enriched_table_name)
-                quoted_col = quote_identifier(enriched_col_name)
-                count_query = text(
-                    f"SELECT COUNT(*) FROM {quoted_table} "
-                    f"WHERE {quoted_col} = :key_id"
-                )
-                result = session.execute(count_query, {"key_id": standardized_key_id})
-                row_count = result.scalar() or 0
-                
-                logger.debug(
-                    f"Search in enriched dataset {enriched_dataset.name} "
-                    f"column {enriched_col_name}: {row_count} rows found"
-                )
-                
-                enriched_dataset_results.append({
-                    "dataset_id": enriched_dataset.id,
-                    "name": enriched_dataset.name,
-                    "enriched_table_name": enriched_dataset.enriched_table_name,
-                    "source_column": col_name,
-                    "enriched_column": enriched_col_name,
-                    "row_count": int(row_count),
-                })
-            except Exception as e:
-                logger.warning(
-                    f"Failed to search enriched dataset {enriched_dataset.name} "
-                    f"column {enriched_col_name}: {e}",
-                    exc_info=True
-                )
-                continue
+            enriched_candidates.append((enriched_dataset, col_name, enriched_col_name))
+    
+    # Count matches in every source with one batched statement (indexed lookups)
+    lookups = [(kt.table_name, "Key_ID") for kt in all_knowledge_tables] + [
+        (ed.enriched_table_name, enriched_col_name)
+        for ed, _, enriched_col_name in enriched_candidates
+    ]
+    counts = _count_key_matches(session, lookups, standardized_key_id)
+    kt_counts = counts[:len(all_knowledge_tables)]
+    enriched_counts = counts[len(all_knowledge_tables):]
+    
+    knowledge_table_results = [
+        {
+            "table_name": kt.table_name,
+            "table_id": kt.id,
+            "name": kt.name,
+            "row_count": row_count,
+            "has_data": row_count > 0,
+        }
+        for kt, row_count in zip(all_knowledge_tables, kt_counts)
+        if row_count is not None
+    ]
+    
+    enriched_dataset_results = []
+    for (enriched_dataset, col_name, enriched_col_name), row_count in zip(
+        enriched_candidates, enriched_counts
+    ):
+        if row_count is None:
+            continue
+        logger.debug(
+            f"Search in enriched dataset {enriched_dataset.name} "
+            f"column {enriched_col_name}: {row_count} rows found"
+        )
+        enriched_dataset_results.append({
+            "dataset_id": enriched_dataset.id,
+            "name": enriched_dataset.name,
+            "enriched_table_name": enriched_dataset.enriched_table_name,
+            "source_column": col_name,
+            "enriched_column": enriched_col_name,
+            "row_count": row_count,
+        })
     
     # Calculate statistics
     total_sources = len(knowledge_table_results) + len(enriched_dataset_results)
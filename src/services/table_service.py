@@ -8,6 +8,7 @@ from typing import Any, Optional
 
 import pandas as pd
 from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, inspect, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from src.utils.errors import DatabaseError, ValidationError
@@ -291,17 +292,101 @@ def get_table_row_count(session: Session, table_name: str) -> int:
         Number of rows in table
     """
     try:
-        # Quote table name for safety
+        # Quote table name for safety; a driver-level statement skips SQL compilation
         quoted_table = quote_identifier(table_name)
-        query = text(f"SELECT COUNT(*) FROM {quoted_table}")
-        result = session.execute(query)
-        count = result.scalar() or 0
-        return count
+        return session.connection().exec_driver_sql(f"SELECT COUNT(*) FROM {quoted_table}").scalar() or 0
+    except OperationalError as e:
+        if "no such table" in str(e):
+            logger.warning(f"Table '{table_name}' does not exist. Returning 0 rows.")
+        else:
+            logger.error(f"Failed to get row count: {e}", exc_info=True)
+        return 0
     except Exception as e:
         logger.error(f"Failed to get row count: {e}", exc_info=True)
         return 0
 
 
+# Tables counted per UNION ALL statement (SQLite allows 500 terms in a compound SELECT)
+_ROW_COUNT_BATCH_SIZE = 200
+
+
+def get_table_row_counts(session: Session, table_names: list[str]) -> dict[str, int]:
+    """
+    Get row counts for several tables in one statement.
+    
+    Counts are combined with UNION ALL, one statement per batch of tables.
+    If a batch fails (e.g. one table is missing), its tables are counted
+    one by one with get_table_row_count.
+    
+    Args:
+        session: Database session
+        table_names: Names of tables
+        
+    Returns:
+        Dictionary mapping table name to row count
+    """
+    counts: dict[str, int] = {}
+    unique_names = list(dict.fromkeys(table_names))
+    connection = session.connection()
+    for start in range(0, len(unique_names), _ROW_COUNT_BATCH_SIZE):
+        batch = unique_names[start:start + _ROW_COUNT_BATCH_SIZE]
+        query = " UNION ALL ".join(
+            f"SELECT {i} AS idx, COUNT(*) FROM {quote_identifier(name)}"
+            for i, name in enumerate(batch)
+        )
+        try:
+            for idx, count in connection.exec_driver_sql(query):
+                counts[batch[idx]] = count
+        except OperationalError as e:
+            logger.warning(f"Batched row count failed, counting tables individually: {e}")
+            for name in batch:
+                counts[name] = get_table_row_count(session, name)
+    return counts
+
+
+def get_table_max_rowid(session: Session, table_name: str) -> int:
+    """
+    Get the largest rowid in a table.
+    
+    SQLite answers MAX(rowid) from the end of the table b-tree, so unlike
+    COUNT(*) this does not scan the table. It grows with every insert, which
+    makes it a cheap change marker for cached row counts.
+    
+    Args:
+        session: Database session
+        table_name: Name of table
+        
+    Returns:
+        Largest rowid (0 if the table is empty or doesn't exist)
+    """
+    try:
+        quoted_table = quote_identifier(table_name)
+        return session.connection().exec_driver_sql(f"SELECT MAX(rowid) FROM {quoted_table}").scalar() or 0
+    except OperationalError as e:
+        if "no such table" not in str(e):
+            logger.error(f"Failed to get max rowid: {e}", exc_info=True)
+        return 0
+
+
+def get_table_column_names(session: Session, table_name: str) -> list[str]:
+    """
+    Get column names of a table in definition order.
+    
+    Reads PRAGMA table_info directly instead of reflecting the table through
+    the SQLAlchemy inspector.
+    
+    Args:
+        session: Database session
+        table_name: Name of table
+        
+    Returns:
+        List of column names (empty if the table does not exist)
+    """
+    quoted_table = quote_identifier(table_name)
+    rows = session.connection().exec_driver_sql(f"PRAGMA table_info({quoted_table})")
+    return [row[1] for row in rows]
+
+
 def get_new_rows_since_sync(
     session: Session,
     source_table_name: str,
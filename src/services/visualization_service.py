@@ -92,7 +92,7 @@ def detect_data_characteristics(df: pd.DataFrame) -> dict[str, Any]:
             characteristics["has_time_series"] = True
         
         # Check categorical (string/object with limited unique values)
-        elif df[col].dtype == "object" or df[col].dtype.name == "category":
+        elif pd.api.types.is_string_dtype(df[col].dtype) or df[col].dtype.name == "category":
             unique_count = df[col].nunique()
             total_count = len(df)
             unique_ratio = unique_count / total_count if total_count > 0 else 0
@@ -0,0 +1,37 @@
+"""
+Integration tests for database connection maintenance helpers.
+"""
+from sqlalchemy import text
+
+from src.database import connection
+from src.database.connection import checkpoint_wal, make_engine
+
+
+class TestCheckpointWal:
+    """Test WAL checkpointing and free-page reclamation."""
+
+    def test_checkpoint_wal_frees_batch_of_pages(self, tmp_path, monkeypatch):
+        """incremental_vacuum runs to completion rather than freeing one page."""
+        engine = make_engine(f"sqlite:///{tmp_path / 'vacuum.db'}")
+        monkeypatch.setattr(connection, "get_engine", lambda: engine)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE filler (data BLOB)"))
+                conn.execute(text(
+                    "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 200) "
+                    "INSERT INTO filler SELECT zeroblob(4000) FROM n"
+                ))
+                conn.execute(text("DROP TABLE filler"))
+
+            with engine.connect() as conn:
+                before = conn.execute(text("PRAGMA freelist_count")).scalar()
+            assert before > 1
+
+            checkpoint_wal()
+
+            with engine.connect() as conn:
+                after = conn.execute(text("PRAGMA freelist_count")).scalar()
+            assert before - after > 1
+            assert after == 0
+        finally:
+            engine.dispose()
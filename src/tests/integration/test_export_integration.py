@@ -10,7 +10,11 @@ from datetime import datetime, timedelta
 pytestmark = pytest.mark.integration
 
 from src.services.dataset_service import initialize_dataset, upload_csv_to_dataset
-from src.services.export_service import export_dataset_to_csv, filter_by_date_range
+from src.services.export_service import (
+    export_dataset_to_csv,
+    export_dataset_to_pickle,
+    filter_by_date_range,
+)
 
 
 class TestExportIntegration:
@@ -54,6 +58,41 @@ class TestExportIntegration:
         assert "name" in exported_df.columns
         assert "value" in exported_df.columns
 
+    def test_export_dataset_to_pickle_uses_object_strings(self, test_session, tmp_path):
+        """Test that pickled text columns don't depend on pyarrow to load."""
+        columns_config = {
+            "name": {"type": "TEXT", "is_image": False},
+            "value": {"type": "INTEGER", "is_image": False}
+        }
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Pickle Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        csv_file = tmp_path / "source.csv"
+        csv_file.write_text("name,value\nJohn,100\nJane,200", encoding="utf-8")
+        upload_csv_to_dataset(
+            session=test_session,
+            dataset_id=dataset.id,
+            csv_file=csv_file,
+            filename="source.csv"
+        )
+        
+        output_path = tmp_path / "export.pkl"
+        export_dataset_to_pickle(
+            session=test_session,
+            dataset_id=dataset.id,
+            output_path=output_path
+        )
+        
+        exported_df = pd.read_pickle(output_path)
+        assert len(exported_df) == 2
+        assert exported_df["name"].dtype == object
+        assert not any(isinstance(dtype, pd.StringDtype) for dtype in exported_df.dtypes)
+
     def test_filter_by_date_range_basic(self):
         """Test filtering DataFrame by date range."""
         # Create DataFrame with dates
@@ -83,7 +83,7 @@ class TestPinningIntegration:
         # Simulate session state after pinning
         import streamlit as st
         if pinned_set_key not in st.session_state:
-            st.session_state[pinned_set_key] = []
+            st.session_state[pinned_set_key] = set()
         
         # This test verifies the logic - actual pinning requires Streamlit context
         # We verify that the structure supports multiple pinned rows
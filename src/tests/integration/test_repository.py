@@ -4,10 +4,21 @@ Integration tests for Repository pattern.
 Tests data access layer with real database operations.
 """
 import pytest
-
-from src.database.models import DatasetConfig, UploadLog, UserProfile
+from sqlalchemy import text
+
+from src.database.connection import count_queries
+from src.database.models import (
+    DataAnalysis,
+    DatasetConfig,
+    EnrichedDataset,
+    UploadLog,
+    UserProfile,
+    list_with_sources,
+)
 from src.database.repository import (
     DatasetRepository,
+    DatasetSummary,
+    EnrichedDatasetRepository,
     UploadLogRepository,
     UserProfileRepository,
 )
@@ -36,6 +47,27 @@ class TestDatasetRepository:
         assert retrieved is not None
         assert retrieved.name == "Test Dataset"
 
+    def test_create_does_not_reselect_row(self, test_session):
+        """Test that create() is a single INSERT and the result stays usable when detached."""
+        repo = DatasetRepository(test_session)
+        dataset = DatasetConfig(
+            name="Single Insert",
+            slot_number=1,
+            table_name="single_insert_table",
+            columns_config={"name": {"type": "TEXT"}},
+            duplicate_filter_column="name",
+            image_columns=[],
+        )
+
+        with count_queries(test_session.get_bind()) as queries:
+            created = repo.create(dataset)
+
+        assert len(queries) == 1
+        assert queries[0].startswith("INSERT")
+        test_session.expunge(created)
+        assert created.created_at is not None
+        assert created.duplicate_filter_column == "name"
+
     def test_get_by_slot(self, test_session):
         """Test getting dataset by slot number."""
         repo = DatasetRepository(test_session)
@@ -55,6 +87,26 @@ class TestDatasetRepository:
         assert retrieved is not None
         assert retrieved.slot_number == 2
 
+    def test_get_by_slot_cache_follows_changes(self, test_session):
+        """Test that cached slot/name lookups see moved and deleted datasets."""
+        repo = DatasetRepository(test_session)
+        created = repo.create(
+            DatasetConfig(name="Cached", slot_number=3, table_name="cached_table", columns_config={})
+        )
+        assert repo.get_by_slot(3).id == created.id
+        assert repo.get_by_name("Cached").id == created.id
+
+        created.slot_number = 4
+        repo.update(created)
+        assert repo.get_by_slot(3) is None
+        assert repo.get_by_slot(4).id == created.id
+
+        # Changed outside the repository: the stale entry is detected and dropped
+        test_session.execute(text("UPDATE dataset_config SET name = 'Renamed'"))
+        test_session.expire_all()
+        assert repo.get_by_name("Cached") is None
+        assert repo.get_by_name("Renamed").id == created.id
+
     def test_get_all_datasets(self, test_session):
         """Test getting all datasets."""
         repo = DatasetRepository(test_session)
@@ -71,8 +123,33 @@ class TestDatasetRepository:
             )
             repo.create(dataset)
 
-        all_datasets = repo.get_all()
+        with count_queries(test_session.get_bind()) as queries:
+            all_datasets = repo.get_all()
+            datasets_by_slot = {d.slot_number: d for d in all_datasets}
+            assert [datasets_by_slot[i].name for i in range(1, 4)] == [
+                "Dataset 1", "Dataset 2", "Dataset 3"
+            ]
+
         assert len(all_datasets) == 3
+        # Datasets plus their selectin-loaded upload logs, not one query per slot
+        assert len(queries) == 2
+
+    def test_get_all_summaries(self, test_session):
+        """Test listing datasets as lightweight summaries in a single query."""
+        repo = DatasetRepository(test_session)
+        for slot in (2, 1):
+            repo.create(
+                DatasetConfig(
+                    name=f"Dataset {slot}", slot_number=slot, table_name=f"table_{slot}", columns_config={}
+                )
+            )
+
+        with count_queries(test_session.get_bind()) as queries:
+            summaries = repo.get_all_summaries()
+
+        assert [(s.name, s.slot_number) for s in summaries] == [("Dataset 1", 1), ("Dataset 2", 2)]
+        assert all(isinstance(s, DatasetSummary) for s in summaries)
+        assert len(queries) == 1
 
     def test_update_dataset(self, test_session):
         """Test updating a dataset."""
@@ -93,6 +170,20 @@ class TestDatasetRepository:
 
         assert updated.name == "Updated Name"
 
+    def test_update_reloads_updated_at(self, test_session):
+        """Test that update() leaves the trigger-set updated_at loaded for detached use."""
+        repo = DatasetRepository(test_session)
+        created = repo.create(
+            DatasetConfig(name="Original", slot_number=1, table_name="test_table", columns_config={})
+        )
+
+        created.name = "Renamed"
+        updated = repo.update(created)
+        test_session.expunge(updated)
+
+        assert updated.updated_at is not None
+        assert updated.name == "Renamed"
+
     def test_delete_dataset(self, test_session):
         """Test deleting a dataset."""
         repo = DatasetRepository(test_session)
@@ -115,6 +206,34 @@ class TestDatasetRepository:
         assert deleted is None
 
 
+    def test_columns_config_round_trip_and_legacy_json(self, test_session):
+        """Test config columns round-trip and still read rows stored as JSON text."""
+        repo = DatasetRepository(test_session)
+        columns_config = {"name": {"type": "TEXT", "is_image": False}}
+        created = repo.create(
+            DatasetConfig(
+                name="Binary Config",
+                slot_number=1,
+                table_name="binary_table",
+                columns_config=columns_config,
+            )
+        )
+        dataset_id = created.id
+
+        # Row written before config columns were stored as binary
+        test_session.execute(
+            text(
+                "INSERT INTO dataset_config (name, slot_number, table_name, columns_config, image_columns) "
+                "VALUES ('Legacy', 2, 'legacy_table', '{\"age\": {\"type\": \"INTEGER\"}}', '[]')"
+            )
+        )
+        test_session.commit()
+        test_session.expunge_all()
+
+        assert repo.get_by_id(dataset_id).columns_config == columns_config
+        assert repo.get_by_slot(2).columns_config == {"age": {"type": "INTEGER"}}
+
+
 class TestUploadLogRepository:
     """Test UploadLogRepository."""
 
@@ -177,6 +296,57 @@ class TestUploadLogRepository:
         logs = repo.get_by_dataset_id(dataset.id)
         assert len(logs) == 3
 
+    def test_get_by_dataset_id_loads_dataset(self, test_session):
+        """Test that upload logs come back with their dataset loaded."""
+        dataset = DatasetConfig(
+            name="Test Dataset", slot_number=1, table_name="test_table", columns_config={}
+        )
+        test_session.add(dataset)
+        test_session.commit()
+        dataset_id = dataset.id
+        UploadLog.bulk_copy(
+            test_session,
+            [{"dataset_id": dataset_id, "filename": "a.csv", "file_type": "CSV", "row_count": 1}],
+        )
+        test_session.commit()
+        test_session.expunge_all()
+
+        with count_queries(test_session.get_bind()) as queries:
+            logs = UploadLogRepository(test_session).get_by_dataset_id(dataset_id)
+
+        # UploadLog.dataset is raise_on_sql, so this fails unless it was eager-loaded
+        assert logs[0].dataset.name == "Test Dataset"
+        # Logs plus one selectin load for the dataset
+        assert len(queries) == 2
+
+    def test_create_many_upload_logs(self, test_session):
+        """Test creating a batch of upload logs with one flush."""
+        dataset = DatasetConfig(
+            name="Test Dataset",
+            slot_number=1,
+            table_name="test_table",
+            columns_config={"name": {"type": "TEXT"}},
+            duplicate_filter_column="name",
+            image_columns=[],
+        )
+        test_session.add(dataset)
+        test_session.commit()
+
+        repo = UploadLogRepository(test_session)
+        created = repo.create_many(
+            [
+                UploadLog(dataset_id=dataset.id, filename=f"batch_{i}.csv", file_type="CSV", row_count=i)
+                for i in range(5)
+            ]
+        )
+
+        assert all(log.id is not None for log in created)
+        assert len(repo.get_by_dataset_id(dataset.id)) == 5
+
+        streamed = list(repo.iter_by_dataset_id(dataset.id, batch=2))
+        assert sorted(log.filename for log in streamed) == [f"batch_{i}.csv" for i in range(5)]
+        assert all(log.dataset.id == dataset.id for log in streamed)
+
     def test_check_duplicate_filename(self, test_session):
         """Test checking for duplicate filename."""
         # Create dataset
@@ -210,6 +380,65 @@ class TestUploadLogRepository:
         not_duplicate = repo.check_duplicate_filename(dataset.id, "new_file.csv")
         assert not_duplicate is None
 
+    def test_bulk_copy_upload_logs(self, test_session):
+        """Test bulk inserting upload logs (executemany path on SQLite)."""
+        dataset = DatasetConfig(
+            name="Test Dataset",
+            slot_number=1,
+            table_name="test_table",
+            columns_config={"name": {"type": "TEXT"}},
+            duplicate_filter_column="name",
+            image_columns=[],
+        )
+        test_session.add(dataset)
+        test_session.commit()
+
+        rows = [
+            {
+                "dataset_id": dataset.id,
+                "filename": f"file_{i}.csv",
+                "file_type": "CSV",
+                "row_count": i,
+            }
+            for i in range(150)
+        ]
+        inserted = UploadLog.bulk_copy(test_session, rows)
+        test_session.commit()
+
+        assert inserted == 150
+        logs = UploadLogRepository(test_session).get_by_dataset_id(dataset.id)
+        assert len(logs) == 150
+        assert all(log.upload_date is not None for log in logs)
+
+    def test_bulk_delete_for_dataset(self, test_session):
+        """Test deleting all upload logs for a dataset in one statement."""
+        datasets = [
+            DatasetConfig(
+                name=f"Dataset {i}", slot_number=i, table_name=f"table_{i}", columns_config={}
+            )
+            for i in (1, 2)
+        ]
+        test_session.add_all(datasets)
+        test_session.commit()
+
+        UploadLog.bulk_copy(
+            test_session,
+            [
+                {"dataset_id": d.id, "filename": f"{d.id}_{i}.csv", "file_type": "CSV", "row_count": i}
+                for d in datasets
+                for i in range(3)
+            ],
+        )
+        test_session.commit()
+
+        deleted = UploadLog.bulk_delete_for_dataset(test_session, datasets[0].id)
+        test_session.commit()
+
+        assert deleted == 3
+        repo = UploadLogRepository(test_session)
+        assert repo.get_by_dataset_id(datasets[0].id) == []
+        assert len(repo.get_by_dataset_id(datasets[1].id)) == 3
+
 
 class TestUserProfileRepository:
     """Test UserProfileRepository."""
@@ -261,3 +490,78 @@ class TestUserProfileRepository:
 
         assert updated.name == "Updated Name"
 
+
+
+class TestDataAnalysisLoading:
+    """Test eager loading of DataAnalysis relationships."""
+
+    def test_list_with_sources_loads_datasets(self, test_session):
+        """Test that list_with_sources populates source/secondary datasets."""
+        source = DatasetConfig(
+            name="Source", slot_number=1, table_name="source_table", columns_config={}
+        )
+        secondary = DatasetConfig(
+            name="Secondary", slot_number=2, table_name="secondary_table", columns_config={}
+        )
+        test_session.add_all([source, secondary])
+        test_session.commit()
+
+        test_session.add(
+            DataAnalysis(
+                name="Merge",
+                operation_type="merge",
+                source_dataset_id=source.id,
+                secondary_dataset_id=secondary.id,
+                operation_config={},
+                result_file_path="merge.parquet",
+            )
+        )
+        test_session.commit()
+        test_session.expunge_all()
+
+        with count_queries(test_session.get_bind()) as queries:
+            analyses = list_with_sources(test_session)
+
+        # Analyses, one IN (...) load per dataset relationship and the datasets'
+        # selectin upload logs; the count does not grow with the number of rows
+        assert len(queries) == 5
+        assert len(analyses) == 1
+        assert analyses[0].source_dataset.name == "Source"
+        assert analyses[0].secondary_dataset.name == "Secondary"
+
+
+class TestEnrichedDatasetRepository:
+    """Test EnrichedDatasetRepository listings."""
+
+    def test_get_all_summaries_includes_source_name(self, test_session):
+        """Test that summaries carry the source dataset name from the same query."""
+        source = DatasetConfig(
+            name="Source", slot_number=1, table_name="source_table", columns_config={}
+        )
+        other = DatasetConfig(name="Other", slot_number=2, table_name="other_table", columns_config={})
+        test_session.add_all([source, other])
+        test_session.commit()
+        test_session.add_all(
+            [
+                EnrichedDataset(
+                    name=f"Enriched {dataset.name}",
+                    source_dataset_id=dataset.id,
+                    enriched_table_name=f"enriched_{dataset.table_name}",
+                    source_table_name=dataset.table_name,
+                    enrichment_config={},
+                    columns_added=[],
+                )
+                for dataset in (source, other)
+            ]
+        )
+        test_session.commit()
+        source_id = source.id
+
+        repo = EnrichedDatasetRepository(test_session)
+        with count_queries(test_session.get_bind()) as queries:
+            summaries = repo.get_all_summaries()
+            filtered = repo.get_all_summaries(source_dataset_id=source_id)
+
+        assert len(queries) == 2
+        assert sorted(s.source_name for s in summaries) == ["Other", "Source"]
+        assert [(s.name, s.source_name) for s in filtered] == [("Enriched Source", "Source")]
@@ -20,6 +20,7 @@ from src.services.analysis_service import (
     execute_pivot,
     get_all_analyses,
     load_analysis_result,
+    load_dataset_sample,
     load_filtered_dataset,
     refresh_analysis,
     save_analysis_result,
@@ -51,6 +52,12 @@ class TestDetectDateColumns:
         date_cols = detect_date_columns(df)
         assert "created_date" in date_cols
 
+    def test_detect_date_columns_empty_frame(self):
+        """Test that an empty sample yields no date columns."""
+        df = pd.DataFrame({"created_date": [], "name": []})
+        
+        assert detect_date_columns(df) == []
+
 
 class TestExecuteGroupBy:
     """Test GroupBy operation execution."""
@@ -192,6 +199,55 @@ class TestParquetOperations:
         
         assert len(loaded_df) == len(df)
         assert list(loaded_df.columns) == list(df.columns)
+    
+    def test_load_analysis_result_uses_arrow_strings(self, tmp_path):
+        """Test that text columns load as Arrow-backed strings."""
+        df = pd.DataFrame({"name": ["a", "b", None], "count": [1, 2, 3]}, dtype=object)
+        df["count"] = df["count"].astype("int64")
+        
+        file_path = save_analysis_result(df, 998)
+        loaded_df = load_analysis_result(str(file_path))
+        
+        assert isinstance(loaded_df["name"].dtype, pd.StringDtype)
+        assert loaded_df["name"].dtype.storage.startswith("pyarrow")
+        assert loaded_df["name"].tolist()[:2] == ["a", "b"]
+        assert loaded_df["count"].dtype == "int64"
+
+
+class TestLoadDatasetSample:
+    """Test loading a dataset sample."""
+
+    def test_load_dataset_sample_limits_rows(self, test_session, tmp_path):
+        """Test that only the first rows are loaded, with all columns."""
+        from src.services.dataset_service import initialize_dataset, upload_csv_to_dataset
+        
+        columns_config = {
+            "category": {"type": "TEXT", "is_image": False},
+            "amount": {"type": "INTEGER", "is_image": False},
+        }
+        
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Test Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("category,amount\nA,100\nA,200\nB,300", encoding="utf-8")
+        
+        upload_csv_to_dataset(
+            session=test_session,
+            dataset_id=dataset.id,
+            csv_file=csv_file,
+            filename="test.csv",
+        )
+        
+        df = load_dataset_sample(test_session, dataset.id, limit=2)
+        
+        assert list(df["category"]) == ["A", "A"]
+        assert "amount" in df.columns
 
 
 class TestAnalysisCRUD:
@@ -3,6 +3,8 @@ Unit tests for DataFrame service.
 
 Tests DataFrame loading, filtering, and column operations for datasets and enriched datasets.
 """
+from datetime import datetime
+
 import pandas as pd
 import pytest
 
@@ -11,6 +13,8 @@ pytestmark = pytest.mark.unit
 from src.database.models import EnrichedDataset
 from src.services.dataset_service import initialize_dataset
 from src.services.dataframe_service import (
+    convert_to_arrow_strings,
+    detect_date_columns,
     get_dataset_columns,
     get_dataset_row_count,
     get_enriched_dataset_columns,
@@ -18,7 +22,7 @@ from src.services.dataframe_service import (
     load_dataset_dataframe,
     load_enriched_dataset_dataframe,
 )
-from src.utils.errors import ValidationError
+from src.utils.errors import DatabaseError, ValidationError
 
 
 class TestLoadDatasetDataframe:
@@ -55,6 +59,10 @@ class TestLoadDatasetDataframe:
         assert len(df) == 2
         assert "name" in df.columns
         assert "age" in df.columns
+        # Text columns are Arrow-backed strings rather than Python objects
+        pytest.importorskip("pyarrow")
+        assert df["name"].dtype != object
+        assert pd.api.types.is_string_dtype(df["name"])
 
     def test_load_dataset_dataframe_with_limit(self, test_session, tmp_path):
         """Test loading with row limit."""
@@ -191,6 +199,97 @@ class TestLoadDatasetDataframe:
         # Should still have correct columns
         assert "name" in df.columns
 
+    def test_load_dataset_dataframe_with_date_range(self, test_session, tmp_path):
+        """Test the date range is applied in SQL, keeping unparseable values."""
+        columns_config = {"name": {"type": "TEXT", "is_image": False}, "created": {"type": "TEXT", "is_image": False}}
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Test Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "name,created\n"
+            "old,2023-01-15 10:00:00\n"
+            "inside,2024-03-01\n"
+            "late,2025-06-30T12:00:00\n"
+            "us_format,03/15/2024\n",
+            encoding="utf-8",
+        )
+        from src.services.dataset_service import upload_csv_to_dataset
+        upload_csv_to_dataset(
+            session=test_session,
+            dataset_id=dataset.id,
+            csv_file=csv_file,
+            filename="test.csv"
+        )
+        
+        df = load_dataset_dataframe(
+            session=test_session,
+            dataset_id=dataset.id,
+            date_column="created",
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 12, 31, 23, 59, 59),
+        )
+        
+        # Values SQLite cannot parse are left for the pandas refinement
+        assert sorted(df["name"]) == ["inside", "us_format"]
+
+    def test_load_dataset_dataframe_with_search_term(self, test_session, tmp_path):
+        """Test the search term is applied in SQL before the row limit."""
+        columns_config = {"name": {"type": "TEXT", "is_image": False}}
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Test Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("name\nAlpha\n50% off\nbeta\nALPHABET\ngamma\n", encoding="utf-8")
+        from src.services.dataset_service import upload_csv_to_dataset
+        upload_csv_to_dataset(
+            session=test_session,
+            dataset_id=dataset.id,
+            csv_file=csv_file,
+            filename="test.csv"
+        )
+        
+        df = load_dataset_dataframe(
+            session=test_session,
+            dataset_id=dataset.id,
+            limit=2,
+            search_term="alpha",
+        )
+        assert sorted(df["name"]) == ["ALPHABET", "Alpha"]
+        
+        # LIKE wildcards in the term match literally
+        df = load_dataset_dataframe(session=test_session, dataset_id=dataset.id, search_term="0%")
+        assert list(df["name"]) == ["50% off"]
+
+    def test_load_dataset_dataframe_date_column_not_loaded(self, test_session):
+        """Test filtering on a column that is not loaded raises DatabaseError."""
+        columns_config = {"name": {"type": "TEXT", "is_image": False}}
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Test Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        with pytest.raises(DatabaseError):
+            load_dataset_dataframe(
+                session=test_session,
+                dataset_id=dataset.id,
+                date_column="missing",
+                start_date=datetime(2024, 1, 1),
+            )
+
 
 class TestGetDatasetRowCount:
     """Test getting dataset row count."""
@@ -317,3 +416,50 @@ class TestGetEnrichedDatasetColumns:
         )
         assert columns == []
 
+
+class TestDetectDateColumns:
+    """Test date column detection."""
+
+    def test_detects_by_dtype_and_by_name_with_parseable_sample(self):
+        """Test datetime dtypes and date-named columns whose first value parses."""
+        df = pd.DataFrame(
+            {
+                "name": ["2024-01-01", "2024-01-02"],  # Parses, but name does not suggest a date
+                "created_at": [None, "2024-03-01"],  # First non-null value is used
+                "update_time": ["soon", "later"],
+                "loaded": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "Date": ["01/02/2024", "bad"],
+            }
+        )
+
+        assert detect_date_columns(df) == ["created_at", "loaded", "Date"]
+
+    def test_no_candidates(self):
+        """Test a frame without date-like columns."""
+        assert detect_date_columns(pd.DataFrame({"name": ["a"], "date": [None]})) == []
+
+
+class TestConvertToArrowStrings:
+    """Test explicit conversion of text columns to Arrow-backed strings."""
+
+    def test_converts_only_string_columns(self):
+        """Test that text columns convert while mixed and numeric columns don't."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame(
+            {"name": ["a", None], "mixed": [1, "a"], "count": [1, 2]}
+        ).astype({"name": object})
+
+        result = convert_to_arrow_strings(df)
+
+        assert isinstance(result["name"].dtype, pd.StringDtype)
+        assert result["name"].dtype.storage.startswith("pyarrow")
+        assert result["mixed"].dtype == object
+        assert result["count"].dtype == df["count"].dtype
+
+    def test_leaves_global_options_alone(self):
+        """Test that the process-wide future.infer_string option is never changed."""
+        before = pd.get_option("future.infer_string")
+
+        convert_to_arrow_strings(pd.DataFrame({"name": ["a", "b"]}).astype(object))
+
+        assert pd.get_option("future.infer_string") == before
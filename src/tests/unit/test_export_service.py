@@ -9,6 +9,7 @@ import pandas as pd
 import pytest
 
 from src.services.export_service import (
+    dataframe_to_csv_bytes,
     export_dataset_to_csv,
     export_dataset_to_pickle,
     filter_by_date_range,
@@ -112,6 +113,17 @@ class TestFilterByDateRange:
 
         assert len(filtered) == len(df)
 
+    def test_filter_leaves_input_unchanged(self):
+        """Test that the input frame is not modified, so callers can pass it uncopied."""
+        df = pd.DataFrame({"name": ["John", "Jane"], "upload_date": ["2024-01-01", "2024-02-01"]})
+        original = df.copy()
+
+        filtered = filter_by_date_range(df, "upload_date", datetime(2024, 1, 15), None)
+
+        assert list(filtered["name"]) == ["Jane"]
+        pd.testing.assert_frame_equal(df, original)
+        assert pd.api.types.is_datetime64_any_dtype(filtered["upload_date"])
+
 
 class TestExportDatasetToCSV:
     """Test CSV export functionality."""
@@ -128,6 +140,38 @@ class TestExportDatasetToCSV:
         pass
 
 
+class TestDataframeToCsvBytes:
+    """Test in-memory CSV serialization."""
+
+    def test_round_trips_through_read_csv(self):
+        """Test that the CSV bytes read back to the same data."""
+        import io
+
+        df = pd.DataFrame({"name": ["Alice", "Smith, Bob", ""], "city": ["NYC", 'Say "hi"', "LA"]})
+
+        data = dataframe_to_csv_bytes(df)
+
+        assert isinstance(data, bytes)
+        result = pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False)
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_mixed_object_column_falls_back(self):
+        """Test that columns Arrow cannot convert are still written."""
+        df = pd.DataFrame({"mixed": [1, "a"]})
+
+        assert dataframe_to_csv_bytes(df).decode("utf-8").split() == ["mixed", "1", "a"]
+
+    def test_datetime_and_bool_columns_match_pandas(self):
+        """Test that datetime and bool columns are written as pandas writes them."""
+        df = pd.DataFrame({
+            "name": ["Alice", "Bob"],
+            "date": pd.to_datetime(["2024-03-01", "2024-03-02"]),
+            "active": [True, False],
+        })
+
+        assert dataframe_to_csv_bytes(df) == df.to_csv(index=False).encode("utf-8")
+
+
 class TestExportDatasetToPickle:
     """Test Pickle export functionality."""
 
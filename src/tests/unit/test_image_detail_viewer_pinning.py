@@ -119,7 +119,7 @@ class TestPinningLogic:
         
         # Pre-populate pinned set
         pinned_set_key = f"pinned_details_{sample_table_info['type']}_{sample_table_info['id']}"
-        mock_session_state[pinned_set_key] = [0]  # Row 0 is pinned
+        mock_session_state[pinned_set_key] = {0}  # Row 0 is pinned
         
         # Pre-populate pinned row data cache
         pinned_data_key = f"pinned_row_data_{sample_table_info['type']}_{sample_table_info['id']}_0"
@@ -6,10 +6,12 @@ Following TDD: Tests written first (RED phase).
 import pytest
 
 from src.database.models import UserProfile
+from src.services import profile_service
 from src.services.profile_service import (
     create_user_profile,
     get_current_profile,
     is_app_initialized,
+    is_app_initialized_cached,
 )
 from src.utils.errors import ValidationError
 
@@ -62,6 +64,19 @@ class TestIsAppInitialized:
 
         assert is_app_initialized(test_session) is True
 
+    def test_cached_check_remembers_initialized(self, test_session, monkeypatch):
+        """Test that a positive check is kept in session state and only negatives re-query."""
+        session_state = {}
+        monkeypatch.setattr(profile_service.st, "session_state", session_state)
+
+        assert is_app_initialized_cached(test_session) is False
+        assert "app_initialized" not in session_state
+
+        create_user_profile(session=test_session, name="Test User")
+
+        assert is_app_initialized_cached(test_session) is True
+        assert session_state["app_initialized"] is True
+
 
 class TestGetCurrentProfile:
     """Test getting current profile."""
@@ -217,6 +217,35 @@ class TestSearchKnowledgeBasePresence:
         table_ids = {kt["table_id"] for kt in results["presence"]["knowledge_tables"]}
         assert table1.id in table_ids
         assert table2.id in table_ids
+    
+    def test_search_skips_missing_table_without_hiding_others(self, test_session):
+        """Test a source whose table is gone is skipped while other sources still report."""
+        from sqlalchemy import text
+        
+        columns_config = {"phone": {"type": "TEXT", "is_image": False}}
+        
+        tables = [
+            initialize_knowledge_table(
+                session=test_session,
+                name=f"Table {i}",
+                data_type="phone_numbers",
+                primary_key_column="phone",
+                columns_config=columns_config,
+                image_columns=[],
+                initial_data_df=pd.DataFrame({"phone": ["+1234567890"]}),
+            )
+            for i in range(3)
+        ]
+        test_session.execute(text(f'DROP TABLE "{tables[1].table_name}"'))
+        
+        results = search_knowledge_base(
+            test_session,
+            "+1234567890",
+            "phone_numbers",
+        )
+        
+        found = {kt["table_id"]: kt["row_count"] for kt in results["presence"]["knowledge_tables"]}
+        assert found == {tables[0].id: 1, tables[2].id: 1}
 
 
 class TestGetKnowledgeTableDataForKey:
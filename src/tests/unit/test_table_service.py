@@ -17,7 +17,10 @@ from src.services.table_service import (
     copy_table_structure,
     create_index_on_column,
     get_new_rows_since_sync,
+    get_table_column_names,
+    get_table_max_rowid,
     get_table_row_count,
+    get_table_row_counts,
     insert_dataframe_to_table,
     update_enriched_column_values,
 )
@@ -310,6 +313,80 @@ class TestGetTableRowCount:
         
         count = get_table_row_count(test_session, dataset.table_name)
         assert count == 3
+        assert get_table_max_rowid(test_session, dataset.table_name) == 3
+
+    def test_get_table_row_counts(self, test_session, tmp_path):
+        """Test counting several tables at once, including a missing one."""
+        columns_config = {"name": {"type": "TEXT", "is_image": False}}
+        first = initialize_dataset(
+            session=test_session,
+            name="First Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        second = initialize_dataset(
+            session=test_session,
+            name="Second Dataset",
+            slot_number=2,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("name\nA\nB", encoding="utf-8")
+        from src.services.dataset_service import upload_csv_to_dataset
+        upload_csv_to_dataset(
+            session=test_session,
+            dataset_id=first.id,
+            csv_file=csv_file,
+            filename="test.csv"
+        )
+        
+        counts = get_table_row_counts(test_session, [first.table_name, second.table_name])
+        assert counts == {first.table_name: 2, second.table_name: 0}
+        
+        counts = get_table_row_counts(test_session, [first.table_name, "no_such_table"])
+        assert counts == {first.table_name: 2, "no_such_table": 0}
+        
+        assert get_table_row_counts(test_session, []) == {}
+
+    def test_get_table_max_rowid_empty_or_missing(self, test_session):
+        """Test that an empty or missing table has max rowid zero."""
+        columns_config = {"name": {"type": "TEXT", "is_image": False}}
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Test Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+        
+        assert get_table_max_rowid(test_session, dataset.table_name) == 0
+        assert get_table_max_rowid(test_session, "no_such_table") == 0
+
+    def test_get_table_row_count_missing_table(self, test_session):
+        """Test that a missing table counts as zero rows."""
+        assert get_table_row_count(test_session, "no_such_table") == 0
+
+    def test_get_table_column_names(self, test_session):
+        """Test listing a table's columns in definition order."""
+        columns_config = {
+            "name": {"type": "TEXT", "is_image": False},
+            "age": {"type": "INTEGER", "is_image": False},
+        }
+        dataset = initialize_dataset(
+            session=test_session,
+            name="Test Dataset",
+            slot_number=1,
+            columns_config=columns_config,
+            image_columns=[],
+        )
+
+        columns = get_table_column_names(test_session, dataset.table_name)
+
+        assert [c for c in columns if c in columns_config] == ["name", "age"]
+        assert get_table_column_names(test_session, "no_such_table") == []
 
 
 class TestGetNewRowsSinceSync:
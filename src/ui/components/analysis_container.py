@@ -130,7 +130,7 @@ def render_analysis_container(
                     except Exception:
                         st.metric("Numeric Columns", len(numeric_cols))
                 else:
-                    st.metric("Text Columns", len(result_df.select_dtypes(include=["object"]).columns))
+                    st.metric("Text Columns", len(result_df.select_dtypes(include=["object", "string"]).columns))
             
             # Visualization
             if analysis.visualization_config:
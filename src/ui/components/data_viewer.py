@@ -43,7 +43,7 @@ def render_data_viewer(
     if search_term:
         # Search across all string columns
         mask = pd.Series([False] * len(display_df))
-        for col in display_df.select_dtypes(include=["object"]).columns:
+        for col in display_df.select_dtypes(include=["object", "string"]).columns:
             mask |= display_df[col].astype(str).str.contains(search_term, case=False, na=False)
         display_df = display_df[mask]
         st.info(f"Found {len(display_df)} rows matching '{search_term}'")
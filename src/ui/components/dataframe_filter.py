@@ -3,9 +3,36 @@ Advanced DataFrame filtering component for CSV Wrangler v1.1.
 
 Provides UI for filtering and searching DataFrames.
 """
+import re
+from typing import Optional
+
 import streamlit as st
 import pandas as pd
 
+# Characters that make the pandas search (str.contains) match as a regex
+_REGEX_METACHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def get_sql_search_term(key_prefix: str = "filter") -> Optional[str]:
+    """
+    Get the current global search term if it can also be applied in SQL.
+    
+    The term is read from session state, so a caller can pass it to the
+    loader before rendering the filter UI. Only plain ASCII terms are
+    returned: SQL LIKE matches them literally and ignores ASCII case, so
+    the loaded rows are a superset of what the pandas search keeps.
+    
+    Args:
+        key_prefix: Prefix for session state keys (as passed to render_dataframe_filter_ui)
+        
+    Returns:
+        Search term, or None if there is none or it must be matched in pandas only
+    """
+    search_term = st.session_state.get(f"{key_prefix}_search")
+    if not search_term or not search_term.isascii() or _REGEX_METACHARACTERS.search(search_term):
+        return None
+    return search_term
+
 
 def render_dataframe_filter_ui(
     df: pd.DataFrame,
@@ -26,7 +53,8 @@ def render_dataframe_filter_ui(
     
     st.subheader("🔍 Advanced Filtering")
     
-    filtered_df = df.copy()
+    # Only boolean indexing below, which builds new frames, so df needs no copy
+    filtered_df = df
     
     # Global search
     search_key = f"{key_prefix}_search"
@@ -39,7 +67,7 @@ def render_dataframe_filter_ui(
     if search_term:
         # Search across all string columns
         mask = pd.Series([False] * len(filtered_df))
-        for col in filtered_df.select_dtypes(include=["object"]).columns:
+        for col in filtered_df.select_dtypes(include=["object", "string"]).columns:
             mask |= filtered_df[col].astype(str).str.contains(
                 search_term, case=False, na=False
             )
@@ -49,7 +77,7 @@ def render_dataframe_filter_ui(
     # Column-specific filters
     with st.expander("Column Filters", expanded=False):
         numeric_columns = list(filtered_df.select_dtypes(include=["number"]).columns)
-        text_columns = list(filtered_df.select_dtypes(include=["object"]).columns)
+        text_columns = list(filtered_df.select_dtypes(include=["object", "string"]).columns)
         
         if numeric_columns or text_columns:
             filter_col1, filter_col2 = st.columns(2)
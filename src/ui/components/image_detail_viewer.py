@@ -61,16 +61,12 @@ def render_image_detail_viewer(
         with pin_col1:
             if is_pinned:
                 if st.button("📌 Unpin", key=f"unpin_{detail_key}", help="Unpin this detail viewer"):
-                    # Remove from pinned list
+                    # Remove from pinned set
                     pinned_set_key = f"pinned_details_{table_info['type']}_{table_info['id']}"
-                    if pinned_set_key in st.session_state:
-                        pinned_list = list(st.session_state[pinned_set_key])
-                        if row_index in pinned_list:
-                            pinned_list.remove(row_index)
-                        if len(pinned_list) == 0:
-                            del st.session_state[pinned_set_key]
-                        else:
-                            st.session_state[pinned_set_key] = pinned_list
+                    pinned_set = st.session_state.get(pinned_set_key, set())
+                    pinned_set.discard(row_index)
+                    if not pinned_set:
+                        st.session_state.pop(pinned_set_key, None)
                     # Clear pinned row data cache
                     pinned_data_key = f"pinned_row_data_{table_info['type']}_{table_info['id']}_{row_index}"
                     if pinned_data_key in st.session_state:
@@ -78,14 +74,9 @@ def render_image_detail_viewer(
                     st.rerun()
             else:
                 if st.button("📌 Pin", key=f"pin_{detail_key}", help="Pin this detail viewer to keep it visible"):
-                    # Add to pinned set (use list for JSON serialization compatibility)
+                    # Add to pinned set
                     pinned_set_key = f"pinned_details_{table_info['type']}_{table_info['id']}"
-                    if pinned_set_key not in st.session_state:
-                        st.session_state[pinned_set_key] = []
-                    pinned_list = list(st.session_state[pinned_set_key])
-                    if row_index not in pinned_list:
-                        pinned_list.append(row_index)
-                        st.session_state[pinned_set_key] = pinned_list
+                    st.session_state.setdefault(pinned_set_key, set()).add(row_index)
                     # Cache the row data for pinned display
                     pinned_data_key = f"pinned_row_data_{table_info['type']}_{table_info['id']}_{row_index}"
                     st.session_state[pinned_data_key] = row_data.to_dict()
@@ -6,11 +6,11 @@ Provides uniform sidebar across all pages with username, version, and notes.
 import streamlit as st
 
 from src.database.connection import get_session
-from src.services.profile_service import get_current_profile
+from src.services.profile_service import get_profile_summary
 from src.services.note_service import (
     create_note,
     delete_note,
-    get_all_notes,
+    get_note_summaries,
 )
 from src.__version__ import __version__
 
@@ -22,12 +22,12 @@ def render_sidebar() -> None:
     This should be called at the start of each page.
     """
     with get_session() as session:
-        # Get user profile
-        profile = get_current_profile(session)
+        # Get user profile (cached across reruns)
+        profile = get_profile_summary()
         
         # Username display
         if profile:
-            st.sidebar.success(f"👤 {profile.name}")
+            st.sidebar.success(f"👤 {profile['name']}")
         else:
             st.sidebar.info("👤 No profile")
         
@@ -56,22 +56,22 @@ def render_sidebar() -> None:
         
         st.sidebar.markdown("---")
         
-        # Display existing notes
-        notes = get_all_notes(session)
+        # Display existing notes (cached across reruns)
+        notes = get_note_summaries()
         
         if notes:
             st.sidebar.markdown("**Your Notes:**")
             for note in notes:
                 # Note content in expandable
                 with st.sidebar.expander(
-                    f"📄 {note.content[:50]}{'...' if len(note.content) > 50 else ''}",
+                    f"📄 {note['content'][:50]}{'...' if len(note['content']) > 50 else ''}",
                     expanded=False
                 ):
-                    st.text(note.content)
-                    st.caption(f"Created: {note.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+                    st.text(note["content"])
+                    st.caption(f"Created: {note['created_at'].strftime('%Y-%m-%d %H:%M:%S')}")
                     
                     # Delete button with confirmation - subtle, inside expander
-                    confirm_key = f"confirm_delete_{note.id}"
+                    confirm_key = f"confirm_delete_{note['id']}"
                     
                     st.markdown("---")
                     
@@ -79,7 +79,7 @@ def render_sidebar() -> None:
                         # Show small delete button
                         if st.button(
                             "🗑️ Delete",
-                            key=f"delete_note_{note.id}",
+                            key=f"delete_note_{note['id']}",
                             use_container_width=False,
                             type="secondary",
                         ):
@@ -92,12 +92,12 @@ def render_sidebar() -> None:
                         with col1:
                             if st.button(
                                 "Yes",
-                                key=f"confirm_yes_{note.id}",
+                                key=f"confirm_yes_{note['id']}",
                                 use_container_width=True,
                                 type="primary",
                             ):
                                 try:
-                                    delete_note(session, note.id)
+                                    delete_note(session, note["id"])
                                     del st.session_state[confirm_key]
                                     st.rerun()
                                 except Exception as e:
@@ -105,7 +105,7 @@ def render_sidebar() -> None:
                         with col2:
                             if st.button(
                                 "Cancel",
-                                key=f"confirm_no_{note.id}",
+                                key=f"confirm_no_{note['id']}",
                                 use_container_width=True,
                                 type="secondary",
                             ):
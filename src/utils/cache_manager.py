@@ -62,6 +62,76 @@ def invalidate_enriched_dataset_cache(enriched_dataset_id: int) -> None:
         logger.warning(f"Failed to invalidate cache for enriched dataset {enriched_dataset_id}: {e}")
 
 
+def invalidate_profile_cache() -> None:
+    """
+    Invalidate the cached user profile summary and initialization flag.
+    
+    Call after the profile is created or updated so the next rerun reads it
+    from the database again.
+    """
+    try:
+        import streamlit as st
+        from src.services.profile_service import get_profile_summary
+        
+        get_profile_summary.clear()
+        st.session_state.pop("app_initialized", None)
+        
+        logger.debug("Invalidated user profile cache")
+        
+    except ImportError:
+        logger.debug("Streamlit not available, skipping cache invalidation")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate profile cache: {e}")
+
+
+def invalidate_note_cache() -> None:
+    """
+    Invalidate the cached sidebar notes.
+    
+    Call after a note is created or deleted.
+    """
+    try:
+        from src.services.note_service import get_note_summaries
+        
+        get_note_summaries.clear()
+        
+        logger.debug("Invalidated note cache")
+        
+    except ImportError:
+        logger.debug("Streamlit not available, skipping cache invalidation")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate note cache: {e}")
+
+
+def invalidate_listing_cache() -> None:
+    """
+    Invalidate the cached dataset and enriched dataset listings, table columns
+    and image table listing.
+    
+    Call after a dataset or enriched dataset is created or deleted.
+    """
+    try:
+        from src.services.cached_listings import (
+            list_datasets,
+            list_enriched_datasets,
+            list_table_columns,
+            list_tables_with_image_columns,
+        )
+        
+        list_datasets.clear()
+        list_enriched_datasets.clear()
+        # A recreated table may reuse the name with different columns
+        list_table_columns.clear()
+        list_tables_with_image_columns.clear()
+        
+        logger.debug("Invalidated dataset listing cache")
+        
+    except ImportError:
+        logger.debug("Streamlit not available, skipping cache invalidation")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate listing cache: {e}")
+
+
 def get_cache_version(dataset_id: Optional[int] = None, enriched_dataset_id: Optional[int] = None) -> int:
     """
     Get current cache version for a dataset.
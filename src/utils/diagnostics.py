@@ -94,11 +94,15 @@ def get_full_diagnostics() -> dict[str, Any]:
     Returns:
         Dictionary with complete diagnostics information
     """
+    # Imported here to keep this module free of database imports at load time
+    from src.database.connection import get_pool_status
+
     return {
         "system": get_system_info(),
         "packages": get_package_status_report(),
         "environment": get_environment_info(),
         "missing_optional": get_missing_optional_packages(),
+        "database_pool": get_pool_status(),
     }
 
 
@@ -151,6 +155,14 @@ def format_diagnostics_for_display(diagnostics: Optional[dict[str, Any]] = None)
     lines.append(f"- Userdata Writable: {'✅' if env_info['userdata_writable'] else '❌'}")
     lines.append("")
 
+    # Database connection pool (empty until the engine is created)
+    pool_info = diagnostics.get("database_pool")
+    if pool_info:
+        lines.append("## Database Connection Pool")
+        for key, value in pool_info.items():
+            lines.append(f"- {key.replace('_', ' ').title()}: {value}")
+        lines.append("")
+
     return "\n".join(lines)
 
 
@@ -65,7 +65,7 @@ class PackageAvailability:
 
     def get_missing_packages(self) -> list[str]:
         """Get list of commonly expected but missing packages."""
-        optional_packages = ["plotly", "pyarrow", "dateutil"]
+        optional_packages = ["plotly", "pyarrow", "dateutil", "orjson", "ormsgpack"]
         return [pkg for pkg in optional_packages if not self.is_available(pkg)]
 
 
@@ -127,6 +127,16 @@ def has_dateutil() -> bool:
     return is_package_available("dateutil")
 
 
+def has_orjson() -> bool:
+    """Check if orjson is available for fast JSON decoding."""
+    return is_package_available("orjson")
+
+
+def has_ormsgpack() -> bool:
+    """Check if ormsgpack is available for compact binary config storage."""
+    return is_package_available("ormsgpack")
+
+
 def get_package_status_report() -> dict[str, dict[str, Any]]:
     """
     Get status report of all packages.
@@ -136,7 +146,7 @@ def get_package_status_report() -> dict[str, dict[str, Any]]:
     """
     packages = {
         "required": ["streamlit", "pandas", "sqlalchemy"],
-        "optional": ["plotly", "pyarrow", "dateutil"],
+        "optional": ["plotly", "pyarrow", "dateutil", "orjson", "ormsgpack"],
     }
 
     report = {}